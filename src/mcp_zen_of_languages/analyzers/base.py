@@ -47,12 +47,14 @@ import os
 from abc import ABC
 from abc import abstractmethod
 from enum import StrEnum
+from typing import ClassVar
 from typing import Literal
 from typing import TypeVar
 
 from pydantic import BaseModel
 from pydantic import ConfigDict
 from pydantic import Field
+from pydantic import PrivateAttr
 
 from mcp_zen_of_languages.languages.configs import DetectorConfig
 from mcp_zen_of_languages.models import AnalysisResult
@@ -279,6 +281,8 @@ class AnalysisContext(BaseModel):
             cross-file detectors (e.g. duplicate-code).
         repository_imports: Per-file import index built from the wider
             repository, enabling coupling analysis.
+        lines: Source lines of ``code``, split on first access and shared
+            by every line-based detector until ``code`` changes.
 
     See Also:
         [`BaseAnalyzer.analyze`][mcp_zen_of_languages.analyzers.base.BaseAnalyzer.analyze]:
@@ -314,6 +318,25 @@ class AnalysisContext(BaseModel):
 
     model_config = ConfigDict(arbitrary_types_allowed=True)
 
+    _lines_cache: tuple[str, tuple[str, ...]] | None = PrivateAttr(default=None)
+
+    @property
+    def lines(self) -> tuple[str, ...]:
+        """Return ``code`` split into lines, memoised against the current ``code``.
+
+        The split is cached together with the ``code`` string it came from,
+        so reassigning ``code`` or ``model_copy(update={"code": ...})``
+        yields fresh lines instead of a stale cache.
+
+        Returns:
+            tuple[str, ...]: Lines as produced by ``str.splitlines()``.
+        """
+        cached = self._lines_cache
+        if cached is None or cached[0] is not self.code:
+            cached = (self.code, tuple(self.code.splitlines()))
+            self._lines_cache = cached
+        return cached[1]
+
 
 # ============================================================================
 # Detector Interface (Strategy Pattern)
@@ -350,6 +373,9 @@ class ViolationDetector[ConfigT: "DetectorConfig"](ABC):
             builder. Contains thresholds, severity, and violation
             message templates.
         rule_ids: Zen rule identifiers this detector is responsible for.
+        skips_blank_source: When ``True``, the pipeline does not call
+            ``detect()`` for blank source text. Only set it on detectors
+            that cannot report anything without source to inspect.
 
     See Also:
         [`DetectionPipeline`][mcp_zen_of_languages.analyzers.base.DetectionPipeline]:
@@ -362,6 +388,7 @@ class ViolationDetector[ConfigT: "DetectorConfig"](ABC):
 
     config: ConfigT | None = None
     rule_ids: list[str]
+    skips_blank_source: ClassVar[bool] = False
 
     def __init__(self) -> None:
         """Initialize the detector with an empty rule-ID list.
@@ -685,7 +712,8 @@ class DetectionPipeline:
 
         If a detector raises an exception, the error is printed and the
         pipeline continues with the next detector — no violations from
-        healthy detectors are lost.
+        healthy detectors are lost. Detectors that set
+        ``skips_blank_source`` are not run when the source is blank.
 
         Args:
             context (AnalysisContext): Shared analysis state populated by
@@ -699,8 +727,11 @@ class DetectionPipeline:
             executed successfully.
         """
         all_violations: list[Violation] = []
+        blank_source = not context.code.strip()
 
         for detector in self.detectors:
+            if blank_source and detector.skips_blank_source:
+                continue
             try:
                 detector_config = detector.config or config
                 detector_name = self._detector_name(detector)
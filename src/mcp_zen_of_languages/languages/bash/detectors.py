@@ -103,6 +103,8 @@ class BashQuoteVariablesDetector(
         splitting and globbing surprises.
     """
 
+    _VARIABLE_EXPANSION_RE = re.compile(r"\$\w+")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -133,8 +135,8 @@ class BashQuoteVariablesDetector(
                 location=Location(line=idx, column=1),
                 suggestion='Quote variable expansions like "$var".',
             )
-            for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\$\w+", line) and '"' not in line
+            for idx, line in enumerate(context.lines, start=1)
+            if self._VARIABLE_EXPANSION_RE.search(line) and '"' not in line
         ]
         return violations
 
@@ -186,7 +188,7 @@ class BashEvalUsageDetector(
                 location=Location(line=idx, column=line.find("eval") + 1),
                 suggestion="Avoid eval; use arrays or case statements instead.",
             )
-            for idx, line in enumerate(context.code.splitlines(), start=1)
+            for idx, line in enumerate(context.lines, start=1)
             if "eval" in line
         ]
         return violations
@@ -209,6 +211,8 @@ class BashDoubleBracketsDetector(
         quote all variables inside ``[ ]`` instead.
     """
 
+    _SINGLE_BRACKET_RE = re.compile(r"\[[^\\[]")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -239,8 +243,8 @@ class BashDoubleBracketsDetector(
                 location=Location(line=idx, column=1),
                 suggestion="Prefer [[ ]] over [ ] for conditionals.",
             )
-            for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\[[^\\[]", line) and "[[" not in line
+            for idx, line in enumerate(context.lines, start=1)
+            if self._SINGLE_BRACKET_RE.search(line) and "[[" not in line
         ]
         return violations
 
@@ -292,7 +296,7 @@ class BashCommandSubstitutionDetector(
                 location=Location(line=idx, column=line.find("`") + 1),
                 suggestion="Use $(...) instead of backticks.",
             )
-            for idx, line in enumerate(context.code.splitlines(), start=1)
+            for idx, line in enumerate(context.lines, start=1)
             if "`" in line
         ]
         return violations
@@ -315,6 +319,8 @@ class BashReadonlyConstantsDetector(
         constants truly immutable.
     """
 
+    _CONSTANT_ASSIGNMENT_RE = re.compile(r"^[A-Z][A-Z0-9_]*=")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -345,8 +351,8 @@ class BashReadonlyConstantsDetector(
                 location=Location(line=idx, column=1),
                 suggestion="Declare constants with readonly.",
             )
-            for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.match(r"^[A-Z][A-Z0-9_]*=", line) and "readonly" not in line
+            for idx, line in enumerate(context.lines, start=1)
+            if self._CONSTANT_ASSIGNMENT_RE.match(line) and "readonly" not in line
         ]
         return violations
 
@@ -368,6 +374,14 @@ class BashExitCodeChecksDetector(
         ``$?`` immediately after execution.
     """
 
+    _ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+    _FUNCTION_HEADER_RE = re.compile(r"^\w+\s*\(\)\s*\{")
+    _CONTROL_KEYWORD_RE = re.compile(
+        r"^(if|then|elif|else|fi|for|while|until|case|select|do|done)\b"
+    )
+    _RETURN_OR_EXIT_RE = re.compile(r"^(return|exit)\b")
+    _COMMAND_RE = re.compile(r"^[A-Za-z0-9_./-]+")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -392,32 +406,29 @@ class BashExitCodeChecksDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        lines = context.code.splitlines()
+        lines = context.lines
         for idx, line in enumerate(lines, start=1):
             stripped = line.strip()
             if not stripped or stripped.startswith("#"):
                 continue
-            if re.match(r"^[A-Za-z_][A-Za-z0-9_]*=", stripped):
+            if self._ASSIGNMENT_RE.match(stripped):
                 continue
             if stripped.startswith("export ") and "=" in stripped:
                 continue
-            if re.match(r"^\w+\s*\(\)\s*\{", stripped):
+            if self._FUNCTION_HEADER_RE.match(stripped):
                 continue
-            if re.match(
-                r"^(if|then|elif|else|fi|for|while|until|case|select|do|done)\b",
-                stripped,
-            ):
+            if self._CONTROL_KEYWORD_RE.match(stripped):
                 continue
             if stripped.startswith(("set ", "{", "}")):
                 continue
-            if re.match(r"^(return|exit)\b", stripped):
+            if self._RETURN_OR_EXIT_RE.match(stripped):
                 continue
             if "||" in stripped or "&&" in stripped or "$?" in stripped:
                 continue
             next_line = lines[idx] if idx < len(lines) else ""
             if "$?" in next_line:
                 continue
-            if re.match(r"^[A-Za-z0-9_./-]+", stripped):
+            if self._COMMAND_RE.match(stripped):
                 violations.append(
                     self.build_violation(
                         config,
@@ -445,6 +456,8 @@ class BashFunctionUsageDetector(ViolationDetector[Bash006Config], LocationHelper
         so each unit can be tested, logged, and reused independently.
     """
 
+    _FUNCTION_HEADER_RE = re.compile(r"^\s*(?:function\s+)?\w+\s*\(\)\s*\{")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -470,12 +483,10 @@ class BashFunctionUsageDetector(ViolationDetector[Bash006Config], LocationHelper
         """
         lines = [
             line
-            for line in context.code.splitlines()
+            for line in context.lines
             if line.strip() and not line.strip().startswith("#")
         ]
-        has_function = any(
-            re.match(r"^\s*(?:function\s+)?\w+\s*\(\)\s*\{", line) for line in lines
-        )
+        has_function = any(self._FUNCTION_HEADER_RE.match(line) for line in lines)
         max_len = config.max_script_length_without_functions or 50
         if not has_function and len(lines) > max_len:
             return [
@@ -505,6 +516,9 @@ class BashLocalVariablesDetector(
         accidental namespace collisions.
     """
 
+    _FUNCTION_HEADER_RE = re.compile(r"^\s*(?:function\s+)?\w+\s*\(\)\s*\{")
+    _ASSIGNMENT_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*=")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -530,9 +544,9 @@ class BashLocalVariablesDetector(
         """
         violations: list[Violation] = []
         in_function = False
-        for idx, line in enumerate(context.code.splitlines(), start=1):
+        for idx, line in enumerate(context.lines, start=1):
             stripped = line.strip()
-            if re.match(r"^\s*(?:function\s+)?\w+\s*\(\)\s*\{", line):
+            if self._FUNCTION_HEADER_RE.match(line):
                 in_function = True
                 continue
             if in_function and stripped.startswith("}"):
@@ -540,10 +554,9 @@ class BashLocalVariablesDetector(
                 continue
             if not in_function:
                 continue
-            if re.match(
-                r"^[A-Za-z_][A-Za-z0-9_]*=",
-                stripped,
-            ) and not stripped.startswith("local "):
+            if self._ASSIGNMENT_RE.match(stripped) and not stripped.startswith(
+                "local "
+            ):
                 violations.append(
                     self.build_violation(
                         config,
@@ -572,6 +585,8 @@ class BashArgumentValidationDetector(
         ``getopts`` for option parsing to fail fast with a clear message.
     """
 
+    _POSITIONAL_ARGUMENT_RE = re.compile(r"\$(?:[1-9]|@|\*)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -596,7 +611,7 @@ class BashArgumentValidationDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         code = context.code
-        uses_args = bool(re.search(r"\$(?:[1-9]|@|\*)", code))
+        uses_args = bool(self._POSITIONAL_ARGUMENT_RE.search(code))
         has_validation = "$#" in code or "getopts" in code
         if uses_args and not has_validation:
             return [
@@ -627,6 +642,8 @@ class BashMeaningfulNamesDetector(
         into self-documenting code.
     """
 
+    _ASSIGNMENT_NAME_RE = re.compile(r"^\s*([A-Za-z_][A-Za-z0-9_]*)=")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -652,8 +669,8 @@ class BashMeaningfulNamesDetector(
         """
         violations: list[Violation] = []
         min_len = config.min_variable_name_length or 3
-        for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.match(r"^\s*([A-Za-z_][A-Za-z0-9_]*)=", line)
+        for idx, line in enumerate(context.lines, start=1):
+            match = self._ASSIGNMENT_NAME_RE.match(line)
             if not match:
                 continue
             name = match[1]
@@ -740,6 +757,8 @@ class BashArrayUsageDetector(
         should be preferred over IFS-splitting for list-like data.
     """
 
+    _WORD_SPLITTING_RE = re.compile(r"\bIFS=|\bfor\s+\w+\s+in\s+\$")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -763,7 +782,7 @@ class BashArrayUsageDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\bIFS=|\bfor\s+\w+\s+in\s+\$", context.code):
+        if self._WORD_SPLITTING_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -791,6 +810,9 @@ class BashUsageInfoDetector(
         expected arguments and exits with a non-zero code on misuse.
     """
 
+    _USAGE_RE = re.compile(r"\busage\b")
+    _HELP_FLAG_RE = re.compile(r"--help|-h")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -814,9 +836,8 @@ class BashUsageInfoDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if not re.search(r"\busage\b", context.code) and not re.search(
-            r"--help|-h",
-            context.code,
+        if not self._USAGE_RE.search(context.code) and not self._HELP_FLAG_RE.search(
+            context.code
         ):
             return [
                 self.build_violation(
@@ -2,18 +2,55 @@
 
 from __future__ import annotations
 
+import copy
+
+from functools import lru_cache
 from typing import Any
 
 import yaml
 
 
-def load_ci_yaml(code: str) -> dict[str, Any]:
-    """Parse YAML text into a mapping, returning an empty dict on parse failure."""
+def safe_load_yaml(code: str) -> object:
+    """Safely parse YAML text, preferring the libyaml-backed C loader.
+
+    ``yaml.CSafeLoader`` accepts the same documents as ``yaml.SafeLoader`` but
+    is several times faster; it is only unavailable when PyYAML was built
+    without libyaml, in which case the pure-Python loader is used.
+    """
+    if yaml.__with_libyaml__:
+        return yaml.load(code, Loader=yaml.CSafeLoader)
+    return yaml.safe_load(code)
+
+
+@lru_cache(maxsize=128)
+def _parse_yaml_document(code: str) -> tuple[bool, object]:
     try:
-        parsed = yaml.safe_load(code)
+        return True, safe_load_yaml(code)
     except yaml.YAMLError:
+        return False, None
+
+
+def try_load_yaml(code: str) -> tuple[bool, object]:
+    """Parse YAML text once per source string, keeping any top-level shape.
+
+    Returns ``(True, document)`` on success and ``(False, None)`` when the
+    text is not valid YAML.  Like ``load_ci_yaml``, each caller receives a
+    deep copy of the memoised document.
+    """
+    ok, document = _parse_yaml_document(code)
+    return ok, copy.deepcopy(document)
+
+
+def load_ci_yaml(code: str) -> dict[str, Any]:
+    """Parse YAML text into a mapping, returning an empty dict on parse failure.
+
+    Parsed documents are memoised per source text, and each caller receives
+    a deep copy so that mutating the result never leaks into later parses.
+    """
+    ok, document = _parse_yaml_document(code)
+    if not ok or not isinstance(document, dict):
         return {}
-    return parsed if isinstance(parsed, dict) else {}
+    return copy.deepcopy(document)
 
 
 def workflow_jobs(document: dict[str, Any]) -> dict[str, dict[str, Any]]:
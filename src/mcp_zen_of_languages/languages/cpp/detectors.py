@@ -47,6 +47,9 @@ class CppSmartPointerDetector(
     overhead (for ``unique_ptr``) or minimal overhead (for ``shared_ptr``).
     """
 
+    _NEW_RE = re.compile(r"\bnew\b")
+    _DELETE_RE = re.compile(r"\bdelete\b")
+
     @property
     def name(self) -> str:
         """Return ``'cpp_smart_pointers'`` for registry wiring.
@@ -78,7 +81,7 @@ class CppSmartPointerDetector(
                 suggestion=("Prefer smart pointers and RAII over manual new/delete."),
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\bnew\b", line) or re.search(r"\bdelete\b", line)
+            if self._NEW_RE.search(line) or self._DELETE_RE.search(line)
         ]
         return violations
 
@@ -93,6 +96,8 @@ class CppNullptrDetector(ViolationDetector[CppNullptrConfig], LocationHelperMixi
     pointer types, preventing subtle overload-resolution bugs.
     """
 
+    _NULL_MACRO_RE = re.compile(r"\bNULL\b")
+
     @property
     def name(self) -> str:
         """Return ``'cpp_nullptr'`` for registry wiring.
@@ -124,7 +129,7 @@ class CppNullptrDetector(ViolationDetector[CppNullptrConfig], LocationHelperMixi
                 suggestion="Use nullptr instead of NULL/0.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\bNULL\b", line)
+            if self._NULL_MACRO_RE.search(line)
         ]
         return violations
 
@@ -140,6 +145,8 @@ class CppRaiiDetector(ViolationDetector[CppRaiiConfig], LocationHelperMixin):
     scoped handles ensures deterministic release regardless of control flow.
     """
 
+    _RAW_ALLOCATION_RE = re.compile(r"\bnew\b|\bdelete\b|malloc\(|free\(")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-001'`` for registry wiring.
@@ -171,7 +178,7 @@ class CppRaiiDetector(ViolationDetector[CppRaiiConfig], LocationHelperMixin):
                 suggestion="Prefer RAII wrappers instead of manual resource control.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\bnew\b|\bdelete\b|malloc\(|free\(", line)
+            if self._RAW_ALLOCATION_RE.search(line)
         ]
         return violations
 
@@ -288,6 +295,8 @@ class CppManualAllocationDetector(
     boundaries or custom allocator implementations.
     """
 
+    _MANUAL_ALLOCATION_RE = re.compile(r"malloc\(|free\(|new\s+\w+\s*\[|delete\s*\[")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-006'`` for registry wiring.
@@ -319,7 +328,7 @@ class CppManualAllocationDetector(
                 suggestion="Use standard containers or smart pointers.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"malloc\(|free\(|new\s+\w+\s*\[|delete\s*\[", line)
+            if self._MANUAL_ALLOCATION_RE.search(line)
         ]
         return violations
 
@@ -386,6 +395,8 @@ class CppCStyleCastDetector(
     compiler diagnostics when the conversion is unsafe.
     """
 
+    _C_STYLE_CAST_RE = re.compile(r"\([A-Za-z_][A-Za-z0-9_:<>]*\)\s*\w")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-008'`` for registry wiring.
@@ -413,7 +424,7 @@ class CppCStyleCastDetector(
         for idx, line in enumerate(context.code.splitlines(), start=1):
             if "static_cast" in line or "dynamic_cast" in line:
                 continue
-            if re.search(r"\([A-Za-z_][A-Za-z0-9_:<>]*\)\s*\w", line):
+            if self._C_STYLE_CAST_RE.search(line):
                 violations.append(
                     self.build_violation(
                         config,
@@ -438,6 +449,8 @@ class CppRuleOfFiveDetector(
     silently deleted move operations that degrade performance.
     """
 
+    _DESTRUCTOR_RE = re.compile(r"~\w+\s*\(")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-009'`` for registry wiring.
@@ -461,7 +474,7 @@ class CppRuleOfFiveDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"~\w+\s*\(", context.code) and "operator=" not in context.code:
+        if self._DESTRUCTOR_RE.search(context.code) and "operator=" not in context.code:
             return [
                 self.build_violation(
                     config,
@@ -533,6 +546,8 @@ class CppAvoidGlobalsDetector(
         checks, not mutable state.
     """
 
+    _STORAGE_SPECIFIER_RE = re.compile(r"\s*(static|extern)\s+")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-011'`` for registry wiring.
@@ -564,7 +579,7 @@ class CppAvoidGlobalsDetector(
                 suggestion="Avoid mutable globals; use scoped state.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.match(r"\s*(static|extern)\s+", line) and "static_assert" not in line
+            if self._STORAGE_SPECIFIER_RE.match(line) and "static_assert" not in line
         ]
         return violations
 
@@ -629,6 +644,8 @@ class CppOptionalDetector(ViolationDetector[CppOptionalConfig], LocationHelperMi
     allocation entirely.
     """
 
+    _RAW_POINTER_RE = re.compile(r"\b\w+\s*\*\s*\w+")
+
     @property
     def name(self) -> str:
         """Return ``'cpp-013'`` for registry wiring.
@@ -653,7 +670,7 @@ class CppOptionalDetector(ViolationDetector[CppOptionalConfig], LocationHelperMi
             list[Violation]: Violations detected for the analyzed context.
         """
         if (
-            re.search(r"\b\w+\s*\*\s*\w+", context.code)
+            self._RAW_POINTER_RE.search(context.code)
             and "std::optional" not in context.code
         ):
             return [
@@ -191,6 +191,8 @@ class CSharpExpressionBodiedDetector(
     immediately scannable.
     """
 
+    _GETTER_RETURN_RE = re.compile(r"\bget\s*\{\s*return")
+
     @property
     def name(self) -> str:
         """Return ``'cs-002'`` for registry wiring.
@@ -225,7 +227,7 @@ class CSharpExpressionBodiedDetector(
                     ),
                 ]
                 for idx, line in enumerate(context.code.splitlines(), start=1)
-                if re.search(r"\bget\s*\{\s*return", line)
+                if self._GETTER_RETURN_RE.search(line)
             ),
             [],
         )
@@ -241,6 +243,10 @@ class CSharpVarDetector(ViolationDetector[CSharpVarConfig], LocationHelperMixin)
     .NET coding convention for obvious-type assignments.
     """
 
+    _EXPLICIT_PRIMITIVE_DECLARATION_RE = re.compile(
+        r"\b(int|string|bool|double|float|decimal)\s+\w+\s*="
+    )
+
     @property
     def name(self) -> str:
         """Return ``'cs-003'`` for registry wiring.
@@ -265,7 +271,6 @@ class CSharpVarDetector(ViolationDetector[CSharpVarConfig], LocationHelperMixin)
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        pattern = re.compile(r"\b(int|string|bool|double|float|decimal)\s+\w+\s*=")
         violations.extend(
             self.build_violation(
                 config,
@@ -274,7 +279,7 @@ class CSharpVarDetector(ViolationDetector[CSharpVarConfig], LocationHelperMixin)
                 suggestion="Use var when the type is obvious.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if pattern.search(line)
+            if self._EXPLICIT_PRIMITIVE_DECLARATION_RE.search(line)
         )
         return violations
 
@@ -343,6 +348,8 @@ class CSharpCollectionExpressionDetector(
     choose the optimal backing storage based on the target type.
     """
 
+    _NEW_COLLECTION_RE = re.compile(r"new\s+List|new\s+\w+\[\]")
+
     @property
     def name(self) -> str:
         """Return ``'cs-007'`` for registry wiring.
@@ -377,7 +384,7 @@ class CSharpCollectionExpressionDetector(
                     ),
                 ]
                 for idx, line in enumerate(context.code.splitlines(), start=1)
-                if re.search(r"new\s+List|new\s+\w+\[\]", line)
+                if self._NEW_COLLECTION_RE.search(line)
             ),
             [],
         )
@@ -396,6 +403,11 @@ class CSharpNamingConventionDetector(
     by convention replaces navigating by access modifiers.
     """
 
+    _PUBLIC_MEMBER_RE = re.compile(r"\bpublic\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)")
+    _PRIVATE_MEMBER_RE = re.compile(r"\bprivate\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)")
+    _PASCAL_CASE_RE = re.compile(r"^[A-Z][A-Za-z0-9]*$")
+    _CAMEL_CASE_RE = re.compile(r"^_?[a-z][A-Za-z0-9]*$")
+
     @property
     def name(self) -> str:
         """Return ``'cs-008'`` for registry wiring.
@@ -428,13 +440,13 @@ class CSharpNamingConventionDetector(
             """
             style_lower = style.lower()
             if "pascal" in style_lower:
-                return bool(re.match(r"^[A-Z][A-Za-z0-9]*$", name))
+                return bool(self._PASCAL_CASE_RE.match(name))
             if "camel" in style_lower:
-                return bool(re.match(r"^_?[a-z][A-Za-z0-9]*$", name))
+                return bool(self._CAMEL_CASE_RE.match(name))
             return True
 
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.search(r"\bpublic\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)", line)
+            match = self._PUBLIC_MEMBER_RE.search(line)
             if match and config.public_naming:
                 name = match[1]
                 if not matches_style(name, config.public_naming):
@@ -446,7 +458,7 @@ class CSharpNamingConventionDetector(
                             suggestion=f"Use {config.public_naming} for public members.",
                         ),
                     ]
-            match = re.search(r"\bprivate\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)", line)
+            match = self._PRIVATE_MEMBER_RE.search(line)
             if match and config.private_naming:
                 name = match[1]
                 if not matches_style(name, config.private_naming):
@@ -523,6 +535,8 @@ class CSharpMagicNumberDetector(
     values that the JIT compiler can inline just as efficiently.
     """
 
+    _MULTI_DIGIT_NUMBER_RE = re.compile(r"\b\d{2,}\b")
+
     @property
     def name(self) -> str:
         """Return ``'cs-010'`` for registry wiring.
@@ -546,7 +560,7 @@ class CSharpMagicNumberDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\b\d{2,}\b", context.code):
+        if self._MULTI_DIGIT_NUMBER_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -615,6 +629,8 @@ class CSharpExceptionHandlingDetector(
     specific exception type and log or re-throw with context.
     """
 
+    _CATCH_EXCEPTION_RE = re.compile(r"catch\s*\(\s*Exception")
+
     @property
     def name(self) -> str:
         """Return ``'cs-012'`` for registry wiring.
@@ -638,10 +654,7 @@ class CSharpExceptionHandlingDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if (
-            re.search(r"catch\s*\(\s*Exception", context.code)
-            or "catch {" in context.code
-        ):
+        if self._CATCH_EXCEPTION_RE.search(context.code) or "catch {" in context.code:
             return [
                 self.build_violation(
                     config,
@@ -21,6 +21,11 @@ from mcp_zen_of_languages.models import Violation
 class CssSpecificityDetector(ViolationDetector[CssSpecificityConfig]):
     """Detect excessive selector nesting and ``!important`` usage."""
 
+    _SANITIZE_RE = re.compile(
+        r"/\*[\s\S]*?\*/|//[^\n]*|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|#\{[\s\S]*?\}",
+    )
+    _IMPORTANT_RE = re.compile(r"!\s*important\b", re.IGNORECASE)
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -34,10 +39,7 @@ class CssSpecificityDetector(ViolationDetector[CssSpecificityConfig]):
     @classmethod
     def _sanitize_for_nesting_scan(cls, code: str) -> str:
         """Strip comments, strings, and interpolation blocks for brace scanning."""
-        pattern = re.compile(
-            r"/\*[\s\S]*?\*/|//[^\n]*|\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'|#\{[\s\S]*?\}",
-        )
-        return pattern.sub(cls._preserve_newlines, code)
+        return cls._SANITIZE_RE.sub(cls._preserve_newlines, code)
 
     @classmethod
     def _find_nesting_violation_line(cls, code: str, max_depth: int) -> int | None:
@@ -87,9 +89,7 @@ class CssSpecificityDetector(ViolationDetector[CssSpecificityConfig]):
                     suggestion="Reduce selector nesting depth (prefer <= 3 levels).",
                 ),
             ]
-        important_count = len(
-            re.findall(r"!\s*important\b", context.code, flags=re.IGNORECASE)
-        )
+        important_count = len(self._IMPORTANT_RE.findall(context.code))
         if important_count > config.max_important_usages:
             return [
                 self.build_violation(
@@ -105,6 +105,8 @@ class CssSpecificityDetector(ViolationDetector[CssSpecificityConfig]):
 class CssMagicPixelsDetector(ViolationDetector[CssMagicPixelsConfig]):
     """Detect raw pixel literals."""
 
+    _PIXEL_RE = re.compile(r"(?<![\w-])(?:\d+\.?\d*|\.\d+)px\b")
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -114,7 +116,7 @@ class CssMagicPixelsDetector(ViolationDetector[CssMagicPixelsConfig]):
         self, context: AnalysisContext, config: CssMagicPixelsConfig
     ) -> list[Violation]:
         """Detect raw pixel literals above configured threshold."""
-        matches = list(re.finditer(r"(?<![\w-])(?:\d+\.?\d*|\.\d+)px\b", context.code))
+        matches = list(self._PIXEL_RE.finditer(context.code))
         if len(matches) > config.max_raw_pixel_literals:
             return [
                 self.build_violation(
@@ -133,6 +135,10 @@ class CssMagicPixelsDetector(ViolationDetector[CssMagicPixelsConfig]):
 class CssColorLiteralDetector(ViolationDetector[CssColorLiteralConfig]):
     """Detect inline color literals."""
 
+    _COLOR_RE = re.compile(
+        r"(#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\b|rgb[a]?\(|hsl[a]?\()"
+    )
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -142,12 +148,7 @@ class CssColorLiteralDetector(ViolationDetector[CssColorLiteralConfig]):
         self, context: AnalysisContext, config: CssColorLiteralConfig
     ) -> list[Violation]:
         """Detect hard-coded color literals above configured threshold."""
-        matches = list(
-            re.finditer(
-                r"(#(?:[0-9a-fA-F]{3}|[0-9a-fA-F]{6})\b|rgb[a]?\(|hsl[a]?\()",
-                context.code,
-            ),
-        )
+        matches = list(self._COLOR_RE.finditer(context.code))
         if len(matches) > config.max_color_literals:
             return [
                 self.build_violation(
@@ -191,6 +192,8 @@ class CssGodStylesheetDetector(ViolationDetector[CssGodStylesheetConfig]):
 class CssImportChainDetector(ViolationDetector[CssImportChainConfig]):
     """Detect ``@import`` overuse."""
 
+    _IMPORT_RE = re.compile(r"^\s*@import\b", re.MULTILINE)
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -200,7 +203,7 @@ class CssImportChainDetector(ViolationDetector[CssImportChainConfig]):
         self, context: AnalysisContext, config: CssImportChainConfig
     ) -> list[Violation]:
         """Detect ``@import`` count above configured threshold."""
-        imports = len(re.findall(r"^\s*@import\b", context.code, flags=re.MULTILINE))
+        imports = len(self._IMPORT_RE.findall(context.code))
         if imports > config.max_import_statements:
             return [
                 self.build_violation(
@@ -216,6 +219,8 @@ class CssImportChainDetector(ViolationDetector[CssImportChainConfig]):
 class CssZIndexScaleDetector(ViolationDetector[CssZIndexScaleConfig]):
     """Detect z-index values outside allowed scale."""
 
+    _Z_INDEX_RE = re.compile(r"\bz-index\s*:\s*(-?\d+)\b")
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -226,7 +231,7 @@ class CssZIndexScaleDetector(ViolationDetector[CssZIndexScaleConfig]):
     ) -> list[Violation]:
         """Detect off-scale z-index values."""
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.search(r"\bz-index\s*:\s*(-?\d+)\b", line)
+            match = self._Z_INDEX_RE.search(line)
             if not match:
                 continue
             value = int(match[1])
@@ -245,6 +250,8 @@ class CssZIndexScaleDetector(ViolationDetector[CssZIndexScaleConfig]):
 class CssVendorPrefixDetector(ViolationDetector[CssVendorPrefixConfig]):
     """Detect manual vendor-prefixed properties."""
 
+    _VENDOR_PREFIX_RE = re.compile(r"-(webkit|moz|ms|o)-[a-z-]+\s*:")
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -254,7 +261,7 @@ class CssVendorPrefixDetector(ViolationDetector[CssVendorPrefixConfig]):
         self, context: AnalysisContext, config: CssVendorPrefixConfig
     ) -> list[Violation]:
         """Detect vendor-prefixed properties above configured threshold."""
-        matches = re.findall(r"-(webkit|moz|ms|o)-[a-z-]+\s*:", context.code)
+        matches = self._VENDOR_PREFIX_RE.findall(context.code)
         if len(matches) > config.max_vendor_prefixed_properties:
             return [
                 self.build_violation(
@@ -270,6 +277,11 @@ class CssVendorPrefixDetector(ViolationDetector[CssVendorPrefixConfig]):
 class CssMediaQueryScaleDetector(ViolationDetector[CssMediaQueryScaleConfig]):
     """Detect inconsistent media query breakpoints."""
 
+    _BREAKPOINT_RE = re.compile(
+        r"@media[\s\S]*?(?:min-width|max-width)\s*:\s*(\d+)(px|rem|em)",
+        flags=re.IGNORECASE,
+    )
+
     @property
     def name(self) -> str:
         """Return detector rule ID."""
@@ -279,11 +291,7 @@ class CssMediaQueryScaleDetector(ViolationDetector[CssMediaQueryScaleConfig]):
         self, context: AnalysisContext, config: CssMediaQueryScaleConfig
     ) -> list[Violation]:
         """Detect media-query breakpoints that are off the allowed scale."""
-        pattern = re.compile(
-            r"@media[\s\S]*?(?:min-width|max-width)\s*:\s*(\d+)(px|rem|em)",
-            flags=re.IGNORECASE,
-        )
-        for match in pattern.finditer(context.code):
+        for match in self._BREAKPOINT_RE.finditer(context.code):
             value = int(match[1])
             unit = match[2]
             if unit == "px" and value not in config.allowed_breakpoint_values:
@@ -11,13 +11,12 @@ if TYPE_CHECKING:
     from mcp_zen_of_languages.analyzers.pipeline import PipelineConfig
     from mcp_zen_of_languages.models import CyclomaticSummary
 
-import yaml
-
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.analyzers.base import AnalyzerCapabilities
 from mcp_zen_of_languages.analyzers.base import AnalyzerConfig
 from mcp_zen_of_languages.analyzers.base import BaseAnalyzer
 from mcp_zen_of_languages.analyzers.base import DetectionPipeline
+from mcp_zen_of_languages.languages.ci_yaml_utils import try_load_yaml
 from mcp_zen_of_languages.models import ParserResult
 
 
@@ -54,7 +53,10 @@ class GitLabCIAnalyzer(BaseAnalyzer):
         return AnalyzerCapabilities(supports_ast=True)
 
     def parse_code(self, code: str) -> ParserResult | None:
-        """Parse GitLab CI YAML into a structured mapping via ``yaml.safe_load``.
+        """Parse GitLab CI YAML into a structured mapping via ``try_load_yaml``.
+
+        The parse is memoised per source text, so analysing an unchanged
+        pipeline again skips the YAML load.
 
         Args:
             code (str): Raw GitLab CI YAML text.
@@ -62,12 +64,11 @@ class GitLabCIAnalyzer(BaseAnalyzer):
         Returns:
             ParserResult | None: ParserResult wrapping the parsed mapping, or ``None`` on parse failure.
         """
-        try:
-            tree = yaml.safe_load(code)
-            return ParserResult(type="yaml", tree=tree)
-        except yaml.YAMLError:
+        ok, tree = try_load_yaml(code)
+        if not ok:
             logger.debug("Failed to parse GitLab CI YAML")
             return None
+        return ParserResult(type="yaml", tree=tree)
 
     def compute_metrics(
         self,
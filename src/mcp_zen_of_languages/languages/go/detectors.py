@@ -46,6 +46,10 @@ class GoErrorHandlingDetector(ViolationDetector[GoErrorHandlingConfig]):
     combined total exceeds the configured threshold.
     """
 
+    _PANIC_RE = re.compile(r"\bpanic\s*\(")
+    _IGNORED_ERR_RE = re.compile(r"\b_,\s*err\s*:=")
+    _ERR_ASSIGN_RE = re.compile(r"\berr\s*:=")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -72,9 +76,9 @@ class GoErrorHandlingDetector(ViolationDetector[GoErrorHandlingConfig]):
         violations: list[Violation] = []
         code = context.code
         counts = {
-            "panic": len(re.findall(r"\bpanic\s*\(", code)),
-            "ignored": len(re.findall(r"\b_,\s*err\s*:=", code)),
-            "unchecked": len(re.findall(r"\berr\s*:=", code)),
+            "panic": len(self._PANIC_RE.findall(code)),
+            "ignored": len(self._IGNORED_ERR_RE.findall(code)),
+            "unchecked": len(self._ERR_ASSIGN_RE.findall(code)),
         }
         total = counts["panic"] + counts["ignored"] + counts["unchecked"]
         if total > config.max_ignored_errors:
@@ -103,6 +107,9 @@ class GoInterfaceSizeDetector(ViolationDetector[GoInterfaceSizeConfig]):
     maximum.
     """
 
+    _INTERFACE_DECL_RE = re.compile(r"type\s+(\w+)\s+interface\s*\{([\s\S]*?)\}")
+    _INTERFACE_RE = re.compile(r"\binterface\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -127,13 +134,10 @@ class GoInterfaceSizeDetector(ViolationDetector[GoInterfaceSizeConfig]):
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        if not re.search(r"\binterface\b", context.code):
+        if not self._INTERFACE_RE.search(context.code):
             return violations
         max_methods = config.max_interface_methods
-        for match in re.finditer(
-            r"type\s+(\w+)\s+interface\s*\{([\s\S]*?)\}",
-            context.code,
-        ):
+        for match in self._INTERFACE_DECL_RE.finditer(context.code):
             body = match.group(2)
             methods = [
                 line
@@ -213,6 +217,9 @@ class GoDeferUsageDetector(ViolationDetector[GoDeferUsageConfig]):
     deferred, flagging forgotten cleanup.
     """
 
+    _CLOSE_CALL_RE = re.compile(r"\b(\w+(?:\.\w+)*)\.(Close|Unlock)\s*\(\)")
+    _DEFER_IN_LOOP_RE = re.compile(r"for\s+.+\{[\s\S]*?\bdefer\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -238,10 +245,7 @@ class GoDeferUsageDetector(ViolationDetector[GoDeferUsageConfig]):
         """
         violations: list[Violation] = []
         code = context.code
-        if config.detect_defer_in_loop and re.search(
-            r"for\s+.+\{[\s\S]*?\bdefer\b",
-            code,
-        ):
+        if config.detect_defer_in_loop and self._DEFER_IN_LOOP_RE.search(code):
             violations.append(
                 self.build_violation(
                     config,
@@ -256,9 +260,8 @@ class GoDeferUsageDetector(ViolationDetector[GoDeferUsageConfig]):
         if not config.detect_missing_defer:
             return violations
         lines = code.splitlines()
-        close_pattern = re.compile(r"\b(\w+(?:\.\w+)*)\.(Close|Unlock)\s*\(\)")
         for idx, line in enumerate(lines, start=1):
-            match = close_pattern.search(line)
+            match = self._CLOSE_CALL_RE.search(line)
             if not match:
                 continue
             if "defer" in line:
@@ -289,6 +292,8 @@ class GoNamingConventionDetector(ViolationDetector[GoNamingConventionConfig]):
     shorter, more idiomatic alternatives.
     """
 
+    _LONG_VAR_RE = re.compile(r"\bvar\s+(\w{25,})\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -315,7 +320,7 @@ class GoNamingConventionDetector(ViolationDetector[GoNamingConventionConfig]):
         violations: list[Violation] = []
         if not config.detect_long_names:
             return violations
-        for _ in re.finditer(r"\bvar\s+(\w{25,})\b", context.code):
+        for _ in self._LONG_VAR_RE.finditer(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -339,6 +344,8 @@ class GoInterfaceReturnDetector(ViolationDetector[GoInterfaceReturnConfig]):
     ``interface{`` and suggests returning concrete types instead.
     """
 
+    _INTERFACE_RETURN_RE = re.compile(r"func\s+\w+\([^)]*\)\s+interface\s*\{")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -362,7 +369,7 @@ class GoInterfaceReturnDetector(ViolationDetector[GoInterfaceReturnConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"func\s+\w+\([^)]*\)\s+interface\s*\{", context.code):
+        if self._INTERFACE_RETURN_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -384,6 +391,8 @@ class GoZeroValueDetector(ViolationDetector[GoZeroValueConfig]):
     zero values are valid.
     """
 
+    _CONSTRUCTOR_RE = re.compile(r"\bfunc\s+New\w+\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -407,7 +416,7 @@ class GoZeroValueDetector(ViolationDetector[GoZeroValueConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\bfunc\s+New\w+\b", context.code):
+        if self._CONSTRUCTOR_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -428,6 +437,8 @@ class GoInterfacePointerDetector(ViolationDetector[GoInterfacePointerConfig]):
     and ``*interface{`` patterns via regex.
     """
 
+    _INTERFACE_POINTER_RE = re.compile(r"\*\w+Interface\b|\*interface\s*\{")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -451,7 +462,7 @@ class GoInterfacePointerDetector(ViolationDetector[GoInterfacePointerConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\*\w+Interface\b|\*interface\s*\{", context.code):
+        if self._INTERFACE_POINTER_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -473,6 +484,8 @@ class GoGoroutineLeakDetector(ViolationDetector[GoGoroutineLeakConfig]):
     allocations without a corresponding ``close()`` call.
     """
 
+    _MAKE_CHAN_RE = re.compile(r"make\s*\(\s*chan\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -506,7 +519,7 @@ class GoGoroutineLeakDetector(ViolationDetector[GoGoroutineLeakConfig]):
                     suggestion="Ensure goroutines can terminate (context/cancel).",
                 ),
             )
-        if re.search(r"make\s*\(\s*chan\b", code) and "close(" not in code:
+        if self._MAKE_CHAN_RE.search(code) and "close(" not in code:
             violations.append(
                 self.build_violation(
                     config,
@@ -528,6 +541,8 @@ class GoPackageNamingDetector(ViolationDetector[GoPackageNamingConfig]):
     embedded underscores.
     """
 
+    _PACKAGE_RE = re.compile(r"^\s*package\s+(\w+)", re.MULTILINE)
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -551,7 +566,7 @@ class GoPackageNamingDetector(ViolationDetector[GoPackageNamingConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if match := re.search(r"^\s*package\s+(\w+)", context.code, re.MULTILINE):
+        if match := self._PACKAGE_RE.search(context.code):
             name = match[1]
             if name.endswith("s") or "_" in name:
                 return [
@@ -575,6 +590,8 @@ class GoPackageStateDetector(ViolationDetector[GoPackageStateConfig]):
     and flags their presence.
     """
 
+    _PACKAGE_VAR_RE = re.compile(r"^\s*var\s+\w+", re.MULTILINE)
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -598,7 +615,7 @@ class GoPackageStateDetector(ViolationDetector[GoPackageStateConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"^\s*var\s+\w+", context.code, re.MULTILINE):
+        if self._PACKAGE_VAR_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -661,6 +678,10 @@ class GoOrganizeResponsibilityDetector(ViolationDetector[GoSinglePurposePackageC
     indicate a grab-bag of unrelated functionality.
     """
 
+    _GENERIC_PACKAGE_RE = re.compile(
+        r"^package\s+(util|utils|common|helper|helpers|misc|shared)\b", re.MULTILINE
+    )
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -684,11 +705,7 @@ class GoOrganizeResponsibilityDetector(ViolationDetector[GoSinglePurposePackageC
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(
-            r"^package\s+(util|utils|common|helper|helpers|misc|shared)\b",
-            context.code,
-            re.MULTILINE,
-        ):
+        if self._GENERIC_PACKAGE_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -706,6 +723,8 @@ class GoEarlyReturnDetector(ViolationDetector[GoEarlyReturnConfig]):
     main logic at the top indentation level.
     """
 
+    _ERR_NIL_BRANCH_RE = re.compile(r"if\s+err\s*==\s*nil\s*\{")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -729,7 +748,7 @@ class GoEarlyReturnDetector(ViolationDetector[GoEarlyReturnConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"if\s+err\s*==\s*nil\s*\{", context.code):
+        if self._ERR_NIL_BRANCH_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -786,6 +805,8 @@ class GoEmbeddingDepthDetector(ViolationDetector[GoEmbeddingDepthConfig]):
         re.MULTILINE | re.VERBOSE,
     )
 
+    _STRUCT_DECL_RE = re.compile(r"^\s*type\s+\w+(\s*\[[^\]]+\])?\s+struct\s*\{")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -835,10 +856,7 @@ class GoEmbeddingDepthDetector(ViolationDetector[GoEmbeddingDepthConfig]):
         struct_lines: list[str] = []
         for line in context.code.splitlines():
             if not in_struct:
-                if re.match(
-                    r"^\s*type\s+\w+(\s*\[[^\]]+\])?\s+struct\s*\{",
-                    line,
-                ):
+                if self._STRUCT_DECL_RE.match(line):
                     in_struct = True
                     brace_depth = line.count("{") - line.count("}")
                     struct_lines = []
@@ -877,6 +895,8 @@ class GoConcurrencyCallerDetector(ViolationDetector[GoConcurrencyCallerConfig]):
     library code remains composable and testable.
     """
 
+    _GOROUTINE_RE = re.compile(r"\bgo\s+func\b|\bgo\s+\w+\(")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -900,7 +920,7 @@ class GoConcurrencyCallerDetector(ViolationDetector[GoConcurrencyCallerConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"\bgo\s+func\b|\bgo\s+\w+\(", context.code):
+        if self._GOROUTINE_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -918,6 +938,8 @@ class GoSimplicityDetector(ViolationDetector[GoSimplicityConfig]):
     information.  Prefer specific types or small interfaces.
     """
 
+    _EMPTY_INTERFACE_RE = re.compile(r"\binterface\s*\{\s*\}")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -941,7 +963,7 @@ class GoSimplicityDetector(ViolationDetector[GoSimplicityConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"\binterface\s*\{\s*\}", context.code):
+        if self._EMPTY_INTERFACE_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -959,6 +981,9 @@ class GoTestPresenceDetector(ViolationDetector[GoTestPresenceConfig]):
     expected behaviour and prevent regressions.
     """
 
+    _EXPORTED_FUNC_RE = re.compile(r"func\s+[A-Z]")
+    _TEST_FUNC_RE = re.compile(r"func\s+Test")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -982,8 +1007,8 @@ class GoTestPresenceDetector(ViolationDetector[GoTestPresenceConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        has_exported = re.search(r"func\s+[A-Z]", context.code)
-        has_tests = re.search(r"func\s+Test", context.code)
+        has_exported = self._EXPORTED_FUNC_RE.search(context.code)
+        has_tests = self._TEST_FUNC_RE.search(context.code)
         if has_exported and not has_tests:
             return [
                 self.build_violation(
@@ -1002,6 +1027,9 @@ class GoBenchmarkDetector(ViolationDetector[GoBenchmarkConfig]):
     that should be justified by benchmark results.
     """
 
+    _OPTIMIZATION_RE = re.compile(r"sync\.Pool|unsafe\.Pointer")
+    _BENCHMARK_FUNC_RE = re.compile(r"func\s+Benchmark")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -1025,8 +1053,8 @@ class GoBenchmarkDetector(ViolationDetector[GoBenchmarkConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        has_optim = re.search(r"sync\.Pool|unsafe\.Pointer", context.code)
-        has_bench = re.search(r"func\s+Benchmark", context.code)
+        has_optim = self._OPTIMIZATION_RE.search(context.code)
+        has_bench = self._BENCHMARK_FUNC_RE.search(context.code)
         if has_optim and not has_bench:
             return [
                 self.build_violation(
@@ -1045,6 +1073,8 @@ class GoModerationDetector(ViolationDetector[GoModerationConfig]):
     suggest uncontrolled concurrency that is hard to reason about.
     """
 
+    _GO_STATEMENT_RE = re.compile(r"\bgo\s+")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -1068,7 +1098,7 @@ class GoModerationDetector(ViolationDetector[GoModerationConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        count = len(re.findall(r"\bgo\s+", context.code))
+        count = len(self._GO_STATEMENT_RE.findall(context.code))
         if count > config.max_goroutine_spawns:
             return [
                 self.build_violation(
@@ -1087,6 +1117,8 @@ class GoMaintainabilityDetector(ViolationDetector[GoMaintainabilityConfig]):
     starting with the symbol name for ``go doc`` to render correctly.
     """
 
+    _EXPORTED_FUNC_RE = re.compile(r"func\s+[A-Z]\w*\(")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -1112,7 +1144,7 @@ class GoMaintainabilityDetector(ViolationDetector[GoMaintainabilityConfig]):
         """
         lines = context.code.splitlines()
         for idx, line in enumerate(lines):
-            if re.match(r"func\s+[A-Z]\w*\(", line):
+            if self._EXPORTED_FUNC_RE.match(line):
                 prev = lines[idx - 1].strip() if idx > 0 else ""
                 if not prev.startswith("//"):
                     return [
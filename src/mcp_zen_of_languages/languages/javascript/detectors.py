@@ -122,6 +122,8 @@ class JsNoVarDetector(ViolationDetector[JsNoVarConfig], LocationHelperMixin):
         are block-scoped and should always be preferred over ``var``.
     """
 
+    _VAR_RE = re.compile(r"\bvar\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -153,7 +155,7 @@ class JsNoVarDetector(ViolationDetector[JsNoVarConfig], LocationHelperMixin):
                 suggestion="Use const/let instead of var.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"\bvar\b", line)
+            if self._VAR_RE.search(line)
         ]
         return violations
 
@@ -175,6 +177,8 @@ class JsStrictEqualityDetector(
         the standard recommendation in ESLint's ``eqeqeq`` rule.
     """
 
+    _LOOSE_EQUALITY_RE = re.compile(r"(!=|==)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -203,7 +207,7 @@ class JsStrictEqualityDetector(
             if "==" in line or "!=" in line:
                 if "===" in line or "!==" in line:
                     continue
-                if match := re.search(r"(!=|==)", line):
+                if match := self._LOOSE_EQUALITY_RE.search(line):
                     violations.append(
                         self.build_violation(
                             config,
@@ -414,6 +418,9 @@ class JsModernFeaturesDetector(
         natively — there is no reason to avoid them in new code.
     """
 
+    _STRING_CONCAT_RE = re.compile(r"['\"][^'\"]+['\"]\s*\+|\+\s*['\"][^'\"]+['\"]")
+    _MEMBER_ACCESS_RE = re.compile(r"\b(\w+)\.\w+")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -448,7 +455,7 @@ class JsModernFeaturesDetector(
                     suggestion="Prefer arrow functions and other modern syntax.",
                 ),
             )
-        if re.search(r"['\"][^'\"]+['\"]\s*\+|\+\s*['\"][^'\"]+['\"]", code):
+        if self._STRING_CONCAT_RE.search(code):
             violations.append(
                 self.build_violation(
                     config,
@@ -458,7 +465,7 @@ class JsModernFeaturesDetector(
                 ),
             )
         for line in code.splitlines():
-            matches = re.findall(r"\b(\w+)\.\w+", line)
+            matches = self._MEMBER_ACCESS_RE.findall(line)
             if any(
                 matches.count(name) >= MIN_REPEATED_ACCESS_COUNT
                 for name in set(matches)
@@ -492,6 +499,8 @@ class JsMagicNumbersDetector(
         from detection to reduce false positives.
     """
 
+    _MAGIC_NUMBER_RE = re.compile(r"\b[2-9]\d*\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -515,7 +524,7 @@ class JsMagicNumbersDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\b[2-9]\d*\b", context.code):
+        if self._MAGIC_NUMBER_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -540,6 +549,8 @@ class JsInheritanceDepthDetector(ViolationDetector[Js009Config], LocationHelperM
         mixins) is generally preferred over deep inheritance in JavaScript.
     """
 
+    _EXTENDS_RE = re.compile(r"class\s+(\w+)\s+extends\s+(\w+)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -561,7 +572,7 @@ class JsInheritanceDepthDetector(ViolationDetector[Js009Config], LocationHelperM
         """
         max_depth = config.max_inheritance_depth or 0
         parents: dict[str, str] = {}
-        for match in re.finditer(r"class\s+(\w+)\s+extends\s+(\w+)", context.code):
+        for match in self._EXTENDS_RE.finditer(context.code):
             parents[match.group(1)] = match.group(2)
 
         def chain_depth(name: str) -> int:
@@ -610,6 +621,8 @@ class JsPureFunctionDetector(
         cache, and parallelize in both browser and server environments.
     """
 
+    _MUTATING_CALL_RE = re.compile(r"\b(push|splice|pop|shift|unshift)\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -633,7 +646,7 @@ class JsPureFunctionDetector(
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\b(push|splice|pop|shift|unshift)\s*\(", context.code):
+        if self._MUTATING_CALL_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -658,6 +671,8 @@ class JsMeaningfulNamesDetector(ViolationDetector[Js011Config], LocationHelperMi
         for explanatory comments.
     """
 
+    _DECLARATION_RE = re.compile(r"\b(?:const|let|var|function|class)\s+([A-Za-z_]\w*)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -678,9 +693,8 @@ class JsMeaningfulNamesDetector(ViolationDetector[Js011Config], LocationHelperMi
             list[Violation]: Violations detected for the analyzed context.
         """
         min_length = config.min_identifier_length or 0
-        pattern = re.compile(r"\b(?:const|let|var|function|class)\s+([A-Za-z_]\w*)")
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            for match in pattern.finditer(line):
+            for match in self._DECLARATION_RE.finditer(line):
                 name = match.group(1)
                 if len(name) < min_length and name not in {"i", "j", "k"}:
                     return [
@@ -706,6 +720,8 @@ class JsDestructuringDetector(ViolationDetector[JsDestructuringConfig]):
         better than three separate ``obj.x`` assignments.
     """
 
+    _MEMBER_ACCESS_RE = re.compile(r"\b(\w+)\.\w+")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -730,7 +746,7 @@ class JsDestructuringDetector(ViolationDetector[JsDestructuringConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        matches = re.findall(r"\b(\w+)\.\w+", context.code)
+        matches = self._MEMBER_ACCESS_RE.findall(context.code)
         counts: dict[str, int] = {}
         for m in matches:
             counts[m] = counts.get(m, 0) + 1
@@ -756,6 +772,8 @@ class JsObjectSpreadDetector(ViolationDetector[JsObjectSpreadConfig]):
         Object spread is supported in all modern browsers and Node.js 8.3+.
     """
 
+    _OBJECT_ASSIGN_RE = re.compile(r"Object\.assign\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -780,7 +798,7 @@ class JsObjectSpreadDetector(ViolationDetector[JsObjectSpreadConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"Object\.assign\s*\(", context.code):
+        if self._OBJECT_ASSIGN_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -804,6 +822,8 @@ class JsNoWithDetector(ViolationDetector[JsNoWithConfig]):
         error in ES modules.
     """
 
+    _WITH_RE = re.compile(r"\bwith\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -828,7 +848,7 @@ class JsNoWithDetector(ViolationDetector[JsNoWithConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\bwith\s*\(", context.code):
+        if self._WITH_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -852,6 +872,8 @@ class JsParamCountDetector(ViolationDetector[JsParamCountConfig]):
         ``function create(name, age, role, active)``.
     """
 
+    _MANY_PARAMS_RE = re.compile(r"function\s+\w+\s*\([^)]*,[^)]*,[^)]*,[^)]*\)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -876,7 +898,7 @@ class JsParamCountDetector(ViolationDetector[JsParamCountConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"function\s+\w+\s*\([^)]*,[^)]*,[^)]*,[^)]*\)", context.code):
+        if self._MANY_PARAMS_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -900,6 +922,9 @@ class JsNoEvalDetector(ViolationDetector[JsNoEvalConfig]):
         modern browsers — relying on it also limits deployment options.
     """
 
+    _EVAL_RE = re.compile(r"\beval\s*\(")
+    _NEW_FUNCTION_RE = re.compile(r"new\s+Function\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -924,8 +949,8 @@ class JsNoEvalDetector(ViolationDetector[JsNoEvalConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\beval\s*\(", context.code) or re.search(
-            r"new\s+Function\s*\(", context.code
+        if self._EVAL_RE.search(context.code) or self._NEW_FUNCTION_RE.search(
+            context.code
         ):
             return [
                 self.build_violation(
@@ -950,6 +975,8 @@ class JsNoArgumentsDetector(ViolationDetector[JsNoArgumentsConfig]):
         early avoids runtime errors during future refactoring.
     """
 
+    _ARGUMENTS_RE = re.compile(r"\barguments\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -974,7 +1001,7 @@ class JsNoArgumentsDetector(ViolationDetector[JsNoArgumentsConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"\barguments\b", context.code):
+        if self._ARGUMENTS_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -997,6 +1024,10 @@ class JsNoPrototypeMutationDetector(ViolationDetector[JsNoPrototypeMutationConfi
         instead of modifying the shared prototype chain.
     """
 
+    _PROTOTYPE_MUTATION_RE = re.compile(
+        r"(Array|String|Object|Function|Number|Boolean)\.prototype\.\w+\s*="
+    )
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -1021,10 +1052,7 @@ class JsNoPrototypeMutationDetector(ViolationDetector[JsNoPrototypeMutationConfi
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(
-            r"(Array|String|Object|Function|Number|Boolean)\.prototype\.\w+\s*=",
-            context.code,
-        ):
+        if self._PROTOTYPE_MUTATION_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import logging
 
 from typing import TYPE_CHECKING
@@ -17,6 +16,7 @@ from mcp_zen_of_languages.analyzers.base import AnalyzerCapabilities
 from mcp_zen_of_languages.analyzers.base import AnalyzerConfig
 from mcp_zen_of_languages.analyzers.base import BaseAnalyzer
 from mcp_zen_of_languages.analyzers.base import DetectionPipeline
+from mcp_zen_of_languages.languages.json_utils import parse_json
 from mcp_zen_of_languages.models import ParserResult
 
 
@@ -71,7 +71,10 @@ class JsonAnalyzer(BaseAnalyzer):
         return AnalyzerCapabilities(supports_ast=True)
 
     def parse_code(self, code: str) -> ParserResult | None:
-        """Parse JSON text into a Python object via ``json.loads``.
+        """Parse JSON text into a Python object via the shared ``parse_json`` cache.
+
+        The returned tree is the cached document itself; callers must treat
+        it as read-only.
 
         Args:
             code (str): Raw JSON text to parse.
@@ -79,12 +82,11 @@ class JsonAnalyzer(BaseAnalyzer):
         Returns:
             ParserResult | None: ParserResult wrapping the parsed object, or ``None`` on parse failure.
         """
-        try:
-            tree = json.loads(code)
-            return ParserResult(type="json", tree=tree)
-        except (json.JSONDecodeError, ValueError):
+        parsed = parse_json(code)
+        if parsed is None:
             logger.debug("Failed to parse JSON")
             return None
+        return ParserResult(type="json", tree=parsed.tree)
 
     def compute_metrics(
         self,
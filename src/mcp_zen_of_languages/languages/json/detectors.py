@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import json
 import re
 
 from collections import Counter
@@ -13,6 +12,7 @@ if TYPE_CHECKING:
     from collections.abc import Iterator
 
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
+from mcp_zen_of_languages.analyzers.base import AstStatus
 from mcp_zen_of_languages.analyzers.base import LocationHelperMixin
 from mcp_zen_of_languages.analyzers.base import ViolationDetector
 from mcp_zen_of_languages.languages.configs import JsonArrayOrderConfig
@@ -24,16 +24,24 @@ from mcp_zen_of_languages.languages.configs import JsonNullHandlingConfig
 from mcp_zen_of_languages.languages.configs import JsonNullSprawlConfig
 from mcp_zen_of_languages.languages.configs import JsonSchemaConsistencyConfig
 from mcp_zen_of_languages.languages.configs import JsonStrictnessConfig
+from mcp_zen_of_languages.languages.json_utils import parse_json
 from mcp_zen_of_languages.models import Location
 from mcp_zen_of_languages.models import Violation
 
 
-def _load_json_document(code: str) -> object | None:
-    """Parse JSON text and return Python objects, or ``None`` when invalid."""
-    try:
-        return json.loads(code)
-    except (json.JSONDecodeError, ValueError):
+def _json_document(context: AnalysisContext) -> object | None:
+    """Return the shared parsed JSON document for ``context``.
+
+    Uses the tree from ``JsonAnalyzer.parse_code`` when present, otherwise
+    the memoised ``parse_json`` result, so every detector sees the same
+    object for the same source.  Callers must not mutate it.
+    """
+    if context.ast_tree is not None and context.ast_tree.type == "json":
+        return context.ast_tree.tree
+    if context.ast_status is AstStatus.parse_failed:
         return None
+    parsed = parse_json(context.code)
+    return None if parsed is None else parsed.tree
 
 
 def _iter_values(value: object) -> Iterator[object]:
@@ -130,7 +138,7 @@ class JsonSchemaConsistencyDetector(
         config: JsonSchemaConsistencyConfig,
     ) -> list[Violation]:
         """Detect deep nesting beyond the configured threshold."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
 
@@ -165,7 +173,8 @@ class JsonDuplicateKeyDetector(
 
     Duplicate object keys silently override earlier values in most parsers,
     leading to hard-to-diagnose bugs. This detector uses a parse-time
-    ``object_pairs_hook`` to catch duplicates before they are lost.
+    ``object_pairs_hook`` (see ``parse_json``) to catch duplicates before
+    they are lost.
     """
 
     @property
@@ -179,22 +188,8 @@ class JsonDuplicateKeyDetector(
         config: JsonDuplicateKeyConfig,
     ) -> list[Violation]:
         """Detect duplicate keys while preserving parse-time key order."""
-        duplicates: list[str] = []
-
-        def track_duplicates(pairs: list[tuple[str, object]]) -> dict[str, object]:
-            seen: set[str] = set()
-            obj: dict[str, object] = {}
-            for key, value in pairs:
-                if key in seen and key not in duplicates:
-                    duplicates.append(key)
-                seen.add(key)
-                obj[key] = value
-            return obj
-
-        try:
-            json.loads(context.code, object_pairs_hook=track_duplicates)
-        except (json.JSONDecodeError, ValueError):
-            return []
+        parsed = parse_json(context.code)
+        duplicates = parsed.duplicate_keys if parsed is not None else ()
         if duplicates:
             duplicate_key = duplicates[0]
             return [
@@ -234,7 +229,7 @@ class JsonMagicStringDetector(
         config: JsonMagicStringConfig,
     ) -> list[Violation]:
         """Detect repeated literal strings that behave like magic constants."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
         values = [
@@ -319,7 +314,7 @@ class JsonDateFormatDetector(
         config: JsonDateFormatConfig,
     ) -> list[Violation]:
         """Detect string values that look like dates but are not ISO 8601."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
         key_fragments = [kf.lower() for kf in config.common_date_keys]
@@ -370,7 +365,7 @@ class JsonNullHandlingDetector(
         config: JsonNullHandlingConfig,
     ) -> list[Violation]:
         """Detect top-level object keys explicitly set to null."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if not isinstance(data, dict):
             return []
         null_keys = [k for k, v in data.items() if v is None]
@@ -409,7 +404,7 @@ class JsonKeyCasingDetector(
         config: JsonKeyCasingConfig,
     ) -> list[Violation]:
         """Detect mixed key casing at the same object level."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
         mixed_key = _find_mixed_key(data)
@@ -443,7 +438,7 @@ class JsonArrayOrderDetector(
         config: JsonArrayOrderConfig,
     ) -> list[Violation]:
         """Detect arrays that exceed the allowed inline size."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
         for node in _iter_values(data):
@@ -478,7 +473,7 @@ class JsonNullSprawlDetector(
         config: JsonNullSprawlConfig,
     ) -> list[Violation]:
         """Detect excessive use of null across a document."""
-        data = _load_json_document(context.code)
+        data = _json_document(context)
         if data is None:
             return []
         null_count = sum(1 for value in _iter_values(data) if value is None)
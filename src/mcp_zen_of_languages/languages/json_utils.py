@@ -0,0 +1,52 @@
+"""Shared, memoised JSON parsing for the JSON analyzer and detectors."""
+
+from __future__ import annotations
+
+import json
+
+from dataclasses import dataclass
+from functools import lru_cache
+
+
+@dataclass(frozen=True, slots=True)
+class ParsedJson:
+    """Parsed JSON document plus the object keys that appeared more than once.
+
+    Attributes:
+        tree: Python objects produced by ``json.loads``; shared through the
+            parse cache, so callers must treat it as read-only.
+        duplicate_keys: Duplicated object keys in the order the parser met them.
+    """
+
+    tree: object
+    duplicate_keys: tuple[str, ...] = ()
+
+
+@lru_cache(maxsize=128)
+def parse_json(code: str) -> ParsedJson | None:
+    """Parse *code* once, recording duplicate keys before ``dict`` drops them.
+
+    Args:
+        code (str): Raw JSON text.
+
+    Returns:
+        ParsedJson | None: The parsed document, or ``None`` when *code* is not valid JSON.
+    """
+    duplicates: list[str] = []
+
+    def keep_pairs(pairs: list[tuple[str, object]]) -> dict[str, object]:
+        obj: dict[str, object] = {}
+        for key, value in pairs:
+            if key in obj and key not in duplicates:
+                duplicates.append(key)
+            obj[key] = value
+        return obj
+
+    try:
+        tree = json.loads(code, object_pairs_hook=keep_pairs)
+    except (json.JSONDecodeError, ValueError):
+        return None
+    return ParsedJson(tree=tree, duplicate_keys=tuple(duplicates))
+
+
+__all__ = ["ParsedJson", "parse_json"]
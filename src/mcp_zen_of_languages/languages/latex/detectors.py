@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import re
 
+from functools import lru_cache
 from pathlib import Path
 
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
@@ -31,6 +32,7 @@ _ABSOLUTE_LENGTH_PATTERN = re.compile(
 _CITE_PATTERN = re.compile(r"\\cite[a-zA-Z*]*\{([^}]+)\}")
 _BIBITEM_PATTERN = re.compile(r"\\bibitem(?:\[[^\]]*])?\{([^}]+)\}")
 _USEPACKAGE_PATTERN = re.compile(r"\\usepackage(?:\[[^\]]*\])?\{([^}]+)\}")
+_INCLUDE_PATTERN = re.compile(r"\\(?:input|include)\{([^}]+)\}")
 
 _PACKAGE_COMMAND_HINTS: dict[str, tuple[str, ...]] = {
     "graphicx": ("\\includegraphics",),
@@ -47,9 +49,10 @@ def _line_number(code: str, index: int) -> int:
     return code.count("\n", 0, index) + 1
 
 
-def _extract_include_targets(code: str) -> list[str]:
-    targets = re.findall(r"\\(?:input|include)\{([^}]+)\}", code)
-    return [target.strip() for target in targets if target.strip()]
+@lru_cache(maxsize=256)
+def _extract_include_targets(code: str) -> tuple[str, ...]:
+    targets = (target.strip() for target in _INCLUDE_PATTERN.findall(code))
+    return tuple(target for target in targets if target)
 
 
 def _resolve_target(target: str, source: str, files: set[str]) -> str | None:
@@ -81,6 +84,47 @@ def _resolve_target(target: str, source: str, files: set[str]) -> str | None:
     return None
 
 
+@lru_cache(maxsize=64)
+def _include_graph(files: tuple[tuple[str, str], ...]) -> dict[str, tuple[str, ...]]:
+    """Map each file to the files it includes, resolved against *files*.
+
+    Keyed on the ``(name, code)`` pairs so that analysing each file of an
+    unchanged project reuses one graph instead of rescanning every sibling.
+    """
+    file_names = {file_name for file_name, _ in files}
+    return {
+        file_name: tuple(
+            resolved
+            for target in _extract_include_targets(code)
+            if (resolved := _resolve_target(target, file_name, file_names))
+        )
+        for file_name, code in files
+    }
+
+
+def _reaches_cycle(edges: dict[str, tuple[str, ...]], start: str) -> bool:
+    """Return whether a depth-first walk from *start* re-enters its own path."""
+    on_path: set[str] = set()
+    visited: set[str] = set()
+    stack: list[tuple[str, int]] = [(start, 0)]
+    while stack:
+        node, index = stack.pop()
+        if index == 0:
+            if node in on_path:
+                return True
+            if node in visited:
+                continue
+            visited.add(node)
+            on_path.add(node)
+        neighbors = edges.get(node, ())
+        if index < len(neighbors):
+            stack.append((node, index + 1))
+            stack.append((neighbors[index], 0))
+        else:
+            on_path.discard(node)
+    return False
+
+
 class LatexMacroDefinitionDetector(
     ViolationDetector[LatexMacroDefinitionConfig],
     LocationHelperMixin,
@@ -323,34 +367,8 @@ class LatexIncludeLoopDetector(
         file_map = dict(context.other_files or {})
         current_path = context.path or "__current__.tex"
         file_map[current_path] = context.code
-        file_names = set(file_map)
-
-        edges: dict[str, list[str]] = {}
-        for file_name, code in file_map.items():
-            targets = [
-                resolved
-                for target in _extract_include_targets(code)
-                if (resolved := _resolve_target(target, file_name, file_names))
-            ]
-            edges[file_name] = targets
-
-        visited: set[str] = set()
-        stack: set[str] = set()
-
-        def _has_cycle(node: str) -> bool:
-            if node in stack:
-                return True
-            if node in visited:
-                return False
-            visited.add(node)
-            stack.add(node)
-            for neighbor in edges.get(node, []):
-                if _has_cycle(neighbor):
-                    return True
-            stack.remove(node)
-            return False
-
-        if _has_cycle(current_path):
+        edges = _include_graph(tuple(sorted(file_map.items())))
+        if _reaches_cycle(edges, current_path):
             return [
                 self.build_violation(
                     config,
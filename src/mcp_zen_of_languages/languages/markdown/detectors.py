@@ -32,6 +32,22 @@ _FENCE_RE = re.compile(r"^\s*```(?P<lang>[^\s`]*)\s*$")
 _FRONTMATTER_RE = re.compile(r"^([A-Za-z_][\w-]*)\s*:")
 _MDX_IMPORT_RE = re.compile(r'^\s*import\s+(.+?)\s+from\s+["\'][^"\']+["\']')
 _MDX_IMPORT_SIDE_EFFECT_RE = re.compile(r'^\s*import\s+["\'][^"\']+["\']')
+_MDX_STATEMENT_RE = re.compile(r"^\s*(import|export)\s+")
+_MDX_ANONYMOUS_DEFAULT_EXPORT_RE = re.compile(
+    r"export\s+default(?:"
+    r"\s+(?P<function>function)\s*(?:\(|$)"
+    r"|\s+(?P<class>class)\s*(?:\{|$)"
+    r"|\s*(?P<expression>\(|async\s*\(|\{|\[))",
+)
+_MDX_ANONYMOUS_DEFAULT_EXPORT_SUGGESTIONS = {
+    "function": "Name the default function export (e.g. export default function Page()).",
+    "class": "Name the default class export to improve stack traces and maintainability.",
+    "expression": "Export a named component/function instead of an anonymous default expression.",
+}
+_NAMESPACE_IMPORT_RE = re.compile(r"\*\s+as\s+([A-Za-z_][A-Za-z0-9_]*)")
+_NAMED_IMPORTS_RE = re.compile(r"\{(.+)\}")
+_IDENTIFIER_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+_URI_SCHEME_RE = re.compile(r"^[a-zA-Z][a-zA-Z0-9+.-]*:")
 
 
 def _frontmatter_end_line(lines: list[str]) -> int | None:
@@ -63,7 +79,7 @@ def _is_mdx_context(context: AnalysisContext) -> bool:
     if context.path and context.path.lower().endswith(".mdx"):
         return True
     for _line_no, line in _iter_text_lines(context.code):
-        if re.match(r"^\s*(import|export)\s+", line):
+        if _MDX_STATEMENT_RE.match(line):
             return True
     return False
 
@@ -264,7 +280,7 @@ class MarkdownFrontMatterDetector(
                 if (
                     not target
                     or target.startswith(("#", "<", "/"))
-                    or re.match(r"^[a-zA-Z][a-zA-Z0-9+.-]*:", target)
+                    or _URI_SCHEME_RE.match(target)
                 ):
                     continue
                 resolved_target = (base_dir / target).resolve()
@@ -309,29 +325,14 @@ class MarkdownMdxNamedDefaultExportDetector(
         if config.mdx_only and not _is_mdx_context(context):
             return []
         for line_no, line in enumerate(context.code.splitlines(), start=1):
-            stripped = line.strip()
-            if re.match(r"export\s+default\s+function\s*(?:\(|$)", stripped):
-                return [
-                    self.build_violation(
-                        config,
-                        location=Location(line=line_no, column=1),
-                        suggestion="Name the default function export (e.g. export default function Page()).",
-                    ),
-                ]
-            if re.match(r"export\s+default\s+class\s*(?:\{|$)", stripped):
+            if match := _MDX_ANONYMOUS_DEFAULT_EXPORT_RE.match(line.strip()):
                 return [
                     self.build_violation(
                         config,
                         location=Location(line=line_no, column=1),
-                        suggestion="Name the default class export to improve stack traces and maintainability.",
-                    ),
-                ]
-            if re.match(r"export\s+default\s*(?:\(|async\s*\(|\{|\[)", stripped):
-                return [
-                    self.build_violation(
-                        config,
-                        location=Location(line=line_no, column=1),
-                        suggestion="Export a named component/function instead of an anonymous default expression.",
+                        suggestion=_MDX_ANONYMOUS_DEFAULT_EXPORT_SUGGESTIONS[
+                            match.lastgroup
+                        ],
                     ),
                 ]
         return []
@@ -368,14 +369,12 @@ class MarkdownMdxImportHygieneDetector(
 
         if not imports:
             return []
-        usage_text = "\n".join(non_import_lines)
+        usage_re = re.compile(
+            rf"\b(?:{'|'.join(re.escape(name) for name in imports)})\b",
+        )
+        used = set(usage_re.findall("\n".join(non_import_lines)))
         unused = next(
-            (
-                (name, line_no)
-                for name, line_no in imports.items()
-                if not re.search(rf"<{re.escape(name)}\b", usage_text)
-                and not re.search(rf"\b{re.escape(name)}\b", usage_text)
-            ),
+            ((name, line_no) for name, line_no in imports.items() if name not in used),
             None,
         )
         if unused is None:
@@ -396,27 +395,27 @@ def _extract_imported_identifiers(import_clause: str) -> set[str]:
     if clause.startswith("{"):
         return _parse_named_imports(clause)
     if clause.startswith("*"):
-        if match := re.match(r"\*\s+as\s+([A-Za-z_][A-Za-z0-9_]*)", clause):
+        if match := _NAMESPACE_IMPORT_RE.match(clause):
             names.add(match.group(1))
         return names
     if "," in clause:
         default_name, remainder = [part.strip() for part in clause.split(",", 1)]
-        if re.match(r"[A-Za-z_][A-Za-z0-9_]*$", default_name):
+        if _IDENTIFIER_RE.fullmatch(default_name):
             names.add(default_name)
         if remainder.startswith("{"):
             names |= _parse_named_imports(remainder)
         elif remainder.startswith("*") and (
-            match := re.match(r"\*\s+as\s+([A-Za-z_][A-Za-z0-9_]*)", remainder)
+            match := _NAMESPACE_IMPORT_RE.match(remainder)
         ):
             names.add(match.group(1))
         return names
-    if re.match(r"[A-Za-z_][A-Za-z0-9_]*$", clause):
+    if _IDENTIFIER_RE.fullmatch(clause):
         names.add(clause)
     return names
 
 
 def _parse_named_imports(clause: str) -> set[str]:
-    match = re.search(r"\{(.+)\}", clause)
+    match = _NAMED_IMPORTS_RE.search(clause)
     if not match:
         return set()
     names: set[str] = set()
@@ -427,7 +426,7 @@ def _parse_named_imports(clause: str) -> set[str]:
         if " as " in token:
             _, alias = token.split(" as ", 1)
             token = alias.strip()
-        if re.match(r"[A-Za-z_][A-Za-z0-9_]*$", token):
+        if _IDENTIFIER_RE.fullmatch(token):
             names.add(token)
     return names
 
@@ -57,6 +57,8 @@ class PowerShellApprovedVerbDetector(
         approved verbs and their expected usage groups.
     """
 
+    _VERB_NOUN_FUNCTION_RE = re.compile(r"function\s+(\w+)-", re.IGNORECASE)
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -81,9 +83,10 @@ class PowerShellApprovedVerbDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
+        approved_verbs = frozenset(config.approved_verbs)
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.search(r"function\s+(\w+)-", line, re.IGNORECASE)
-            if match and match[1].lower() not in config.approved_verbs:
+            match = self._VERB_NOUN_FUNCTION_RE.search(line)
+            if match and match[1].lower() not in approved_verbs:
                 violations.append(
                     self.build_violation(
                         config,
@@ -165,6 +168,9 @@ class PowerShellPascalCaseDetector(
         ``Verb-Noun`` pairs to accommodate advanced functions and modules.
     """
 
+    _FUNCTION_RE = re.compile(r"function\s+(\w+)", re.IGNORECASE)
+    _PASCAL_CASE_RE = re.compile(r"^[A-Z][A-Za-z0-9]*(-[A-Z][A-Za-z0-9]*)?$")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -190,9 +196,9 @@ class PowerShellPascalCaseDetector(
         """
         violations: list[Violation] = []
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            if match := re.search(r"function\s+(\w+)", line, re.IGNORECASE):
+            if match := self._FUNCTION_RE.search(line):
                 name = match[1]
-                if not re.match(r"^[A-Z][A-Za-z0-9]*(-[A-Z][A-Za-z0-9]*)?$", name):
+                if not self._PASCAL_CASE_RE.match(name):
                     violations.append(
                         self.build_violation(
                             config,
@@ -379,6 +385,9 @@ class PowerShellPipelineUsageDetector(
         equivalents.
     """
 
+    _FOREACH_OBJECT_RE = re.compile(r"\bForEach-Object\b", re.IGNORECASE)
+    _FOREACH_RE = re.compile(r"\bforeach\b", re.IGNORECASE)
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -405,11 +414,7 @@ class PowerShellPipelineUsageDetector(
         code = context.code
         if "|" in code:
             return []
-        if re.search(r"\bForEach-Object\b", code, re.IGNORECASE) or re.search(
-            r"\bforeach\b",
-            code,
-            re.IGNORECASE,
-        ):
+        if self._FOREACH_OBJECT_RE.search(code) or self._FOREACH_RE.search(code):
             return [
                 self.build_violation(
                     config,
@@ -437,6 +442,10 @@ class PowerShellShouldProcessDetector(
         destructive action to honour ``-WhatIf`` and ``-Confirm`` flags.
     """
 
+    _DESTRUCTIVE_VERB_RE = re.compile(
+        r"\b(Remove|Set|Stop|Clear|Restart|Disable|Enable)-"
+    )
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -463,7 +472,7 @@ class PowerShellShouldProcessDetector(
         code = context.code
         if "SupportsShouldProcess" in code:
             return []
-        if re.search(r"\b(Remove|Set|Stop|Clear|Restart|Disable|Enable)-", code):
+        if self._DESTRUCTIVE_VERB_RE.search(code):
             return [
                 self.build_violation(
                     config,
@@ -491,6 +500,8 @@ class PowerShellSplattingDetector(
         you build the hashtable dynamically before the call.
     """
 
+    _PARAMETER_RE = re.compile(r"\s-\w+")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -518,7 +529,7 @@ class PowerShellSplattingDetector(
         for idx, line in enumerate(context.code.splitlines(), start=1):
             if "@" in line:
                 continue
-            param_count = len(re.findall(r"\s-\w+", line))
+            param_count = len(self._PARAMETER_RE.findall(line))
             if param_count >= MAX_INLINE_PARAMS:
                 violations.append(
                     self.build_violation(
@@ -651,6 +662,8 @@ class PowerShellAliasUsageDetector(
         in shared scripts, modules, or CI/CD automation.
     """
 
+    _ALIAS_RE = re.compile(r"(?<!\w)(gci|ls|dir|cat|%|\?)(?!\w)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -675,9 +688,8 @@ class PowerShellAliasUsageDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        alias_pattern = re.compile(r"(?<!\w)(gci|ls|dir|cat|%|\?)(?!\w)")
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            if match := alias_pattern.search(line):
+            if match := self._ALIAS_RE.search(line):
                 violations.append(
                     self.build_violation(
                         config,
@@ -57,6 +57,7 @@ from mcp_zen_of_languages.languages.configs import StarImportConfig
 from mcp_zen_of_languages.models import Location
 from mcp_zen_of_languages.models import ParserResult
 from mcp_zen_of_languages.models import Violation
+from mcp_zen_of_languages.utils.parsers import parse_python_with_builtin_ast
 
 
 if TYPE_CHECKING:
@@ -66,6 +67,26 @@ if TYPE_CHECKING:
 MIN_LINE_FOR_PREV_LOOKUP = 2
 
 
+def _python_ast(context: AnalysisContext) -> ast.AST | None:
+    """Return the stdlib AST for ``context``, parsing the source at most once.
+
+    Reuses ``context.ast_tree`` when the analyzer already produced an ``ast``
+    tree; otherwise falls back to the memoised
+    ``parse_python_with_builtin_ast`` so every detector in the pipeline
+    shares one parse of the same text.
+
+    Args:
+        context (AnalysisContext): Analysis context with source text and parsed tree.
+
+    Returns:
+        ast.AST | None: Root AST node, or ``None`` when the source does not parse.
+    """
+    tree = getattr(context.ast_tree, "tree", context.ast_tree)
+    if isinstance(tree, ast.AST):
+        return tree
+    return parse_python_with_builtin_ast(context.code)
+
+
 def _principle_text(config: DetectorConfig) -> str:
     """Extract the human-readable principle name from a detector config.
 
@@ -139,6 +160,8 @@ class StarImportDetector(ViolationDetector[StarImportConfig], LocationHelperMixi
     textually and does not require a successful parse.
     """
 
+    _STAR_IMPORT_RE = re.compile(r"^\s*from\s+\S+\s+import\s+\*")
+
     @property
     def name(self) -> str:
         """Return ``"star_imports"`` for detector registry lookup.
@@ -168,8 +191,8 @@ class StarImportDetector(ViolationDetector[StarImportConfig], LocationHelperMixi
         """
         violations: list[Violation] = []
         message = config.select_violation_message(index=3)
-        for i, line in enumerate(context.code.splitlines(), start=1):
-            if re.match(r"^\s*from\s+\S+\s+import\s+\*", line):
+        for i, line in enumerate(context.lines, start=1):
+            if self._STAR_IMPORT_RE.match(line):
                 loc = Location(line=i, column=line.find("import") + 1)
                 violations.append(
                     Violation(
@@ -204,6 +227,11 @@ class BareExceptDetector(ViolationDetector[BareExceptConfig], LocationHelperMixi
     ``except X:`` followed by a ``pass``/``...`` body.
     """
 
+    _SILENT_EXCEPT_RE = re.compile(
+        r"except\s+\w+(?:\s+as\s+\w+)?\s*:\s*(pass|\.\.\.)\s*$"
+    )
+    _EXCEPT_HEADER_RE = re.compile(r"except\s+\w+(?:\s+as\s+\w+)?\s*:\s*$")
+
     @property
     def name(self) -> str:
         """Return ``"bare_except"`` for detector registry lookup.
@@ -235,7 +263,7 @@ class BareExceptDetector(ViolationDetector[BareExceptConfig], LocationHelperMixi
             list[Violation]: One violation per offending ``except`` clause.
         """
         violations: list[Violation] = []
-        lines = context.code.splitlines()
+        lines = context.lines
         for i, line in enumerate(lines, start=1):
             stripped = line.strip()
             if stripped == "except:" or stripped.startswith("except: "):
@@ -257,10 +285,7 @@ class BareExceptDetector(ViolationDetector[BareExceptConfig], LocationHelperMixi
                     ),
                 )
                 continue
-            if re.match(
-                r"except\s+\w+(?:\s+as\s+\w+)?\s*:\s*(pass|\.\.\.)\s*$",
-                stripped,
-            ):
+            if self._SILENT_EXCEPT_RE.match(stripped):
                 loc = Location(line=i, column=line.find("except") + 1)
                 violations.append(
                     Violation(
@@ -279,7 +304,7 @@ class BareExceptDetector(ViolationDetector[BareExceptConfig], LocationHelperMixi
                     ),
                 )
                 continue
-            if re.match(r"except\s+\w+(?:\s+as\s+\w+)?\s*:\s*$", stripped):
+            if self._EXCEPT_HEADER_RE.match(stripped):
                 next_line = lines[i] if i < len(lines) else ""
                 if next_line.strip() in {"pass", "..."}:
                     loc = Location(line=i, column=line.find("except") + 1)
@@ -319,6 +344,9 @@ class MagicNumberDetector(ViolationDetector[MagicNumberConfig], LocationHelperMi
     configured ``max_magic_numbers`` threshold.
     """
 
+    _CONSTANT_ASSIGNMENT_RE = re.compile(r"^[A-Z][A-Z0-9_]*\s*=")
+    _MAGIC_NUMBER_RE = re.compile(r"\b(?:[2-9]\d*|1\.\d+)\b")
+
     @property
     def name(self) -> str:
         """Return ``"magic_number"`` for detector registry lookup.
@@ -348,16 +376,15 @@ class MagicNumberDetector(ViolationDetector[MagicNumberConfig], LocationHelperMi
                 configured threshold.
         """
         violations: list[Violation] = []
-        pattern = re.compile(r"\b(?:[2-9]\d*|1\.\d+)\b")
         count = 0
         first_match: tuple[int, int] | None = None
-        for idx, line in enumerate(context.code.splitlines(), start=1):
+        for idx, line in enumerate(context.lines, start=1):
             stripped = line.strip()
             if not stripped or stripped.startswith("#"):
                 continue
-            if re.match(r"^[A-Z][A-Z0-9_]*\s*=", stripped):
+            if self._CONSTANT_ASSIGNMENT_RE.match(stripped):
                 continue
-            for match in pattern.finditer(line):
+            for match in self._MAGIC_NUMBER_RE.finditer(line):
                 count += 1
                 if first_match is None:
                     first_match = (idx, match.start() + 1)
@@ -401,6 +428,8 @@ class ComplexOneLinersDetector(
        ``else`` flag complex ternary expressions.
     """
 
+    _FOR_KEYWORD_RE = re.compile(r"\bfor\b")
+
     @property
     def name(self) -> str:
         """Return ``"complex_one_liners"`` for detector registry lookup.
@@ -431,11 +460,11 @@ class ComplexOneLinersDetector(
                 complexity heuristics.
         """
         violations: list[Violation] = []
-        for idx, line in enumerate(context.code.splitlines(), start=1):
+        for idx, line in enumerate(context.lines, start=1):
             stripped = line.strip()
             if not stripped or stripped.startswith("#"):
                 continue
-            for_count = len(re.findall(r"\bfor\b", line))
+            for_count = len(self._FOR_KEYWORD_RE.findall(line))
             if for_count > config.max_for_clauses:
                 violations.append(
                     self.build_violation(
@@ -484,6 +513,8 @@ class ContextManagerDetector(
     handles.
     """
 
+    skips_blank_source = True
+
     @property
     def name(self) -> str:
         """Return ``"context_manager"`` for detector registry lookup.
@@ -515,9 +546,8 @@ class ContextManagerDetector(
         """
         violations: list[Violation] = []
         message = config.select_violation_message(contains="context managers", index=2)
-        try:
-            tree = ast.parse(context.code)
-        except SyntaxError:
+        tree = _python_ast(context)
+        if tree is None:
             return violations
 
         for node in ast.walk(tree):
@@ -534,7 +564,7 @@ class ContextManagerDetector(
                     col = getattr(node, "col_offset", None)
                     if lineno is not None:
                         loc = Location(line=lineno, column=(col or 0) + 1)
-                        lines = context.code.splitlines()
+                        lines = context.lines
                         start = max(0, lineno - 3)
                         end = min(len(lines), lineno + 2)
                         snippet = "\n".join(lines[start:end])
@@ -579,6 +609,8 @@ class DocstringDetector(ViolationDetector[DocstringConfig], LocationHelperMixin)
     inside other functions are intentionally excluded.
     """
 
+    skips_blank_source = True
+
     @property
     def name(self) -> str:
         """Return ``"docstrings"`` for detector registry lookup.
@@ -613,9 +645,8 @@ class DocstringDetector(ViolationDetector[DocstringConfig], LocationHelperMixin)
             contains="Missing docstrings",
             index=3,
         )
-        try:
-            tree = ast.parse(context.code)
-        except SyntaxError:
+        tree = _python_ast(context)
+        if tree is None:
             return violations
 
         for node in ast.iter_child_nodes(tree):
@@ -701,7 +732,7 @@ class LineLengthDetector(ViolationDetector[LineLengthConfig], LocationHelperMixi
         severity = config.severity or 2
         message = config.select_violation_message(contains="whitespace", index=2)
 
-        for i, line in enumerate(context.code.splitlines(), start=1):
+        for i, line in enumerate(context.lines, start=1):
             if len(line) > max_len:
                 loc = Location(line=i, column=max_len + 1)
                 violations.append(
@@ -734,6 +765,8 @@ class ClassSizeDetector(ViolationDetector[ClassSizeConfig], LocationHelperMixin)
     statement.
     """
 
+    skips_blank_source = True
+
     @property
     def name(self) -> str:
         """Return ``"class_size"`` for detector registry lookup.
@@ -750,8 +783,8 @@ class ClassSizeDetector(ViolationDetector[ClassSizeConfig], LocationHelperMixin)
     ) -> list[Violation]:
         """Walk the AST and flag classes whose line span exceeds ``max_class_length``.
 
-        Falls back to ``ast.parse`` when the pre-built ``context.ast_tree``
-        is unavailable or not a stdlib ``ast.AST``.
+        Falls back to a memoised ``ast.parse`` when the pre-built
+        ``context.ast_tree`` is unavailable or not a stdlib ``ast.AST``.
 
         Args:
             context (AnalysisContext): Analysis context with source text and parsed tree.
@@ -766,21 +799,9 @@ class ClassSizeDetector(ViolationDetector[ClassSizeConfig], LocationHelperMixin)
         severity = config.severity or 5
         message = config.select_violation_message(contains="Classes longer", index=1)
 
-        ast_root = None
-        try:
-            ast_root = (
-                context.ast_tree.tree
-                if isinstance(context.ast_tree, ParserResult)
-                else context.ast_tree
-            )
-        except AttributeError:
-            ast_root = context.ast_tree
-
-        if not isinstance(ast_root, ast.AST):
-            try:
-                ast_root = ast.parse(context.code)
-            except SyntaxError:
-                return violations
+        ast_root = _python_ast(context)
+        if ast_root is None:
+            return violations
 
         for node in ast.walk(ast_root):
             if isinstance(node, ast.ClassDef):
@@ -825,6 +846,11 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
     directly from source text.
     """
 
+    skips_blank_source = True
+    _FUNCTION_DEF_RE = re.compile(r"^def\s+([A-Za-z0-9_]+)", re.MULTILINE)
+    _ASSIGNMENT_RE = re.compile(r"^([A-Za-z0-9_]+)\s*=", re.MULTILINE)
+    _SNAKE_CASE_RE = re.compile(r"^_?[a-z][a-z0-9_]*$")
+
     @property
     def name(self) -> str:
         """Return ``"name_style"`` for detector registry lookup.
@@ -834,7 +860,7 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
         """
         return "name_style"
 
-    def detect(  # noqa: C901, PLR0912
+    def detect(
         self,
         context: AnalysisContext,
         config: NameStyleConfig,
@@ -857,19 +883,8 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
         """
         violations: list[Violation] = []
 
-        tree = None
-        try:
-            if context.ast_tree is not None:
-                maybe_tree = getattr(context.ast_tree, "tree", context.ast_tree)
-                if isinstance(maybe_tree, ast.AST):
-                    tree = maybe_tree
-                else:
-                    tree = getattr(maybe_tree, "tree", None)
-                    if tree is None:
-                        tree = ast.parse(context.code)
-            else:
-                tree = ast.parse(context.code)
-        except (AttributeError, SyntaxError):
+        tree = _python_ast(context)
+        if tree is None:
             return self._heuristic_detect(context, config)
 
         principle = config.principle or config.principle_id or config.type
@@ -960,11 +975,7 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
         principle = config.principle or config.principle_id or config.type
         severity = config.severity or 3
         message = config.select_violation_message(index=1)
-        for m in re.finditer(
-            r"^def\s+([A-Za-z0-9_]+)",
-            context.code,
-            flags=re.MULTILINE,
-        ):
+        for m in self._FUNCTION_DEF_RE.finditer(context.code):
             name = m.group(1)
             if not self._is_snake_case(name):
                 loc = self.find_location_by_substring(context.code, f"def {name}")
@@ -978,7 +989,7 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
                     ),
                 )
 
-        for m in re.finditer(r"^([A-Za-z0-9_]+)\s*=", context.code, flags=re.MULTILINE):
+        for m in self._ASSIGNMENT_RE.finditer(context.code):
             name = m.group(1)
             if name.isupper():
                 continue
@@ -1005,7 +1016,7 @@ class NameStyleDetector(ViolationDetector[NameStyleConfig], LocationHelperMixin)
         Returns:
             bool: ``True`` when *name* is valid snake_case.
         """
-        return bool(re.match(r"^_?[a-z][a-z0-9_]*$", name))
+        return bool(self._SNAKE_CASE_RE.match(name))
 
 
 class ShortVariableNamesDetector(
@@ -1028,6 +1039,9 @@ class ShortVariableNamesDetector(
     ``_``) are excluded.  Falls back to regex heuristics on parse failure.
     """
 
+    skips_blank_source = True
+    _ASSIGNMENT_RE = re.compile(r"^(\w+)\s*=", re.MULTILINE)
+
     @property
     def name(self) -> str:
         """Return ``"short_variable_names"`` for detector registry lookup.
@@ -1060,15 +1074,8 @@ class ShortVariableNamesDetector(
         violations: list[Violation] = []
         min_len = config.min_identifier_length
         allowed_loop_names = set(config.allowed_loop_names)
-        try:
-            tree = (
-                context.ast_tree.tree
-                if isinstance(context.ast_tree, ParserResult)
-                else context.ast_tree
-            )
-            if not isinstance(tree, ast.AST):
-                tree = ast.parse(context.code)
-        except (AttributeError, SyntaxError):
+        tree = _python_ast(context)
+        if tree is None:
             return self._heuristic_detect(context, config)
 
         for node in ast.walk(tree):
@@ -1142,7 +1149,7 @@ class ShortVariableNamesDetector(
         """
         violations: list[Violation] = []
         min_len = config.min_identifier_length
-        for match in re.finditer(r"^(\w+)\s*=", context.code, flags=re.MULTILINE):
+        for match in self._ASSIGNMENT_RE.finditer(context.code):
             name = match.group(1)
             if name.isupper() or len(name) >= min_len:
                 continue
@@ -1239,6 +1246,7 @@ class CyclomaticComplexityDetector(
         max_allowed = config.max_cyclomatic_complexity
         principle = _principle_text(config)
         base_severity = _severity_level(config)
+        message = _violation_message(config, contains="cyclomatic", index=0)
 
         if avg > max_allowed:
             location = self._find_first_function_location(context)
@@ -1246,7 +1254,7 @@ class CyclomaticComplexityDetector(
                 Violation(
                     principle=principle,
                     severity=base_severity,
-                    message=_violation_message(config, contains="cyclomatic", index=0),
+                    message=message,
                     location=location,
                     suggestion="Reduce branching and split complex functions into smaller units.",
                 ),
@@ -1261,11 +1269,7 @@ class CyclomaticComplexityDetector(
                     Violation(
                         principle=principle,
                         severity=severity,
-                        message=_violation_message(
-                            config,
-                            contains="cyclomatic",
-                            index=0,
-                        ),
+                        message=message,
                         location=loc,
                         suggestion="Consider refactoring this function to reduce branching.",
                     ),
@@ -1322,6 +1326,8 @@ class NestingDepthDetector(ViolationDetector[NestingDepthConfig], LocationHelper
        depth 1 are flagged separately.
     """
 
+    skips_blank_source = True
+
     @property
     def name(self) -> str:
         """Return ``"nesting_depth"`` for detector registry lookup.
@@ -1415,8 +1421,9 @@ class NestingDepthDetector(ViolationDetector[NestingDepthConfig], LocationHelper
     def _max_loop_depth(self, context: AnalysisContext) -> int:
         """Compute the maximum depth of nested ``for``/``while`` loops via AST traversal.
 
-        Recursively walks the tree, incrementing depth at each loop node
-        and tracking the maximum seen across all branches.
+        Walks the tree with an explicit ``(node, depth)`` stack, incrementing
+        depth at each loop node and tracking the maximum seen across all
+        branches, so deeply nested sources cannot hit the recursion limit.
 
         Args:
             context (AnalysisContext): Analysis context with source text and parsed tree.
@@ -1424,36 +1431,19 @@ class NestingDepthDetector(ViolationDetector[NestingDepthConfig], LocationHelper
         Returns:
             int: Deepest loop nesting level (0 means no loops).
         """
-        try:
-            tree = (
-                context.ast_tree.tree
-                if isinstance(context.ast_tree, ParserResult)
-                else context.ast_tree
-            )
-            if not isinstance(tree, ast.AST):
-                tree = ast.parse(context.code)
-        except (AttributeError, SyntaxError):
+        tree = _python_ast(context)
+        if tree is None:
             return 0
 
-        def walk(node: ast.AST, depth: int) -> int:
-            """Recurse through AST children, counting loop nesting depth.
-
-            Args:
-                node (ast.AST): Current AST node being visited.
-                depth (int): Accumulated loop nesting depth at this point.
-
-            Returns:
-                int: Maximum loop depth encountered in this subtree.
-            """
-            current = depth
+        max_depth = 0
+        stack: list[tuple[ast.AST, int]] = [(tree, 0)]
+        while stack:
+            node, depth = stack.pop()
             if isinstance(node, (ast.For, ast.AsyncFor, ast.While)):
-                current += 1
-            max_depth = current
-            for child in ast.iter_child_nodes(node):
-                max_depth = max(max_depth, walk(child, current))
-            return max_depth
-
-        return walk(tree, 0)
+                depth += 1
+                max_depth = max(max_depth, depth)
+            stack.extend((child, depth) for child in ast.iter_child_nodes(node))
+        return max_depth
 
 
 class LongFunctionDetector(ViolationDetector[LongFunctionConfig], LocationHelperMixin):
@@ -2279,6 +2269,8 @@ class PythonPracticalityDetector(ViolationDetector[PythonPracticalityConfig]):
     premature abstraction.
     """
 
+    _ABSTRACT_BASE_RE = re.compile(r"\bclass\s+\w+\s*\(\s*(ABC|Protocol)\s*\)")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2302,7 +2294,7 @@ class PythonPracticalityDetector(ViolationDetector[PythonPracticalityConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"\bclass\s+\w+\s*\(\s*(ABC|Protocol)\s*\)", context.code):
+        if self._ABSTRACT_BASE_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -2319,6 +2311,9 @@ class PythonExplicitSilenceDetector(ViolationDetector[PythonExplicitSilenceConfi
     Errors should never pass silently unless explicitly silenced.
     """
 
+    _BARE_EXCEPT_RE = re.compile(r"\bexcept\s*:")
+    _EXCEPT_PASS_RE = re.compile(r"\bexcept\s+\w[\w.]*\s*:.*\n\s*pass\b")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2343,7 +2338,7 @@ class PythonExplicitSilenceDetector(ViolationDetector[PythonExplicitSilenceConfi
             list[Violation]: Detected violations.
         """
         violations: list[Violation] = []
-        if re.search(r"\bexcept\s*:", context.code):
+        if self._BARE_EXCEPT_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -2351,7 +2346,7 @@ class PythonExplicitSilenceDetector(ViolationDetector[PythonExplicitSilenceConfi
                     suggestion="Catch specific exceptions; never use bare except.",
                 ),
             )
-        if re.search(r"\bexcept\s+\w[\w.]*\s*:.*\n\s*pass\b", context.code):
+        if self._EXCEPT_PASS_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -2365,6 +2360,8 @@ class PythonExplicitSilenceDetector(ViolationDetector[PythonExplicitSilenceConfi
 class PythonTodoStubDetector(ViolationDetector[PythonTodoStubConfig]):
     """Detects TODO, FIXME, HACK, and XXX comments left in source code."""
 
+    _TODO_COMMENT_RE = re.compile(r"#\s*(TODO|FIXME|HACK|XXX)\b")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2388,7 +2385,7 @@ class PythonTodoStubDetector(ViolationDetector[PythonTodoStubConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"#\s*(TODO|FIXME|HACK|XXX)\b", context.code):
+        if self._TODO_COMMENT_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -2402,6 +2399,8 @@ class PythonTodoStubDetector(ViolationDetector[PythonTodoStubConfig]):
 class PythonPrematureImplDetector(ViolationDetector[PythonPrematureImplConfig]):
     """Detects ``raise NotImplementedError`` stubs without documentation."""
 
+    _NOT_IMPLEMENTED_RE = re.compile(r"raise\s+NotImplementedError")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2425,7 +2424,7 @@ class PythonPrematureImplDetector(ViolationDetector[PythonPrematureImplConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"raise\s+NotImplementedError", context.code):
+        if self._NOT_IMPLEMENTED_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -2441,6 +2440,10 @@ class PythonComplexUndocumentedDetector(
 ):
     """Detects functions missing docstrings."""
 
+    _UNDOCUMENTED_DEF_RE = re.compile(
+        r"def\s+(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:\s*\n(?!\s*(\"\"\"|'''))",
+    )
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2465,10 +2468,7 @@ class PythonComplexUndocumentedDetector(
             list[Violation]: Detected violations.
         """
         violations: list[Violation] = []
-        pattern = re.compile(
-            r"def\s+(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:\s*\n(?!\s*(\"\"\"|'''))",
-        )
-        for match in pattern.finditer(context.code):
+        for match in self._UNDOCUMENTED_DEF_RE.finditer(context.code):
             fn_name = match.group(1)
             violations.append(
                 self.build_violation(
@@ -2483,6 +2483,10 @@ class PythonComplexUndocumentedDetector(
 class PythonSimpleDocumentedDetector(ViolationDetector[PythonSimpleDocumentedConfig]):
     """Detects public functions (not starting with ``_``) missing docstrings."""
 
+    _UNDOCUMENTED_PUBLIC_DEF_RE = re.compile(
+        r"def\s+(?!_)(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:\s*\n(?!\s*(\"\"\"|'''))",
+    )
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2507,10 +2511,7 @@ class PythonSimpleDocumentedDetector(ViolationDetector[PythonSimpleDocumentedCon
             list[Violation]: Detected violations.
         """
         violations: list[Violation] = []
-        pattern = re.compile(
-            r"def\s+(?!_)(\w+)\s*\([^)]*\)\s*(?:->\s*[^:]+)?:\s*\n(?!\s*(\"\"\"|'''))",
-        )
-        for match in pattern.finditer(context.code):
+        for match in self._UNDOCUMENTED_PUBLIC_DEF_RE.finditer(context.code):
             fn_name = match.group(1)
             violations.append(
                 self.build_violation(
@@ -2525,6 +2526,9 @@ class PythonSimpleDocumentedDetector(ViolationDetector[PythonSimpleDocumentedCon
 class PythonIdiomDetector(ViolationDetector[PythonIdiomConfig]):
     """Detects non-idiomatic Python patterns like ``range(len(...))`` and ``== True``."""
 
+    _RANGE_LEN_RE = re.compile(r"range\s*\(\s*len\s*\(")
+    _BOOL_COMPARISON_RE = re.compile(r"==\s*True\b|==\s*False\b")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -2549,7 +2553,7 @@ class PythonIdiomDetector(ViolationDetector[PythonIdiomConfig]):
             list[Violation]: Detected violations.
         """
         violations: list[Violation] = []
-        if re.search(r"range\s*\(\s*len\s*\(", context.code):
+        if self._RANGE_LEN_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -2557,7 +2561,7 @@ class PythonIdiomDetector(ViolationDetector[PythonIdiomConfig]):
                     suggestion="Use enumerate() instead of range(len()).",
                 ),
             )
-        if re.search(r"==\s*True\b|==\s*False\b", context.code):
+        if self._BOOL_COMPARISON_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -50,6 +50,8 @@ class RubyNamingConventionDetector(
         Only catches ``def UpperCase`` patterns; does not inspect local variables.
     """
 
+    _CAPITALIZED_DEF_RE = re.compile(r"def\s+[A-Z]")
+
     @property
     def name(self) -> str:
         """Return ``'ruby_naming_convention'`` for registry wiring.
@@ -81,7 +83,7 @@ class RubyNamingConventionDetector(
                 suggestion="Use snake_case for method names.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"def\s+[A-Z]", line)
+            if self._CAPITALIZED_DEF_RE.search(line)
         ]
         return violations
 
@@ -253,6 +255,10 @@ class RubyMonkeyPatchDetector(
         extensions to core classes.
     """
 
+    _CORE_CLASS_REOPEN_RE = re.compile(
+        r"^\s*class\s+(String|Array|Hash|Integer|Float)\b"
+    )
+
     @property
     def name(self) -> str:
         """Return ``'ruby_monkey_patch'`` for registry wiring.
@@ -277,7 +283,6 @@ class RubyMonkeyPatchDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        pattern = re.compile(r"^\s*class\s+(String|Array|Hash|Integer|Float)\b")
         violations.extend(
             self.build_violation(
                 config,
@@ -286,7 +291,7 @@ class RubyMonkeyPatchDetector(
                 suggestion="Avoid monkey-patching Ruby core classes.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if pattern.search(line)
+            if self._CORE_CLASS_REOPEN_RE.search(line)
         )
         return violations
 
@@ -304,6 +309,8 @@ class RubyMethodNamingDetector(
     undermining Ruby's expressive readability.
     """
 
+    _METHOD_NAME_RE = re.compile(r"\bdef\s+([a-zA-Z_]\w*)")
+
     @property
     def name(self) -> str:
         """Return ``'ruby_method_naming'`` for registry wiring.
@@ -329,7 +336,7 @@ class RubyMethodNamingDetector(
         """
         violations: list[Violation] = []
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.search(r"\bdef\s+([a-zA-Z_]\w*)", line)
+            match = self._METHOD_NAME_RE.search(line)
             if not match:
                 continue
             name = match[1]
@@ -357,6 +364,8 @@ class RubySymbolKeysDetector(
     unfamiliarity with Ruby's modern hash syntax introduced in Ruby 1.9.
     """
 
+    _STRING_HASH_KEY_RE = re.compile(r"['\"][^'\"]+['\"]\s*=>")
+
     @property
     def name(self) -> str:
         """Return ``'ruby_symbol_keys'`` for registry wiring.
@@ -388,7 +397,7 @@ class RubySymbolKeysDetector(
                 suggestion="Use symbols for hash keys.",
             )
             for idx, line in enumerate(context.code.splitlines(), start=1)
-            if re.search(r"['\"][^'\"]+['\"]\s*=>", line)
+            if self._STRING_HASH_KEY_RE.search(line)
         ]
         return violations
 
@@ -405,6 +414,8 @@ class RubyGuardClauseDetector(
     dramatically easier to read and maintain.
     """
 
+    _GUARD_RETURN_RE = re.compile(r"\breturn\s+(if|unless)\b")
+
     @property
     def name(self) -> str:
         """Return ``'ruby_guard_clause'`` for registry wiring.
@@ -429,7 +440,7 @@ class RubyGuardClauseDetector(
             list[Violation]: Violations detected for the analyzed context.
         """
         code = context.code
-        if "if " in code and not re.search(r"\breturn\s+(if|unless)\b", code):
+        if "if " in code and not self._GUARD_RETURN_RE.search(code):
             return [
                 self.build_violation(
                     config,
@@ -517,6 +528,8 @@ class RubyExpressiveSyntaxDetector(
     signals unfamiliarity with Ruby's expressive design philosophy.
     """
 
+    _FOR_IN_LOOP_RE = re.compile(r"^\s*for\s+\w+\s+in\s+")
+
     @property
     def name(self) -> str:
         """Return ``'ruby_expressive_syntax'`` for registry wiring.
@@ -551,7 +564,7 @@ class RubyExpressiveSyntaxDetector(
                     ),
                 ]
                 for idx, line in enumerate(context.code.splitlines(), start=1)
-                if re.search(r"^\s*for\s+\w+\s+in\s+", line) or "unless !" in line
+                if self._FOR_IN_LOOP_RE.search(line) or "unless !" in line
             ),
             [],
         )
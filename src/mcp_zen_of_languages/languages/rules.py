@@ -15,6 +15,8 @@ from __future__ import annotations
 
 import re
 
+from functools import lru_cache
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.analyzers.base import LocationHelperMixin
 from mcp_zen_of_languages.analyzers.base import ViolationDetector
@@ -23,6 +25,19 @@ from mcp_zen_of_languages.models import Location
 from mcp_zen_of_languages.models import Violation
 
 
+@lru_cache(maxsize=512)
+def _compile_rule_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a ``re:`` rule pattern once and reuse it across ``detect`` calls.
+
+    Args:
+        pattern (str): Regex source taken from ``detectable_patterns`` without the ``re:`` prefix.
+
+    Returns:
+        re.Pattern[str]: Pattern compiled with ``MULTILINE`` and ``DOTALL``.
+    """
+    return re.compile(pattern, re.MULTILINE | re.DOTALL)
+
+
 class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin):
     """Multi-strategy detector that applies configurable text patterns and structural checks.
 
@@ -34,6 +49,18 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
     across languages that share common heuristics.
     """
 
+    _FUNCTION_DEFINITION_RE = re.compile(
+        r"^\s*(function\s+\w+|\w+\s*\(\)\s*\{)",
+        re.MULTILINE,
+    )
+    _SHELL_ASSIGNMENT_RE = re.compile(r"\s*([a-zA-Z_][a-zA-Z0-9_]*)=")
+    _EXTENDS_RE = re.compile(r"class\s+(\w+)\s+extends\s+(\w+)")
+    _DECLARATION_RE = re.compile(r"\b(?:const|let|var|function|class)\s+([A-Za-z_]\w*)")
+    _PASCAL_CASE_RE = re.compile(r"^[A-Z][A-Za-z0-9]*$")
+    _CAMEL_CASE_RE = re.compile(r"^_?[a-z][A-Za-z0-9]*$")
+    _PUBLIC_MEMBER_RE = re.compile(r"\bpublic\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)")
+    _PRIVATE_MEMBER_RE = re.compile(r"\bprivate\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)")
+
     @property
     def name(self) -> str:
         """Return ``'rule_pattern'`` identifying the generic pattern detector.
@@ -130,7 +157,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
             list[Violation]: A single violation when the required pattern is missing.
         """
         if is_regex:
-            if not re.search(regex_pattern, context.code, re.MULTILINE | re.DOTALL):
+            if not _compile_rule_pattern(regex_pattern).search(context.code):
                 return [
                     self.build_violation(
                         config,
@@ -167,7 +194,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         Returns:
             list[Violation]: A single violation at the first match position.
         """
-        if match := re.search(regex_pattern, context.code, re.MULTILINE | re.DOTALL):
+        if match := _compile_rule_pattern(regex_pattern).search(context.code):
             line, column = self._line_and_column_for_offset(
                 context.code,
                 match.start(),
@@ -198,17 +225,18 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         Returns:
             list[Violation]: A single violation at the first matching line.
         """
-        for idx, line in enumerate(context.code.splitlines(), start=1):
-            if needle in line:
-                return [
-                    self.build_violation(
-                        config,
-                        contains=needle,
-                        location=Location(line=idx, column=line.find(needle) + 1),
-                        suggestion=config.recommended_alternative,
-                    )
-                ]
-        return []
+        offset = context.code.find(needle)
+        if offset == -1:
+            return []
+        line, column = self._line_and_column_for_offset(context.code, offset)
+        return [
+            self.build_violation(
+                config,
+                contains=needle,
+                location=Location(line=line, column=column),
+                suggestion=config.recommended_alternative,
+            )
+        ]
 
     def _line_and_column_for_offset(self, code: str, offset: int) -> tuple[int, int]:
         """Convert a character offset into 1-based line and column numbers."""
@@ -235,11 +263,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         if max_length is None:
             return []
         lines = context.code.splitlines()
-        has_function = re.search(
-            r"^\s*(function\s+\w+|\w+\s*\(\)\s*\{)",
-            context.code,
-            re.MULTILINE,
-        )
+        has_function = self._FUNCTION_DEFINITION_RE.search(context.code)
         if len(lines) > max_length and not has_function:
             return [
                 self.build_violation(
@@ -268,7 +292,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         if min_length is None:
             return []
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            match = re.match(r"\s*([a-zA-Z_][a-zA-Z0-9_]*)=", line)
+            match = self._SHELL_ASSIGNMENT_RE.match(line)
             if not match:
                 continue
             name = match[1]
@@ -301,7 +325,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         if max_depth is None:
             return []
         parents: dict[str, str] = {}
-        for match in re.finditer(r"class\s+(\w+)\s+extends\s+(\w+)", context.code):
+        for match in self._EXTENDS_RE.finditer(context.code):
             parents[match.group(1)] = match.group(2)
 
         def chain_depth(name: str) -> int:
@@ -349,9 +373,8 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
         min_length = getattr(config, "min_identifier_length", None)
         if min_length is None:
             return []
-        pattern = re.compile(r"\b(?:const|let|var|function|class)\s+([A-Za-z_]\w*)")
         for idx, line in enumerate(context.code.splitlines(), start=1):
-            for match in pattern.finditer(line):
+            for match in self._DECLARATION_RE.finditer(line):
                 name = match.group(1)
                 if len(name) < min_length and name not in {"i", "j", "k"}:
                     return [
@@ -395,14 +418,14 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
             """
             style_lower = style.lower()
             if "pascal" in style_lower:
-                return bool(re.match(r"^[A-Z][A-Za-z0-9]*$", name))
+                return bool(self._PASCAL_CASE_RE.match(name))
             if "camel" in style_lower:
-                return bool(re.match(r"^_?[a-z][A-Za-z0-9]*$", name))
+                return bool(self._CAMEL_CASE_RE.match(name))
             return True
 
         for idx, line in enumerate(context.code.splitlines(), start=1):
             if public_naming:
-                match = re.search(r"\bpublic\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)", line)
+                match = self._PUBLIC_MEMBER_RE.search(line)
                 if match and not matches_style(match[1], public_naming):
                     return [
                         self.build_violation(
@@ -413,7 +436,7 @@ class RulePatternDetector(ViolationDetector[DetectorConfig], LocationHelperMixin
                         ),
                     ]
             if private_naming:
-                match = re.search(r"\bprivate\s+\w[\w<>,\s]*\s+([A-Za-z_]\w*)", line)
+                match = self._PRIVATE_MEMBER_RE.search(line)
                 if match and not matches_style(match.group(1), private_naming):
                     return [
                         self.build_violation(
@@ -43,6 +43,8 @@ class RustUnwrapUsageDetector(ViolationDetector[RustUnwrapUsageConfig]):
     exceed the configured maximum.
     """
 
+    _UNWRAP_RE = re.compile(r"\.unwrap\s*\(|\.expect\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -67,7 +69,7 @@ class RustUnwrapUsageDetector(ViolationDetector[RustUnwrapUsageConfig]):
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        count = len(re.findall(r"\.unwrap\s*\(|\.expect\s*\(", context.code))
+        count = len(self._UNWRAP_RE.findall(context.code))
         if count > config.max_unwraps:
             violations.append(
                 self.build_violation(
@@ -90,6 +92,8 @@ class RustUnsafeBlocksDetector(ViolationDetector[RustUnsafeBlocksConfig]):
     for the required safety justification, skipping commented-out code.
     """
 
+    _UNSAFE_RE = re.compile(r"\bunsafe\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -118,7 +122,7 @@ class RustUnsafeBlocksDetector(ViolationDetector[RustUnsafeBlocksConfig]):
         violations: list[Violation] = []
         lines = context.code.splitlines()
         for idx, line in enumerate(lines):
-            if not re.search(r"\bunsafe\b", line):
+            if not self._UNSAFE_RE.search(line):
                 continue
             if line.strip().startswith("//"):
                 continue
@@ -149,6 +153,8 @@ class RustCloneOverheadDetector(ViolationDetector[RustCloneOverheadConfig]):
     configured ceiling.
     """
 
+    _CLONE_RE = re.compile(r"\.clone\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -173,7 +179,7 @@ class RustCloneOverheadDetector(ViolationDetector[RustCloneOverheadConfig]):
             list[Violation]: Violations detected for the analyzed context.
         """
         violations: list[Violation] = []
-        count = len(re.findall(r"\.clone\s*\(", context.code))
+        count = len(self._CLONE_RE.findall(context.code))
         if count > config.max_clone_calls:
             violations.append(
                 self.build_violation(
@@ -196,6 +202,10 @@ class RustErrorHandlingDetector(ViolationDetector[RustErrorHandlingConfig]):
     recover.  This detector checks both conditions via regex scans.
     """
 
+    _RESULT_TYPE_RE = re.compile(r"\bResult<")
+    _PANIC_RE = re.compile(r"\bpanic!\s*\(")
+    _TRY_OPERATOR_RE = re.compile(r"\?")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -222,8 +232,8 @@ class RustErrorHandlingDetector(ViolationDetector[RustErrorHandlingConfig]):
         violations: list[Violation] = []
         if (
             config.detect_unhandled_results
-            and re.search(r"\bResult<", context.code)
-            and not re.search(r"\?", context.code)
+            and self._RESULT_TYPE_RE.search(context.code)
+            and not self._TRY_OPERATOR_RE.search(context.code)
         ):
             violations.append(
                 self.build_violation(
@@ -233,7 +243,7 @@ class RustErrorHandlingDetector(ViolationDetector[RustErrorHandlingConfig]):
                     suggestion="Propagate errors with ? or handle Result explicitly.",
                 ),
             )
-        panic_count = len(re.findall(r"\bpanic!\s*\(", context.code))
+        panic_count = len(self._PANIC_RE.findall(context.code))
         if panic_count > config.max_panics:
             violations.append(
                 self.build_violation(
@@ -257,6 +267,8 @@ class RustTypeSafetyDetector(ViolationDetector[RustTypeSafetyConfig]):
     them in dedicated newtypes or enums.
     """
 
+    _STRUCT_BODY_RE = re.compile(r"struct\s+\w+\s*\{(?P<body>[^}]*)\}", re.DOTALL)
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -284,8 +296,7 @@ class RustTypeSafetyDetector(ViolationDetector[RustTypeSafetyConfig]):
         types_pattern = "|".join(re.escape(t) for t in config.primitive_types)
         if not types_pattern:
             return violations
-        struct_pattern = re.compile(r"struct\s+\w+\s*\{(?P<body>[^}]*)\}", re.DOTALL)
-        for match in struct_pattern.finditer(context.code):
+        for match in self._STRUCT_BODY_RE.finditer(context.code):
             body = match.group("body")
             if type_match := re.search(rf":\s*(?P<typ>{types_pattern})\b", body):
                 violations.append(
@@ -314,6 +325,9 @@ class RustIteratorPreferenceDetector(ViolationDetector[RustIteratorPreferenceCon
     transformations instead.
     """
 
+    _FOR_LOOP_RE = re.compile(r"\bfor\s+\w+\s+in\b")
+    _WHILE_LOOP_RE = re.compile(r"\bwhile\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -337,8 +351,8 @@ class RustIteratorPreferenceDetector(ViolationDetector[RustIteratorPreferenceCon
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        loop_count = len(re.findall(r"\bfor\s+\w+\s+in\b", context.code)) + len(
-            re.findall(r"\bwhile\b", context.code),
+        loop_count = len(self._FOR_LOOP_RE.findall(context.code)) + len(
+            self._WHILE_LOOP_RE.findall(context.code),
         )
         if loop_count > config.max_loops:
             return [
@@ -502,6 +516,8 @@ class RustStdTraitsDetector(ViolationDetector[RustStdTraitsConfig]):
     blocks for any of these key traits.
     """
 
+    _STD_TRAIT_IMPL_RE = re.compile(r"impl\s+(From|Into|Default|Display)")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -525,9 +541,8 @@ class RustStdTraitsDetector(ViolationDetector[RustStdTraitsConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if "struct" in context.code and not re.search(
-            r"impl\s+(From|Into|Default|Display)",
-            context.code,
+        if "struct" in context.code and not self._STD_TRAIT_IMPL_RE.search(
+            context.code
         ):
             return [
                 self.build_violation(
@@ -551,6 +566,8 @@ class RustEnumOverBoolDetector(ViolationDetector[RustEnumOverBoolConfig]):
     exceed the configured maximum.
     """
 
+    _BOOL_FIELD_RE = re.compile(r":\s*bool\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -574,7 +591,7 @@ class RustEnumOverBoolDetector(ViolationDetector[RustEnumOverBoolConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        bool_fields = len(re.findall(r":\s*bool\b", context.code))
+        bool_fields = len(self._BOOL_FIELD_RE.findall(context.code))
         if bool_fields > config.max_bool_fields:
             return [
                 self.build_violation(
@@ -598,6 +615,9 @@ class RustLifetimeUsageDetector(ViolationDetector[RustLifetimeUsageConfig]):
     threshold.
     """
 
+    _LIFETIME_RE = re.compile(r"<\s*'\w+")
+    _STATIC_LIFETIME_RE = re.compile(r"'static")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -621,8 +641,8 @@ class RustLifetimeUsageDetector(ViolationDetector[RustLifetimeUsageConfig]):
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        lifetimes = len(re.findall(r"<\s*'\w+", context.code)) + len(
-            re.findall(r"'static", context.code),
+        lifetimes = len(self._LIFETIME_RE.findall(context.code)) + len(
+            self._STATIC_LIFETIME_RE.findall(context.code),
         )
         if lifetimes > config.max_explicit_lifetimes:
             return [
@@ -647,6 +667,8 @@ class RustInteriorMutabilityDetector(ViolationDetector[RustInteriorMutabilityCon
     flags their presence.
     """
 
+    _INTERIOR_MUTABILITY_RE = re.compile(r"Rc<\s*RefCell|Arc<\s*Mutex")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -670,7 +692,7 @@ class RustInteriorMutabilityDetector(ViolationDetector[RustInteriorMutabilityCon
         Returns:
             list[Violation]: Violations detected for the analyzed context.
         """
-        if re.search(r"Rc<\s*RefCell|Arc<\s*Mutex", context.code):
+        if self._INTERIOR_MUTABILITY_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -690,6 +712,8 @@ class RustSendSyncDetector(ViolationDetector[RustSendSyncConfig]):
     justification.
     """
 
+    _UNSAFE_SEND_SYNC_RE = re.compile(r"unsafe\s+impl\s+(Send|Sync)")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -716,7 +740,7 @@ class RustSendSyncDetector(ViolationDetector[RustSendSyncConfig]):
         lines = context.code.splitlines()
         violations: list[Violation] = []
         for i, line in enumerate(lines):
-            if re.search(r"unsafe\s+impl\s+(Send|Sync)", line):
+            if self._UNSAFE_SEND_SYNC_RE.search(line):
                 prev = lines[i - 1].strip() if i > 0 else ""
                 if "SAFETY:" not in prev:
                     violations.append(
@@ -736,6 +760,9 @@ class RustErrorTraitsDetector(ViolationDetector[RustErrorTraitsConfig]):
     and ``Display`` so they integrate with the standard error ecosystem.
     """
 
+    _ERROR_TYPE_RE = re.compile(r"(struct|enum)\s+\w*Error")
+    _ERROR_IMPL_RE = re.compile(r"impl.*(std::error::Error|Error\s+for)")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -759,9 +786,8 @@ class RustErrorTraitsDetector(ViolationDetector[RustErrorTraitsConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"(struct|enum)\s+\w*Error", context.code) and not re.search(
-            r"impl.*(std::error::Error|Error\s+for)",
-            context.code,
+        if self._ERROR_TYPE_RE.search(context.code) and not self._ERROR_IMPL_RE.search(
+            context.code
         ):
             return [
                 self.build_violation(
@@ -779,6 +805,8 @@ class RustNamingDetector(ViolationDetector[RustNamingConfig]):
     RFC 430 mandates ``snake_case`` for function names in Rust.
     """
 
+    _CAMEL_CASE_FN_RE = re.compile(r"fn\s+[a-z]+[A-Z]")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -802,7 +830,7 @@ class RustNamingDetector(ViolationDetector[RustNamingConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(r"fn\s+[a-z]+[A-Z]", context.code):
+        if self._CAMEL_CASE_FN_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
@@ -820,6 +848,9 @@ class RustDefaultImplDetector(ViolationDetector[RustDefaultImplConfig]):
     ``Default`` so callers can construct them ergonomically.
     """
 
+    _PUB_STRUCT_RE = re.compile(r"pub\s+struct\s+\w+")
+    _DERIVE_DEFAULT_RE = re.compile(r"#\[derive\(.*Default")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -846,9 +877,9 @@ class RustDefaultImplDetector(ViolationDetector[RustDefaultImplConfig]):
         violations: list[Violation] = []
         lines = context.code.splitlines()
         for i, line in enumerate(lines):
-            if re.search(r"pub\s+struct\s+\w+", line):
+            if self._PUB_STRUCT_RE.search(line):
                 preceding = "\n".join(lines[max(0, i - 5) : i])
-                if not re.search(r"#\[derive\(.*Default", preceding):
+                if not self._DERIVE_DEFAULT_RE.search(preceding):
                     violations.append(
                         self.build_violation(
                             config,
@@ -866,6 +897,9 @@ class RustFromIntoDetector(ViolationDetector[RustFromIntoConfig]):
     rather than standalone ``from_*``/``to_*``/``into_*`` functions.
     """
 
+    _CONVERSION_FN_RE = re.compile(r"fn\s+(from_\w+|to_\w+|into_\w+)\s*\(")
+    _FROM_IMPL_RE = re.compile(r"impl\s+From")
+
     @property
     def name(self) -> str:
         """Return detector identifier.
@@ -889,10 +923,9 @@ class RustFromIntoDetector(ViolationDetector[RustFromIntoConfig]):
         Returns:
             list[Violation]: Detected violations.
         """
-        if re.search(
-            r"fn\s+(from_\w+|to_\w+|into_\w+)\s*\(",
-            context.code,
-        ) and not re.search(r"impl\s+From", context.code):
+        if self._CONVERSION_FN_RE.search(
+            context.code
+        ) and not self._FROM_IMPL_RE.search(context.code):
             return [
                 self.build_violation(
                     config,
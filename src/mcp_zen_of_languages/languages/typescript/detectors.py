@@ -419,6 +419,8 @@ class TsNonNullAssertionDetector(
     patterns and flags files that exceed the configured limit.
     """
 
+    _CHAINED_NON_NULL_RE = re.compile(r"\w+!\.\w+!")
+
     @property
     def name(self) -> str:
         """Return the detector identifier used by registry wiring.
@@ -444,7 +446,7 @@ class TsNonNullAssertionDetector(
         """
         violations: list[Violation] = []
         finding = detect_ts_non_null_assertions(context.code)
-        chain_count = len(re.findall(r"\w+!\.\w+!", context.code))
+        chain_count = len(self._CHAINED_NON_NULL_RE.findall(context.code))
         if finding.count + chain_count > config.max_non_null_assertions:
             violations.append(
                 self.build_violation(
@@ -951,6 +953,10 @@ class TsForOfDetector(
 ):
     """Detects C-style index-based ``for`` loops encouraging ``for...of`` iteration."""
 
+    _INDEXED_FOR_LOOP_RE = re.compile(
+        r"for\s*\(\s*(let|var|const)\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*\w+\.length"
+    )
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -975,10 +981,7 @@ class TsForOfDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(
-            r"for\s*\(\s*(let|var|const)\s+\w+\s*=\s*0\s*;\s*\w+\s*<\s*\w+\.length",
-            context.code,
-        ):
+        if self._INDEXED_FOR_LOOP_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -995,6 +998,8 @@ class TsImportOrderDetector(
 ):
     """Detects CommonJS ``require()`` calls mixed with ES module imports."""
 
+    _REQUIRE_RE = re.compile(r"\brequire\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -1019,7 +1024,7 @@ class TsImportOrderDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(r"\brequire\s*\(", context.code):
+        if self._REQUIRE_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -1036,6 +1041,8 @@ class TsNamedExportDetector(
 ):
     """Detects ``export default`` usages encouraging named exports."""
 
+    _DEFAULT_EXPORT_RE = re.compile(r"\bexport\s+default\b")
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -1060,7 +1067,7 @@ class TsNamedExportDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(r"\bexport\s+default\b", context.code):
+        if self._DEFAULT_EXPORT_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -1077,6 +1084,8 @@ class TsNoConsoleDetector(
 ):
     """Detects ``console.*`` calls in production code."""
 
+    _CONSOLE_CALL_RE = re.compile(r"\bconsole\.(log|error|warn|debug|info)\s*\(")
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -1101,7 +1110,7 @@ class TsNoConsoleDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(r"\bconsole\.(log|error|warn|debug|info)\s*\(", context.code):
+        if self._CONSOLE_CALL_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -1118,6 +1127,8 @@ class TsObjectTypeDetector(
 ):
     """Detects generic ``Object``/``object``/``{}`` type annotations."""
 
+    _OBJECT_TYPE_RE = re.compile(r":\s*(Object|object|\{\s*\})(\s|;|,|\))")
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -1142,7 +1153,7 @@ class TsObjectTypeDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(r":\s*(Object|object|\{\s*\})(\s|;|,|\))", context.code):
+        if self._OBJECT_TYPE_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
@@ -1159,6 +1170,8 @@ class TsTemplateLiteralDetector(
 ):
     """Detects string concatenation patterns encouraging template literals."""
 
+    _STRING_CONCAT_RE = re.compile(r"""["']\s*\+\s*\w+\s*\+\s*["']""")
+
     @property
     def name(self) -> str:
         """Return the detector identifier.
@@ -1183,7 +1196,7 @@ class TsTemplateLiteralDetector(
             list[Violation]: Violations found.
         """
         violations: list[Violation] = []
-        if re.search(r"""["']\s*\+\s*\w+\s*\+\s*["']""", context.code):
+        if self._STRING_CONCAT_RE.search(context.code):
             violations.append(
                 self.build_violation(
                     config,
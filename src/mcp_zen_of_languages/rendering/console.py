@@ -13,6 +13,7 @@ A module-level ``_QUIET`` flag lets the CLI suppress decorative output
 
 from __future__ import annotations
 
+import functools
 import os
 import sys
 
@@ -79,13 +80,15 @@ ZEN_BANNER = r"""
 _ZEN_SUBTITLE = "of Languages"
 
 
+@functools.lru_cache(maxsize=1)
 def _render_banner_art() -> str:
     """Compose the ASCII-art banner, optionally enhanced by pyfiglet.
 
     Attempts to render *Zen* in the ``slant`` font at 55 columns.
     Falls back to the hard-coded ``ZEN_BANNER`` constant when pyfiglet
     is unavailable.  Returns only the art block — callers are
-    responsible for appending the *"of Languages"* subtitle.
+    responsible for appending the *"of Languages"* subtitle.  The art
+    never changes within a process, so it is rendered once and cached.
 
     Returns:
         str: Multi-line ASCII art string.
@@ -62,6 +62,25 @@ BOX_CONTENT = box.ROUNDED
 BOX_ACTION = box.SIMPLE
 BOX_CODE = box.SQUARE
 
+_SEVERITY_LABELS = {
+    "severity.critical": "CRIT",
+    "severity.high": "HIGH",
+    "severity.medium": "MED",
+    "severity.low": "LOW",
+}
+_EMOJI_SEVERITY_GLYPHS = {
+    "severity.critical": "🔴",
+    "severity.high": "🟠",
+    "severity.medium": "🔵",
+    "severity.low": "⚪",
+}
+_ASCII_SEVERITY_GLYPHS = {
+    "severity.critical": "●",
+    "severity.high": "▲",
+    "severity.medium": "◆",
+    "severity.low": "○",
+}
+
 
 def severity_style(severity: int) -> str:
     """Map a numeric severity score (1-10) to a Rich style token.
@@ -102,30 +121,14 @@ def severity_badge(severity: int) -> str:
     Returns:
         str: Rich markup string that renders as a coloured badge when printed.
     """
-    if severity >= SEVERITY_CRITICAL:
-        style, label = "severity.critical", "CRIT"
-    elif severity >= SEVERITY_HIGH:
-        style, label = "severity.high", "HIGH"
-    elif severity >= SEVERITY_MEDIUM:
-        style, label = "severity.medium", "MED"
-    else:
-        style, label = "severity.low", "LOW"
-    glyphs = (
-        {
-            "severity.critical": "🔴",
-            "severity.high": "🟠",
-            "severity.medium": "🔵",
-            "severity.low": "⚪",
-        }
-        if _use_emoji()
-        else {
-            "severity.critical": "●",
-            "severity.high": "▲",
-            "severity.medium": "◆",
-            "severity.low": "○",
-        }
-    )
-    return f"[{style}]{glyphs[style]} {label}[/]"
+    return _render_severity_badge(severity_style(severity), use_emoji=_use_emoji())
+
+
+@lru_cache(maxsize=8)
+def _render_severity_badge(style: str, *, use_emoji: bool) -> str:
+    """Build the badge markup for one severity tier and glyph set."""
+    glyphs = _EMOJI_SEVERITY_GLYPHS if use_emoji else _ASCII_SEVERITY_GLYPHS
+    return f"[{style}]{glyphs[style]} {_SEVERITY_LABELS[style]}[/]"
 
 
 def pass_fail_glyph(*, passed: bool) -> str:
@@ -419,11 +419,13 @@ def detect_deep_nesting(code: str, max_depth: int = 3) -> tuple[bool, int]:
         tuple[bool, int]: ``(exceeds_threshold, deepest_level)`` — the boolean is ``True``
         when *deepest_level* is strictly greater than *max_depth*.
     """
-    max_found = 0
-    for line in code.splitlines():
-        stripped = line.lstrip("\t ")
-        depth = (len(line) - len(stripped)) // 4
-        max_found = max(max_found, depth)
+    max_found = (
+        max(
+            (len(line) - len(line.lstrip("\t ")) for line in code.splitlines()),
+            default=0,
+        )
+        // 4
+    )
     return (max_found > max_depth, max_found)
 
 
@@ -181,6 +181,64 @@ TESTING_FAMILY_DESCRIPTORS: tuple[TestingFamilyDescriptor, ...] = (
 )
 
 
+@dataclass(frozen=True, slots=True)
+class ContentHeuristic:
+    """Describe one keyword heuristic used by content-based language detection."""
+
+    language: str
+    confidence: float
+    keyword_groups: tuple[tuple[str, ...], ...]
+    case_sensitive: bool = False
+
+    def matches(self, hits: set[str]) -> bool:
+        """Return whether every keyword group has at least one keyword in *hits*."""
+        return all(not hits.isdisjoint(group) for group in self.keyword_groups)
+
+
+CONTENT_HEURISTICS: tuple[ContentHeuristic, ...] = (
+    ContentHeuristic("django", 0.9, (("from django", "import django"),)),
+    ContentHeuristic("fastapi", 0.9, (("from fastapi", "import fastapi"),)),
+    ContentHeuristic("sqlalchemy", 0.88, (("from sqlalchemy", "import sqlalchemy"),)),
+    ContentHeuristic("pydantic", 0.88, (("from pydantic", "import pydantic"),)),
+    ContentHeuristic("vue", 0.86, (("<template",), ("defineprops", "v-for"))),
+    ContentHeuristic("nextjs", 0.86, (("from 'next/", 'from "next/'),)),
+    ContentHeuristic("angular", 0.85, (("@component(", "@ngmodule(", "@angular/"),)),
+    ContentHeuristic("react", 0.82, (("usestate(", "useeffect("),)),
+    ContentHeuristic("python", 0.9, (("def ",),), case_sensitive=True),
+    ContentHeuristic(
+        "typescript",
+        0.85,
+        (("interface ", "=>", "function "),),
+        case_sensitive=True,
+    ),
+    ContentHeuristic("javascript", 0.8, (("const ", "let "),), case_sensitive=True),
+)
+
+
+def _keyword_pattern(*, case_sensitive: bool) -> re.Pattern[str]:
+    keywords = {
+        keyword
+        for heuristic in CONTENT_HEURISTICS
+        if heuristic.case_sensitive is case_sensitive
+        for group in heuristic.keyword_groups
+        for keyword in group
+    }
+    alternation = "|".join(
+        re.escape(keyword) for keyword in sorted(keywords, key=len, reverse=True)
+    )
+    return re.compile(alternation, 0 if case_sensitive else re.IGNORECASE)
+
+
+_FOLDED_KEYWORD_RE = _keyword_pattern(case_sensitive=False)
+_EXACT_KEYWORD_RE = _keyword_pattern(case_sensitive=True)
+_ANSIBLE_HOSTS_RE = re.compile(r"(?m)^\s*-\s*hosts\s*:")
+_ANSIBLE_TASKS_RE = re.compile(r"(?m)^\s*(tasks|handlers|pre_tasks|post_tasks)\s*:")
+_ANSIBLE_PLAY_KEYS_RE = re.compile(r"(?m)^\s*(become|gather_facts|roles)\s*:")
+_ANSIBLE_MODULE_RE = re.compile(
+    r"(?m)^\s*(?:ansible\.builtin\.[a-z_]+|-\s*(?:command|shell))\s*:",
+)
+
+
 def _is_ansible_path(path_obj: Path) -> bool:
     parts = {part.lower() for part in path_obj.parts}
     parent_name = path_obj.parent.name.lower()
@@ -195,17 +253,14 @@ def _is_ansible_path(path_obj: Path) -> bool:
 def _is_ansible_yaml_content(text: str) -> bool:
     lowered = text.lower()
     signals = 0
-    if re.search(r"(?m)^\s*-\s*hosts\s*:", lowered):
-        signals += 1
-    if re.search(r"(?m)^\s*(tasks|handlers|pre_tasks|post_tasks)\s*:", lowered):
-        signals += 1
-    if re.search(r"(?m)^\s*(become|gather_facts|roles)\s*:", lowered):
-        signals += 1
-    if re.search(
-        r"(?m)^\s*(?:ansible\.builtin\.[a-z_]+|-\s*(?:command|shell))\s*:",
-        lowered,
+    for pattern in (
+        _ANSIBLE_HOSTS_RE,
+        _ANSIBLE_TASKS_RE,
+        _ANSIBLE_PLAY_KEYS_RE,
+        _ANSIBLE_MODULE_RE,
     ):
-        signals += 1
+        if pattern.search(lowered):
+            signals += 1
     return signals >= ANSIBLE_SIGNAL_THRESHOLD
 
 
@@ -486,12 +541,14 @@ def detect_language_by_extension(path: str) -> DetectionResult:  # noqa: C901, P
     return DetectionResult(language=lang, confidence=0.95, method="extension")
 
 
-def detect_language_from_content(code: str) -> DetectionResult:  # noqa: C901, PLR0911
+def detect_language_from_content(code: str) -> DetectionResult:
     """Infer the programming language by scanning *code* for characteristic keywords.
 
-    Used as a fallback when no file path is available. The heuristic checks
-    for ``def `` (Python), ``interface``/``=>`` (TypeScript), and ``function``/
-    ``const``/``let`` (JavaScript) in order of decreasing specificity.
+    Used as a fallback when no file path is available. Every keyword in
+    ``CONTENT_HEURISTICS`` is found in a single pass over *code*, then the
+    heuristics are checked in order of decreasing specificity: framework
+    imports first, followed by ``def `` (Python), ``interface``/``=>``
+    (TypeScript), and ``const``/``let`` (JavaScript).
     Confidence scores are lower than extension-based detection to reflect
     the inherent ambiguity of keyword matching.
 
@@ -504,41 +561,15 @@ def detect_language_from_content(code: str) -> DetectionResult:  # noqa: C901, P
         ``method="heuristics"`` and a confidence between 0.1 (unknown)
         and 0.9 (strong keyword match).
     """
-    lowered = code.lower()
     if _is_ansible_yaml_content(code):
         return DetectionResult(language="ansible", confidence=0.85, method="heuristics")
-    if "from django" in lowered or "import django" in lowered:
-        return DetectionResult(language="django", confidence=0.9, method="heuristics")
-    if "from fastapi" in lowered or "import fastapi" in lowered:
-        return DetectionResult(language="fastapi", confidence=0.9, method="heuristics")
-    if "from sqlalchemy" in lowered or "import sqlalchemy" in lowered:
-        return DetectionResult(
-            language="sqlalchemy", confidence=0.88, method="heuristics"
-        )
-    if "from pydantic" in lowered or "import pydantic" in lowered:
-        return DetectionResult(
-            language="pydantic", confidence=0.88, method="heuristics"
-        )
-    if "<template" in lowered and ("defineprops" in lowered or "v-for" in lowered):
-        return DetectionResult(language="vue", confidence=0.86, method="heuristics")
-    if "from 'next/" in lowered or 'from "next/' in lowered:
-        return DetectionResult(language="nextjs", confidence=0.86, method="heuristics")
-    if "@component(" in lowered or "@ngmodule(" in lowered or "@angular/" in lowered:
-        return DetectionResult(language="angular", confidence=0.85, method="heuristics")
-    if "usestate(" in lowered or "useeffect(" in lowered:
-        return DetectionResult(language="react", confidence=0.82, method="heuristics")
-    if "def " in code:
-        return DetectionResult(language="python", confidence=0.9, method="heuristics")
-    if "interface " in code or "=>" in code or "function " in code:
-        return DetectionResult(
-            language="typescript",
-            confidence=0.85,
-            method="heuristics",
-        )
-    if "const " in code or "let " in code:
-        return DetectionResult(
-            language="javascript",
-            confidence=0.8,
-            method="heuristics",
-        )
+    hits = {match.lower() for match in _FOLDED_KEYWORD_RE.findall(code)}
+    hits.update(_EXACT_KEYWORD_RE.findall(code))
+    for heuristic in CONTENT_HEURISTICS:
+        if heuristic.matches(hits):
+            return DetectionResult(
+                language=heuristic.language,
+                confidence=heuristic.confidence,
+                method="heuristics",
+            )
     return DetectionResult(language="unknown", confidence=0.1, method="heuristics")
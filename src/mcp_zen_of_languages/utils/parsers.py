@@ -8,14 +8,14 @@ backend so downstream detectors can adapt their traversal logic accordingly.
 
 from __future__ import annotations
 
+import ast
 import importlib
 
+from functools import lru_cache
 from typing import TYPE_CHECKING
 
 
 if TYPE_CHECKING:
-    from ast import Module
-
     from mcp_zen_of_languages.models import ParserResult
 
 
@@ -57,7 +57,8 @@ def parse_python_with_treesitter(code: str) -> object | None:
         return None
 
 
-def parse_python_with_builtin_ast(code: str) -> Module | None:
+@lru_cache(maxsize=32)
+def parse_python_with_builtin_ast(code: str) -> ast.Module | None:
     """Parse Python source into a stdlib ``ast.Module`` node.
 
     Acts as the reliable fallback when tree-sitter is unavailable.
@@ -65,15 +66,17 @@ def parse_python_with_builtin_ast(code: str) -> Module | None:
     report a parse failure without raising; other exceptions propagate
     to preserve unexpected-error visibility.
 
+    Results are memoised per source text, so the analyzer and any detector
+    that falls back to parsing share one tree for the same code.  Callers
+    must treat the returned tree as read-only.
+
     Args:
         code (str): Python source text to compile into an AST.
 
     Returns:
-        Module | None: An ``ast.Module`` root node on success, or ``None``
+        ast.Module | None: An ``ast.Module`` root node on success, or ``None``
         when the source contains a syntax error.
     """
-    import ast
-
     try:
         return ast.parse(code)
     except SyntaxError:
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.analyzers.base import BaseAnalyzer
 from mcp_zen_of_languages.models import CyclomaticSummary
 from mcp_zen_of_languages.models import Violation
@@ -57,3 +58,24 @@ def test_create_context_sets_repository_imports():
         repository_imports={"sample.py": ["os"]},
     )
     assert context.repository_imports
+
+
+def test_context_lines_are_split_once_and_not_serialized():
+    analyzer = _Analyzer()
+    context = analyzer._create_context(
+        code="a = 1\r\nb = 2\n",
+        path="sample.py",
+        other_files=None,
+        repository_imports=None,
+    )
+    assert context.lines == ("a = 1", "b = 2")
+    assert context.lines is context.lines
+    assert "lines" not in context.model_dump()
+
+
+def test_context_lines_follow_code_changes():
+    context = AnalysisContext(code="a = 1\nb = 2\n", language="python")
+    assert context.lines == ("a = 1", "b = 2")
+    assert context.model_copy(update={"code": "x"}).lines == ("x",)
+    context.code = "c = 3\n"
+    assert context.lines == ("c = 3",)
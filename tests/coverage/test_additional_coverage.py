@@ -76,6 +76,22 @@ def test_detection_pipeline_logs_errors(caplog):
     assert "Error in detector boom" in caplog.text
 
 
+def test_detection_pipeline_skips_opted_in_detectors_on_blank_source():
+    calls: list[str] = []
+
+    class RecordingDetector(PlaceholderDetector):
+        skips_blank_source = True
+
+        def detect(self, context: AnalysisContext, config):
+            calls.append(context.code)
+            return []
+
+    pipeline = DetectionPipeline([RecordingDetector()])
+    pipeline.run(AnalysisContext(code="  \n", language="python"), AnalyzerConfig())
+    pipeline.run(AnalysisContext(code="x = 1\n", language="python"), AnalyzerConfig())
+    assert calls == ["x = 1\n"]
+
+
 def test_pipeline_merge_override_language_mismatch():
     base = PipelineConfig.from_rules("python")
     overrides = PipelineConfig.from_rules("go")
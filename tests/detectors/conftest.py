@@ -0,0 +1,34 @@
+from __future__ import annotations
+
+import ast
+import functools
+
+import pytest
+
+from mcp_zen_of_languages.analyzers.base import AnalysisContext
+from mcp_zen_of_languages.analyzers.base import AstStatus
+from mcp_zen_of_languages.models import ParserResult
+
+
+@functools.cache
+def _parse_python(code: str) -> ast.Module:
+    return ast.parse(code)
+
+
+def _python_context(code: str) -> AnalysisContext:
+    return AnalysisContext(
+        code=code,
+        language="python",
+        ast_tree=ParserResult(type="ast", tree=_parse_python(code)),
+        ast_status=AstStatus.parsed,
+    )
+
+
+@pytest.fixture(scope="session")
+def python_context():
+    """Return a factory for pre-parsed Python contexts.
+
+    Each call builds a fresh ``AnalysisContext``; only the ``ast.parse``
+    result is cached by source text, and detectors do not mutate it.
+    """
+    return _python_context
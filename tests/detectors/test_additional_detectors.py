@@ -5,17 +5,16 @@ from mcp_zen_of_languages.languages.python.detectors import DocstringDetector
 from mcp_zen_of_languages.languages.python.rules import PYTHON_ZEN
 
 
+_PYTHON_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)}
+
+
 def run_detector(detector, code, config):
     ctx = AnalysisContext(code=code, path=None, language="python")
     return detector.detect(ctx, config)
 
 
 def config_for(detector_type: str):
-    return next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)
-        if cfg.type == detector_type
-    )
+    return _PYTHON_CFG_INDEX[detector_type]
 
 
 def test_docstring_detector():
@@ -15,17 +15,17 @@ from mcp_zen_of_languages.languages.python.detectors import StarImportDetector
 from mcp_zen_of_languages.languages.python.rules import PYTHON_ZEN
 
 
+_PYTHON_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)}
+LONG_LINE_CODE = "a = '" + "x" * 120 + "'\n"
+
+
 def run_detector(detector, code, config):
     ctx = AnalysisContext(code=code, path=None, language="python")
     return detector.detect(ctx, config)
 
 
 def config_for(detector_type: str):
-    return next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)
-        if cfg.type == detector_type
-    )
+    return _PYTHON_CFG_INDEX[detector_type]
 
 
 def test_name_style_detector():
@@ -159,9 +159,8 @@ def test_cyclomatic_complexity_detector_name():
 
 
 def test_line_length_detector():
-    code = "a = '" + "x" * 120 + "'\n"
     detector = LineLengthDetector()
-    violations = run_detector(detector, code, config_for("line_length"))
+    violations = run_detector(detector, LONG_LINE_CODE, config_for("line_length"))
     assert any("whitespace" in v.message for v in violations)
 
 
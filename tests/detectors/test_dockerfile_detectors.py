@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import sys
+
+from types import MappingProxyType
+from typing import TYPE_CHECKING
+from typing import Final
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.configs import DockerfileAddInstructionConfig
 from mcp_zen_of_languages.languages.configs import DockerfileDockerignoreConfig
@@ -35,38 +41,48 @@ from mcp_zen_of_languages.languages.dockerfile.detectors import (
 )
 
 
-def test_dockerfile_detectors_emit_expected_violations():
-    code = """FROM ubuntu:latest
-ADD ./app /app
-RUN apt-get update
-RUN apt-get install -y curl
-RUN rm -rf /var/lib/apt/lists/*
-RUN echo done
-RUN echo done-again
-ARG API_KEY=abc
-USER root
-"""
-    context = AnalysisContext(code=code, language="dockerfile")
-
-    assert DockerfileLatestTagDetector().detect(context, DockerfileLatestTagConfig())
-    assert DockerfileNonRootUserDetector().detect(
-        context, DockerfileNonRootUserConfig()
-    )
-    assert DockerfileAddInstructionDetector().detect(
-        context,
-        DockerfileAddInstructionConfig(),
-    )
-    assert DockerfileHealthcheckDetector().detect(
-        context, DockerfileHealthcheckConfig()
-    )
-    assert DockerfileSecretHygieneDetector().detect(
-        context,
-        DockerfileSecretHygieneConfig(),
-    )
-    assert DockerfileLayerDisciplineDetector().detect(
-        context,
+if TYPE_CHECKING:
+    from collections.abc import Mapping
+
+
+_VIOLATING_DOCKERFILE: Final[str] = sys.intern(
+    "FROM ubuntu:latest\n"
+    "ADD ./app /app\n"
+    "RUN apt-get update\n"
+    "RUN apt-get install -y curl\n"
+    "RUN rm -rf /var/lib/apt/lists/*\n"
+    "RUN echo done\n"
+    "RUN echo done-again\n"
+    "ARG API_KEY=abc\n"
+    "USER root\n"
+)
+_COPYING_DOCKERFILE: Final[str] = "FROM alpine:3.20\nCOPY . /app\n"
+_DOCKERFILE_ONLY: Final[Mapping[str, str]] = MappingProxyType(
+    {"Dockerfile": _COPYING_DOCKERFILE},
+)
+_DOCKERIGNORE_FILES: Final[Mapping[str, str]] = MappingProxyType(
+    {".dockerignore": "__pycache__/\n"},
+)
+
+_DOCKERFILE_VIOLATING_CASES = (
+    (DockerfileLatestTagDetector, DockerfileLatestTagConfig()),
+    (DockerfileNonRootUserDetector, DockerfileNonRootUserConfig()),
+    (DockerfileAddInstructionDetector, DockerfileAddInstructionConfig()),
+    (DockerfileHealthcheckDetector, DockerfileHealthcheckConfig()),
+    (DockerfileSecretHygieneDetector, DockerfileSecretHygieneConfig()),
+    (
+        DockerfileLayerDisciplineDetector,
         DockerfileLayerDisciplineConfig(max_run_instructions=3),
-    )
+    ),
+)
+
+
+def test_dockerfile_detectors_emit_expected_violations():
+    assert _VIOLATING_DOCKERFILE is sys.intern(_VIOLATING_DOCKERFILE)
+    context = AnalysisContext(code=_VIOLATING_DOCKERFILE, language="dockerfile")
+
+    for detector_cls, config in _DOCKERFILE_VIOLATING_CASES:
+        assert detector_cls().detect(context, config), detector_cls.__name__
 
 
 def test_dockerfile_multistage_detector_flags_compiled_single_stage():
@@ -83,9 +99,9 @@ def test_dockerfile_multistage_detector_flags_compiled_single_stage():
 
 def test_dockerfile_dockerignore_detector_checks_other_files():
     context = AnalysisContext(
-        code="FROM alpine:3.20\nCOPY . /app\n",
+        code=_COPYING_DOCKERFILE,
         language="dockerfile",
-        other_files={"Dockerfile": "FROM alpine:3.20\nCOPY . /app\n"},
+        other_files=_DOCKERFILE_ONLY,
     )
     violations = DockerfileDockerignoreDetector().detect(
         context,
@@ -94,7 +110,7 @@ def test_dockerfile_dockerignore_detector_checks_other_files():
     assert violations
 
 
-def test_dockerfile_detectors_cover_non_violation_paths_and_names():
+def test_dockerfile_detectors_cover_non_violation_paths():
     clean_context = AnalysisContext(
         code=(
             "FROM golang:1.22 AS build\n"
@@ -105,14 +121,6 @@ def test_dockerfile_detectors_cover_non_violation_paths_and_names():
         ),
         language="dockerfile",
     )
-    assert DockerfileLatestTagDetector().name == "dockerfile-001"
-    assert DockerfileNonRootUserDetector().name == "dockerfile-002"
-    assert DockerfileAddInstructionDetector().name == "dockerfile-003"
-    assert DockerfileHealthcheckDetector().name == "dockerfile-004"
-    assert DockerfileMultiStageDetector().name == "dockerfile-005"
-    assert DockerfileSecretHygieneDetector().name == "dockerfile-006"
-    assert DockerfileLayerDisciplineDetector().name == "dockerfile-007"
-    assert DockerfileDockerignoreDetector().name == "dockerfile-008"
     assert not DockerfileNonRootUserDetector().detect(
         clean_context,
         DockerfileNonRootUserConfig(),
@@ -142,7 +150,7 @@ def test_dockerfile_detectors_cover_non_violation_paths_and_names():
     )
 
     copy_context_without_other_files = AnalysisContext(
-        code="FROM alpine:3.20\nCOPY . /app\n",
+        code=_COPYING_DOCKERFILE,
         language="dockerfile",
     )
     assert not DockerfileDockerignoreDetector().detect(
@@ -151,9 +159,9 @@ def test_dockerfile_detectors_cover_non_violation_paths_and_names():
     )
 
     copy_context_with_dockerignore = AnalysisContext(
-        code="FROM alpine:3.20\nCOPY . /app\n",
+        code=_COPYING_DOCKERFILE,
         language="dockerfile",
-        other_files={".dockerignore": "__pycache__/\n"},
+        other_files=_DOCKERIGNORE_FILES,
     )
     assert not DockerfileDockerignoreDetector().detect(
         copy_context_with_dockerignore,
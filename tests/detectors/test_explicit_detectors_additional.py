@@ -1,6 +1,19 @@
 from __future__ import annotations
 
+import functools
+import importlib
+import inspect
+import pkgutil
+import re
+import sys
+
+from typing import NamedTuple
+
+import pytest
+
+from mcp_zen_of_languages import languages
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
+from mcp_zen_of_languages.analyzers.base import ViolationDetector
 from mcp_zen_of_languages.languages.configs import CSharpCollectionExpressionConfig
 from mcp_zen_of_languages.languages.configs import CSharpDisposableConfig
 from mcp_zen_of_languages.languages.configs import CSharpExceptionHandlingConfig
@@ -31,6 +44,7 @@ from mcp_zen_of_languages.languages.configs import CssMediaQueryScaleConfig
 from mcp_zen_of_languages.languages.configs import CssSpecificityConfig
 from mcp_zen_of_languages.languages.configs import CssVendorPrefixConfig
 from mcp_zen_of_languages.languages.configs import CssZIndexScaleConfig
+from mcp_zen_of_languages.languages.configs import DetectorConfig
 from mcp_zen_of_languages.languages.configs import GoGoroutineLeakConfig
 from mcp_zen_of_languages.languages.configs import GoInitUsageConfig
 from mcp_zen_of_languages.languages.configs import GoInterfacePointerConfig
@@ -136,6 +150,30 @@ from mcp_zen_of_languages.languages.css.detectors import CssMediaQueryScaleDetec
 from mcp_zen_of_languages.languages.css.detectors import CssSpecificityDetector
 from mcp_zen_of_languages.languages.css.detectors import CssVendorPrefixDetector
 from mcp_zen_of_languages.languages.css.detectors import CssZIndexScaleDetector
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileAddInstructionDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileDockerignoreDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileHealthcheckDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileLatestTagDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileLayerDisciplineDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileMultiStageDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileNonRootUserDetector,
+)
+from mcp_zen_of_languages.languages.dockerfile.detectors import (
+    DockerfileSecretHygieneDetector,
+)
 from mcp_zen_of_languages.languages.go.detectors import GoContextUsageDetector
 from mcp_zen_of_languages.languages.go.detectors import GoDeferUsageDetector
 from mcp_zen_of_languages.languages.go.detectors import GoErrorHandlingDetector
@@ -245,651 +283,842 @@ from mcp_zen_of_languages.languages.yaml.detectors import YamlNoTabsDetector
 from mcp_zen_of_languages.languages.yaml.detectors import YamlStringStyleDetector
 
 
+_SNIPPET_SOURCES: dict[str, str] = {
+    "go_interface_return": "package main\nfunc Make() interface{} { return nil }",
+    "go_zero_value": "package main\nfunc NewWidget() *Widget { return &Widget{} }",
+    "go_interface_pointer": "package main\nvar target *interface{}",
+    "go_goroutine_leak": "package main\nfunc Run(){ go func() { }() }",
+    "go_package_naming": "package foos\nfunc Run() {}",
+    "go_package_state": "package main\nvar state int",
+    "go_init_usage": "package main\nfunc init() {}",
+    "js_global_state": "window.state = 1;",
+    "js_anonymous_function": "function() {}",
+    "js_string_concat": "const message = 'Hello ' + name;",
+    "js_magic_numbers": "const total = 42;",
+    "js_pure_function": "const items = []; items.push(1);",
+    "js_inheritance_depth": "class A extends B {}\nclass B extends C {}\n",
+    "js_meaningful_names": "const a = 1;",
+    "ps_function_param": "function Test-Thing { param($foo) }",
+    "ps_verbose_debug": "Write-Host 'log'",
+    "ps_positional_params": "$args",
+    "ps_pipeline_usage": "foreach ($item in $items) { $item }",
+    "ps_should_process": "Remove-Item $path",
+    "ps_splatting": "Get-Item -Path x -Filter y -Force -Recurse",
+    "ps_comment_help": "function Test-Thing { }\n",
+    "ps_alias_usage": "gci $path",
+    "ps_return_objects": "Format-Table",
+    "ps_scope_usage": "$global:thing = 1",
+    "ruby_dry": "puts 'hi'\nputs 'hi'\nputs 'hi'\n",
+    "ruby_block_preference": "lambda { |x| x }\n",
+    "ruby_monkey_patch": "class String\nend\n",
+    "ruby_method_naming": "def isReady\nend\n",
+    "ruby_symbol_keys": '{ "foo" => "bar" }\n',
+    "ruby_symbol_keys_clean": "{ foo: 'bar' }\n",
+    "ruby_guard_clause": "if ready\n  work\nend\n",
+    "ruby_metaprogramming": "define_method(:foo) { }\n",
+    "ruby_expressive_syntax": "for item in items\nend\n",
+    "ruby_prefer_fail": "raise 'boom'\n",
+    "cpp_raii": "int* ptr = new int;",
+    "cpp_auto": "std::vector<int> items = {};",
+    "cpp_range_for": "for (auto it = items.begin(); it != items.end(); ++it) {}",
+    "cpp_manual_allocation": "auto ptr = new int[10];",
+    "cpp_const_correctness": "void foo(std::string& name) {}",
+    "cpp_c_style_cast": "int x = (int)foo;",
+    "cpp_rule_of_five": "class Foo { ~Foo(); };",
+    "cpp_move": "Foo&& value = get();",
+    "cpp_avoid_globals": "static int g_state = 1;",
+    "cpp_override_final": "virtual void Run();",
+    "cpp_optional": "Widget* maybe = nullptr;",
+    "csharp_nullable": "public class Foo {}",
+    "csharp_expression_bodied": "int Value { get { return 1; } }",
+    "csharp_var": "int value = 1;",
+    "csharp_pattern_matching": "if (obj is Foo) {}",
+    "csharp_collection_expression": "var items = new List<int>();",
+    "csharp_naming_convention": "public class foo {}",
+    "csharp_disposable": "IDisposable item; item.Dispose();",
+    "csharp_magic_number": "const int Limit = 42;",
+    "csharp_linq": "foreach (var item in items) { }",
+    "csharp_exception_handling": "try {} catch (Exception) {}",
+    "csharp_record": "class Person { public string Name { get; set; } }",
+    "yaml_indentation": "root:\n   child: value\n",
+    "yaml_no_tabs": "root:\n\tchild: value\n",
+    "yaml_duplicate_keys": "root: 1\nroot: 2\n",
+    "yaml_lowercase_keys": "Root: 1\n",
+    "yaml_key_clarity": "r: 1\n",
+    "yaml_consistency": "- item\n* other\n",
+    "yaml_comment_intent": "root: 1\nchild: 2\nleaf: 3\nnode: 4\nvalue: 5\n",
+    "yaml_string_style": "title: hello world\n",
+    "css_specificity": ".a { .b { .c { .d { color: red !important; } } } }\n",
+    "css_spaced_important": ".button { color: red ! Important; }\n",
+    "css_magic_pixels": ".a { padding: 12px; }\n",
+    "css_fractional_pixels": ".a { border-width: 0px; margin: 0.5px; }\n",
+    "css_color_literal": ".a { color: #ff00aa; }\n",
+    "css_god_stylesheet": ".a {}\n.b {}\n.c {}\n",
+    "css_import_chain": "@import 'base';\n",
+    "css_z_index_scale": ".modal { z-index: 9999; }\n",
+    "css_vendor_prefix": ".btn { -webkit-user-select: none; }\n",
+    "css_media_query_scale": "@media screen and\n(min-width: 990px) {\n  .x { display: block; }\n}\n",
+    "toml_no_inline_tables": 'root = { key = "value" }',
+    "toml_duplicate_keys": 'root = "value"\nroot = "value2"\n',
+    "toml_lowercase_keys": 'Root = "value"\n',
+    "toml_trailing_commas": "items = [1, 2, ]\n",
+    "toml_comment_clarity": "value = 42\n",
+    "toml_order": "[first]\nvalue = 1\n\n\n\n\n\n\n\n\n\n[second]\nvalue = 2\n",
+    "toml_iso_datetime": 'date = "01/02/2024"\n',
+    "toml_float_integer": "count = 4.0\n",
+    "json_strictness": '{ "name": "x", }\n',
+    "json_schema_consistency": '{"a":{"b":{"c":{"d":{"e":{"f":1}}}}}}',
+    "json_duplicate_key": '{"a": 1, "a": 2}',
+    "json_magic_string": '{"status":"active","state":"active","mode":"active"}',
+    "json_date_format": '{"created_at": "03/15/2024"}',
+    "json_null_handling": '{"name": "test", "config": null}',
+    "json_key_casing": '{"Key": 1, "value": 2}',
+    "json_array_order": '{"items": [1,2,3,4,5]}',
+    "json_null_sprawl": '{"a": null, "b": null, "c": null, "d": null}',
+    "xml_semantic_markup": "<font>hi</font>",
+    "xml_attribute_usage": '<item description="This is a very long attribute value that should be element data"></item>',
+    "xml_namespace": "<x:root><x:item /></x:root>",
+    "xml_validity": "<root><child /></root>",
+    "xml_hierarchy": "<root><item></item><item></item><item></item></root>",
+    "xml_closing_tags": "<item />",
+}
+SNIPPETS: dict[str, str] = {
+    tag: sys.intern(code) for tag, code in _SNIPPET_SOURCES.items()
+}
+
+
+def _class_patterns(detector_cls: type) -> dict[str, object]:
+    return {
+        attr: value
+        for attr, value in vars(detector_cls).items()
+        if attr.startswith("_") and attr.endswith("_RE")
+    }
+
+
+@functools.cache
+def default(config_cls: type[DetectorConfig]) -> DetectorConfig:
+    return config_cls()
+
+
+@functools.cache
+def detector_for[DetectorT: ViolationDetector](
+    detector_cls: type[DetectorT],
+) -> DetectorT:
+    return detector_cls()
+
+
+def _context_for(code: str, language: str) -> AnalysisContext:
+    return AnalysisContext(code=code, language=language)
+
+
+def _language_detector_classes() -> list[type[ViolationDetector]]:
+    classes: list[type[ViolationDetector]] = []
+    for module_info in pkgutil.walk_packages(
+        languages.__path__, f"{languages.__name__}."
+    ):
+        if not module_info.name.endswith(".detectors"):
+            continue
+        module = importlib.import_module(module_info.name)
+        classes.extend(
+            obj
+            for obj in vars(module).values()
+            if inspect.isclass(obj)
+            and issubclass(obj, ViolationDetector)
+            and not inspect.isabstract(obj)
+            and obj.__module__ == module.__name__
+        )
+    return classes
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _validate_detector_classes():
+    valid_name = re.compile(r"^[a-z0-9_-]+$")
+    for detector_cls in _language_detector_classes():
+        assert valid_name.fullmatch(detector_for(detector_cls).name), detector_cls
+        assert all(
+            isinstance(pattern, re.Pattern)
+            for pattern in _class_patterns(detector_cls).values()
+        ), detector_cls
+
+
 def run_detector(detector, code: str, language: str, config):
-    context = AnalysisContext(code=code, language=language)
-    assert detector.name
-    return detector.detect(context, config)
+    return detector.detect(_context_for(code, language), config)
+
+
+def test_regex_detectors_precompile_class_level_patterns():
+    for detector_cls in (
+        CssSpecificityDetector,
+        CssMagicPixelsDetector,
+        CssColorLiteralDetector,
+        CssImportChainDetector,
+        CssZIndexScaleDetector,
+        CssVendorPrefixDetector,
+        CssMediaQueryScaleDetector,
+        JsMagicNumbersDetector,
+        PowerShellAliasUsageDetector,
+    ):
+        patterns = _class_patterns(detector_cls)
+        assert patterns, detector_cls.__name__
+        assert all(isinstance(p, re.Pattern) for p in patterns.values())
+
 
+class DetectorCase(NamedTuple):
+    detector: ViolationDetector
+    code: str
+    language: str
+    config: DetectorConfig
+    expect_violation: bool = True
 
-def test_go_additional_detectors_cover_paths():
-    assert run_detector(
-        GoInterfaceReturnDetector(),
-        "package main\nfunc Make() interface{} { return nil }",
+
+DETECTOR_CASES: list[DetectorCase] = [
+    DetectorCase(
+        detector_for(GoInterfaceReturnDetector),
+        SNIPPETS["go_interface_return"],
         "go",
-        GoInterfaceReturnConfig(),
-    )
-    assert run_detector(
-        GoZeroValueDetector(),
-        "package main\nfunc NewWidget() *Widget { return &Widget{} }",
+        default(GoInterfaceReturnConfig),
+    ),
+    DetectorCase(
+        detector_for(GoZeroValueDetector),
+        SNIPPETS["go_zero_value"],
         "go",
-        GoZeroValueConfig(),
-    )
-    assert run_detector(
-        GoInterfacePointerDetector(),
-        "package main\nvar target *interface{}",
+        default(GoZeroValueConfig),
+    ),
+    DetectorCase(
+        detector_for(GoInterfacePointerDetector),
+        SNIPPETS["go_interface_pointer"],
         "go",
-        GoInterfacePointerConfig(),
-    )
-    assert run_detector(
-        GoGoroutineLeakDetector(),
-        "package main\nfunc Run(){ go func() { }() }",
+        default(GoInterfacePointerConfig),
+    ),
+    DetectorCase(
+        detector_for(GoGoroutineLeakDetector),
+        SNIPPETS["go_goroutine_leak"],
         "go",
-        GoGoroutineLeakConfig(),
-    )
-    assert run_detector(
-        GoPackageNamingDetector(),
-        "package foos\nfunc Run() {}",
+        default(GoGoroutineLeakConfig),
+    ),
+    DetectorCase(
+        detector_for(GoPackageNamingDetector),
+        SNIPPETS["go_package_naming"],
         "go",
-        GoPackageNamingConfig(),
-    )
-    assert run_detector(
-        GoPackageStateDetector(),
-        "package main\nvar state int",
+        default(GoPackageNamingConfig),
+    ),
+    DetectorCase(
+        detector_for(GoPackageStateDetector),
+        SNIPPETS["go_package_state"],
         "go",
-        GoPackageStateConfig(),
-    )
-    assert run_detector(
-        GoInitUsageDetector(),
-        "package main\nfunc init() {}",
+        default(GoPackageStateConfig),
+    ),
+    DetectorCase(
+        detector_for(GoInitUsageDetector),
+        SNIPPETS["go_init_usage"],
         "go",
-        GoInitUsageConfig(),
-    )
-
-
-def test_js_additional_detectors_cover_paths():
-    assert JsCallbackNestingDetector().name == "js_callback_nesting"
-    assert JsNoVarDetector().name == "js_no_var"
-    assert JsStrictEqualityDetector().name == "js_strict_equality"
-    assert JsAsyncErrorHandlingDetector().name == "js_async_error_handling"
-    assert JsFunctionLengthDetector().name == "js_function_length"
-    assert run_detector(
-        JsGlobalStateDetector(),
-        "window.state = 1;",
+        default(GoInitUsageConfig),
+    ),
+    DetectorCase(
+        detector_for(JsGlobalStateDetector),
+        SNIPPETS["js_global_state"],
         "javascript",
-        JsGlobalStateConfig(),
-    )
-    assert run_detector(
-        JsModernFeaturesDetector(),
-        "function() {}",
+        default(JsGlobalStateConfig),
+    ),
+    DetectorCase(
+        detector_for(JsModernFeaturesDetector),
+        SNIPPETS["js_anonymous_function"],
         "javascript",
-        JsModernFeaturesConfig(),
-    )
-    assert run_detector(
-        JsModernFeaturesDetector(),
-        "const message = 'Hello ' + name;",
+        default(JsModernFeaturesConfig),
+    ),
+    DetectorCase(
+        detector_for(JsModernFeaturesDetector),
+        SNIPPETS["js_string_concat"],
         "javascript",
-        JsModernFeaturesConfig(),
-    )
-    assert run_detector(
-        JsMagicNumbersDetector(),
-        "const total = 42;",
+        default(JsModernFeaturesConfig),
+    ),
+    DetectorCase(
+        detector_for(JsMagicNumbersDetector),
+        SNIPPETS["js_magic_numbers"],
         "javascript",
-        JsMagicNumbersConfig(),
-    )
-    assert run_detector(
-        JsPureFunctionDetector(),
-        "const items = []; items.push(1);",
+        default(JsMagicNumbersConfig),
+    ),
+    DetectorCase(
+        detector_for(JsPureFunctionDetector),
+        SNIPPETS["js_pure_function"],
         "javascript",
-        JsPureFunctionConfig(),
-    )
-    assert run_detector(
-        JsInheritanceDepthDetector(),
-        "class A extends B {}\nclass B extends C {}\n",
+        default(JsPureFunctionConfig),
+    ),
+    DetectorCase(
+        detector_for(JsInheritanceDepthDetector),
+        SNIPPETS["js_inheritance_depth"],
         "javascript",
-        Js009Config().model_copy(update={"max_inheritance_depth": 1}),
-    )
-    assert run_detector(
-        JsMeaningfulNamesDetector(),
-        "const a = 1;",
+        default(Js009Config).model_copy(update={"max_inheritance_depth": 1}),
+    ),
+    DetectorCase(
+        detector_for(JsMeaningfulNamesDetector),
+        SNIPPETS["js_meaningful_names"],
         "javascript",
-        Js011Config().model_copy(update={"min_identifier_length": 4}),
-    )
-
-
-def test_powershell_additional_detectors_cover_paths():
-    assert run_detector(
-        PowerShellCmdletBindingDetector(),
-        "function Test-Thing { param($foo) }",
+        default(Js011Config).model_copy(update={"min_identifier_length": 4}),
+    ),
+    DetectorCase(
+        detector_for(PowerShellCmdletBindingDetector),
+        SNIPPETS["ps_function_param"],
         "powershell",
-        PowerShellCmdletBindingConfig(),
-    )
-    assert run_detector(
-        PowerShellVerboseDebugDetector(),
-        "Write-Host 'log'",
+        default(PowerShellCmdletBindingConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellVerboseDebugDetector),
+        SNIPPETS["ps_verbose_debug"],
         "powershell",
-        PowerShellVerboseDebugConfig(),
-    )
-    assert run_detector(
-        PowerShellPositionalParamsDetector(),
-        "$args",
+        default(PowerShellVerboseDebugConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellPositionalParamsDetector),
+        SNIPPETS["ps_positional_params"],
         "powershell",
-        PowerShellPositionalParamsConfig(),
-    )
-    assert run_detector(
-        PowerShellPipelineUsageDetector(),
-        "foreach ($item in $items) { $item }",
+        default(PowerShellPositionalParamsConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellPipelineUsageDetector),
+        SNIPPETS["ps_pipeline_usage"],
         "powershell",
-        PowerShellPipelineUsageConfig(),
-    )
-    assert run_detector(
-        PowerShellShouldProcessDetector(),
-        "Remove-Item $path",
+        default(PowerShellPipelineUsageConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellShouldProcessDetector),
+        SNIPPETS["ps_should_process"],
         "powershell",
-        PowerShellShouldProcessConfig(),
-    )
-    assert run_detector(
-        PowerShellSplattingDetector(),
-        "Get-Item -Path x -Filter y -Force -Recurse",
+        default(PowerShellShouldProcessConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellSplattingDetector),
+        SNIPPETS["ps_splatting"],
         "powershell",
-        PowerShellSplattingConfig(),
-    )
-    assert run_detector(
-        PowerShellParameterValidationDetector(),
-        "function Test-Thing { param($foo) }",
+        default(PowerShellSplattingConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellParameterValidationDetector),
+        SNIPPETS["ps_function_param"],
         "powershell",
-        PowerShellParameterValidationConfig(),
-    )
-    assert run_detector(
-        PowerShellCommentHelpDetector(),
-        "function Test-Thing { }\n",
+        default(PowerShellParameterValidationConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellCommentHelpDetector),
+        SNIPPETS["ps_comment_help"],
         "powershell",
-        PowerShellCommentHelpConfig(),
-    )
-    assert run_detector(
-        PowerShellAliasUsageDetector(),
-        "gci $path",
+        default(PowerShellCommentHelpConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellAliasUsageDetector),
+        SNIPPETS["ps_alias_usage"],
         "powershell",
-        PowerShellAliasUsageConfig(),
-    )
-    assert run_detector(
-        PowerShellReturnObjectsDetector(),
-        "Format-Table",
+        default(PowerShellAliasUsageConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellReturnObjectsDetector),
+        SNIPPETS["ps_return_objects"],
         "powershell",
-        PowerShellReturnObjectsConfig(),
-    )
-    assert run_detector(
-        PowerShellScopeUsageDetector(),
-        "$global:thing = 1",
+        default(PowerShellReturnObjectsConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellScopeUsageDetector),
+        SNIPPETS["ps_scope_usage"],
         "powershell",
-        PowerShellScopeUsageConfig(),
-    )
-    assert run_detector(
-        PowerShellNullHandlingDetector(),
-        "function Test-Thing { param($foo) }",
+        default(PowerShellScopeUsageConfig),
+    ),
+    DetectorCase(
+        detector_for(PowerShellNullHandlingDetector),
+        SNIPPETS["ps_function_param"],
         "powershell",
-        PowerShellNullHandlingConfig(),
-    )
-
-
-def test_ruby_additional_detectors_cover_paths():
-    assert run_detector(
-        RubyDryDetector(),
-        "puts 'hi'\nputs 'hi'\nputs 'hi'\n",
+        default(PowerShellNullHandlingConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyDryDetector),
+        SNIPPETS["ruby_dry"],
         "ruby",
-        RubyDryConfig(),
-    )
-    assert run_detector(
-        RubyBlockPreferenceDetector(),
-        "lambda { |x| x }\n",
+        default(RubyDryConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyBlockPreferenceDetector),
+        SNIPPETS["ruby_block_preference"],
         "ruby",
-        RubyBlockPreferenceConfig(),
-    )
-    assert run_detector(
-        RubyMonkeyPatchDetector(),
-        "class String\nend\n",
+        default(RubyBlockPreferenceConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyMonkeyPatchDetector),
+        SNIPPETS["ruby_monkey_patch"],
         "ruby",
-        RubyMonkeyPatchConfig(),
-    )
-    assert run_detector(
-        RubyMethodNamingDetector(),
-        "def isReady\nend\n",
+        default(RubyMonkeyPatchConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyMethodNamingDetector),
+        SNIPPETS["ruby_method_naming"],
         "ruby",
-        RubyMethodNamingConfig(),
-    )
-    assert run_detector(
-        RubySymbolKeysDetector(),
-        '{ "foo" => "bar" }\n',
+        default(RubyMethodNamingConfig),
+    ),
+    DetectorCase(
+        detector_for(RubySymbolKeysDetector),
+        SNIPPETS["ruby_symbol_keys"],
         "ruby",
-        RubySymbolKeysConfig(),
-    )
-    assert not run_detector(
-        RubySymbolKeysDetector(),
-        "{ foo: 'bar' }\n",
+        default(RubySymbolKeysConfig),
+    ),
+    DetectorCase(
+        detector_for(RubySymbolKeysDetector),
+        SNIPPETS["ruby_symbol_keys_clean"],
         "ruby",
-        RubySymbolKeysConfig(),
-    )
-    assert run_detector(
-        RubyGuardClauseDetector(),
-        "if ready\n  work\nend\n",
+        default(RubySymbolKeysConfig),
+        expect_violation=False,
+    ),
+    DetectorCase(
+        detector_for(RubyGuardClauseDetector),
+        SNIPPETS["ruby_guard_clause"],
         "ruby",
-        RubyGuardClauseConfig(),
-    )
-    assert run_detector(
-        RubyMetaprogrammingDetector(),
-        "define_method(:foo) { }\n",
+        default(RubyGuardClauseConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyMetaprogrammingDetector),
+        SNIPPETS["ruby_metaprogramming"],
         "ruby",
-        RubyMetaprogrammingConfig(),
-    )
-    assert run_detector(
-        RubyExpressiveSyntaxDetector(),
-        "for item in items\nend\n",
+        default(RubyMetaprogrammingConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyExpressiveSyntaxDetector),
+        SNIPPETS["ruby_expressive_syntax"],
         "ruby",
-        RubyExpressiveSyntaxConfig(),
-    )
-    assert run_detector(
-        RubyPreferFailDetector(),
-        "raise 'boom'\n",
+        default(RubyExpressiveSyntaxConfig),
+    ),
+    DetectorCase(
+        detector_for(RubyPreferFailDetector),
+        SNIPPETS["ruby_prefer_fail"],
         "ruby",
-        RubyPreferFailConfig(),
-    )
-
-
-def test_cpp_detectors_cover_paths():
-    assert run_detector(
-        CppRaiiDetector(),
-        "int* ptr = new int;",
+        default(RubyPreferFailConfig),
+    ),
+    DetectorCase(
+        detector_for(CppRaiiDetector),
+        SNIPPETS["cpp_raii"],
         "cpp",
-        CppRaiiConfig(),
-    )
-    assert run_detector(
-        CppAutoDetector(),
-        "std::vector<int> items = {};",
+        default(CppRaiiConfig),
+    ),
+    DetectorCase(
+        detector_for(CppAutoDetector),
+        SNIPPETS["cpp_auto"],
         "cpp",
-        CppAutoConfig(),
-    )
-    assert run_detector(
-        CppRangeForDetector(),
-        "for (auto it = items.begin(); it != items.end(); ++it) {}",
+        default(CppAutoConfig),
+    ),
+    DetectorCase(
+        detector_for(CppRangeForDetector),
+        SNIPPETS["cpp_range_for"],
         "cpp",
-        CppRangeForConfig(),
-    )
-    assert run_detector(
-        CppManualAllocationDetector(),
-        "auto ptr = new int[10];",
+        default(CppRangeForConfig),
+    ),
+    DetectorCase(
+        detector_for(CppManualAllocationDetector),
+        SNIPPETS["cpp_manual_allocation"],
         "cpp",
-        CppManualAllocationConfig(),
-    )
-    assert run_detector(
-        CppConstCorrectnessDetector(),
-        "void foo(std::string& name) {}",
+        default(CppManualAllocationConfig),
+    ),
+    DetectorCase(
+        detector_for(CppConstCorrectnessDetector),
+        SNIPPETS["cpp_const_correctness"],
         "cpp",
-        CppConstCorrectnessConfig(),
-    )
-    assert run_detector(
-        CppCStyleCastDetector(),
-        "int x = (int)foo;",
+        default(CppConstCorrectnessConfig),
+    ),
+    DetectorCase(
+        detector_for(CppCStyleCastDetector),
+        SNIPPETS["cpp_c_style_cast"],
         "cpp",
-        CppCStyleCastConfig(),
-    )
-    assert run_detector(
-        CppRuleOfFiveDetector(),
-        "class Foo { ~Foo(); };",
+        default(CppCStyleCastConfig),
+    ),
+    DetectorCase(
+        detector_for(CppRuleOfFiveDetector),
+        SNIPPETS["cpp_rule_of_five"],
         "cpp",
-        CppRuleOfFiveConfig(),
-    )
-    assert run_detector(
-        CppMoveDetector(),
-        "Foo&& value = get();",
+        default(CppRuleOfFiveConfig),
+    ),
+    DetectorCase(
+        detector_for(CppMoveDetector),
+        SNIPPETS["cpp_move"],
         "cpp",
-        CppMoveConfig(),
-    )
-    assert run_detector(
-        CppAvoidGlobalsDetector(),
-        "static int g_state = 1;",
+        default(CppMoveConfig),
+    ),
+    DetectorCase(
+        detector_for(CppAvoidGlobalsDetector),
+        SNIPPETS["cpp_avoid_globals"],
         "cpp",
-        CppAvoidGlobalsConfig(),
-    )
-    assert run_detector(
-        CppOverrideFinalDetector(),
-        "virtual void Run();",
+        default(CppAvoidGlobalsConfig),
+    ),
+    DetectorCase(
+        detector_for(CppOverrideFinalDetector),
+        SNIPPETS["cpp_override_final"],
         "cpp",
-        CppOverrideFinalConfig(),
-    )
-    assert run_detector(
-        CppOptionalDetector(),
-        "Widget* maybe = nullptr;",
+        default(CppOverrideFinalConfig),
+    ),
+    DetectorCase(
+        detector_for(CppOptionalDetector),
+        SNIPPETS["cpp_optional"],
         "cpp",
-        CppOptionalConfig(),
-    )
-
-
-def test_csharp_detectors_cover_paths():
-    assert run_detector(
-        CSharpNullableDetector(),
-        "public class Foo {}",
+        default(CppOptionalConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpNullableDetector),
+        SNIPPETS["csharp_nullable"],
         "csharp",
-        CSharpNullableConfig(),
-    )
-    assert run_detector(
-        CSharpExpressionBodiedDetector(),
-        "int Value { get { return 1; } }",
+        default(CSharpNullableConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpExpressionBodiedDetector),
+        SNIPPETS["csharp_expression_bodied"],
         "csharp",
-        CSharpExpressionBodiedConfig(),
-    )
-    assert run_detector(
-        CSharpVarDetector(),
-        "int value = 1;",
+        default(CSharpExpressionBodiedConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpVarDetector),
+        SNIPPETS["csharp_var"],
         "csharp",
-        CSharpVarConfig(),
-    )
-    assert run_detector(
-        CSharpPatternMatchingDetector(),
-        "if (obj is Foo) {}",
+        default(CSharpVarConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpPatternMatchingDetector),
+        SNIPPETS["csharp_pattern_matching"],
         "csharp",
-        CSharpPatternMatchingConfig(),
-    )
-    assert run_detector(
-        CSharpCollectionExpressionDetector(),
-        "var items = new List<int>();",
+        default(CSharpPatternMatchingConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpCollectionExpressionDetector),
+        SNIPPETS["csharp_collection_expression"],
         "csharp",
-        CSharpCollectionExpressionConfig(),
-    )
-    assert run_detector(
-        CSharpNamingConventionDetector(),
-        "public class foo {}",
+        default(CSharpCollectionExpressionConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpNamingConventionDetector),
+        SNIPPETS["csharp_naming_convention"],
         "csharp",
-        Cs008Config().model_copy(update={"public_naming": "PascalCase"}),
-    )
-    assert run_detector(
-        CSharpDisposableDetector(),
-        "IDisposable item; item.Dispose();",
+        default(Cs008Config).model_copy(update={"public_naming": "PascalCase"}),
+    ),
+    DetectorCase(
+        detector_for(CSharpDisposableDetector),
+        SNIPPETS["csharp_disposable"],
         "csharp",
-        CSharpDisposableConfig(),
-    )
-    assert run_detector(
-        CSharpMagicNumberDetector(),
-        "const int Limit = 42;",
+        default(CSharpDisposableConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpMagicNumberDetector),
+        SNIPPETS["csharp_magic_number"],
         "csharp",
-        CSharpMagicNumberConfig(),
-    )
-    assert run_detector(
-        CSharpLinqDetector(),
-        "foreach (var item in items) { }",
+        default(CSharpMagicNumberConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpLinqDetector),
+        SNIPPETS["csharp_linq"],
         "csharp",
-        CSharpLinqConfig(),
-    )
-    assert run_detector(
-        CSharpExceptionHandlingDetector(),
-        "try {} catch (Exception) {}",
+        default(CSharpLinqConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpExceptionHandlingDetector),
+        SNIPPETS["csharp_exception_handling"],
         "csharp",
-        CSharpExceptionHandlingConfig(),
-    )
-    assert run_detector(
-        CSharpRecordDetector(),
-        "class Person { public string Name { get; set; } }",
+        default(CSharpExceptionHandlingConfig),
+    ),
+    DetectorCase(
+        detector_for(CSharpRecordDetector),
+        SNIPPETS["csharp_record"],
         "csharp",
-        CSharpRecordConfig(),
-    )
-
-
-def test_yaml_detectors_cover_paths():
-    assert run_detector(
-        YamlIndentationDetector(),
-        "root:\n   child: value\n",
+        default(CSharpRecordConfig),
+    ),
+    DetectorCase(
+        detector_for(YamlIndentationDetector),
+        SNIPPETS["yaml_indentation"],
         "yaml",
-        YamlIndentationConfig().model_copy(update={"indent_size": 2}),
-    )
-    assert run_detector(
-        YamlNoTabsDetector(),
-        "root:\n\tchild: value\n",
+        default(YamlIndentationConfig).model_copy(update={"indent_size": 2}),
+    ),
+    DetectorCase(
+        detector_for(YamlNoTabsDetector),
+        SNIPPETS["yaml_no_tabs"],
         "yaml",
-        YamlNoTabsConfig(),
-    )
-    assert run_detector(
-        YamlDuplicateKeysDetector(),
-        "root: 1\nroot: 2\n",
+        default(YamlNoTabsConfig),
+    ),
+    DetectorCase(
+        detector_for(YamlDuplicateKeysDetector),
+        SNIPPETS["yaml_duplicate_keys"],
         "yaml",
-        YamlDuplicateKeysConfig(),
-    )
-    assert run_detector(
-        YamlLowercaseKeysDetector(),
-        "Root: 1\n",
+        default(YamlDuplicateKeysConfig),
+    ),
+    DetectorCase(
+        detector_for(YamlLowercaseKeysDetector),
+        SNIPPETS["yaml_lowercase_keys"],
         "yaml",
-        YamlLowercaseKeysConfig(),
-    )
-    assert run_detector(
-        YamlKeyClarityDetector(),
-        "r: 1\n",
+        default(YamlLowercaseKeysConfig),
+    ),
+    DetectorCase(
+        detector_for(YamlKeyClarityDetector),
+        SNIPPETS["yaml_key_clarity"],
         "yaml",
-        YamlKeyClarityConfig().model_copy(update={"min_key_length": 3}),
-    )
-    assert run_detector(
-        YamlConsistencyDetector(),
-        "- item\n* other\n",
+        default(YamlKeyClarityConfig).model_copy(update={"min_key_length": 3}),
+    ),
+    DetectorCase(
+        detector_for(YamlConsistencyDetector),
+        SNIPPETS["yaml_consistency"],
         "yaml",
-        YamlConsistencyConfig().model_copy(update={"allowed_list_markers": ["-"]}),
-    )
-    assert run_detector(
-        YamlCommentIntentDetector(),
-        "root: 1\nchild: 2\nleaf: 3\nnode: 4\nvalue: 5\n",
+        default(YamlConsistencyConfig).model_copy(
+            update={"allowed_list_markers": ["-"]}
+        ),
+    ),
+    DetectorCase(
+        detector_for(YamlCommentIntentDetector),
+        SNIPPETS["yaml_comment_intent"],
         "yaml",
-        YamlCommentIntentConfig().model_copy(update={"min_nonempty_lines": 3}),
-    )
-    assert run_detector(
-        YamlStringStyleDetector(),
-        "title: hello world\n",
+        default(YamlCommentIntentConfig).model_copy(update={"min_nonempty_lines": 3}),
+    ),
+    DetectorCase(
+        detector_for(YamlStringStyleDetector),
+        SNIPPETS["yaml_string_style"],
         "yaml",
-        YamlStringStyleConfig(),
-    )
-
-
-def test_css_detectors_cover_paths():
-    assert run_detector(
-        CssSpecificityDetector(),
-        ".a { .b { .c { .d { color: red !important; } } } }\n",
+        default(YamlStringStyleConfig),
+    ),
+    DetectorCase(
+        detector_for(CssSpecificityDetector),
+        SNIPPETS["css_specificity"],
         "css",
-        CssSpecificityConfig().model_copy(
+        default(CssSpecificityConfig).model_copy(
             update={"max_selector_nesting": 3, "max_important_usages": 0},
         ),
-    )
-    assert run_detector(
-        CssSpecificityDetector(),
-        ".button { color: red ! Important; }\n",
+    ),
+    DetectorCase(
+        detector_for(CssSpecificityDetector),
+        SNIPPETS["css_spaced_important"],
         "css",
-        CssSpecificityConfig().model_copy(
+        default(CssSpecificityConfig).model_copy(
             update={"max_selector_nesting": 10, "max_important_usages": 0},
         ),
-    )
-    assert run_detector(
-        CssMagicPixelsDetector(),
-        ".a { padding: 12px; }\n",
+    ),
+    DetectorCase(
+        detector_for(CssMagicPixelsDetector),
+        SNIPPETS["css_magic_pixels"],
         "css",
-        CssMagicPixelsConfig(),
-    )
-    assert run_detector(
-        CssMagicPixelsDetector(),
-        ".a { border-width: 0px; margin: 0.5px; }\n",
+        default(CssMagicPixelsConfig),
+    ),
+    DetectorCase(
+        detector_for(CssMagicPixelsDetector),
+        SNIPPETS["css_fractional_pixels"],
         "css",
-        CssMagicPixelsConfig().model_copy(update={"max_raw_pixel_literals": 0}),
-    )
-    assert run_detector(
-        CssColorLiteralDetector(),
-        ".a { color: #ff00aa; }\n",
+        default(CssMagicPixelsConfig).model_copy(update={"max_raw_pixel_literals": 0}),
+    ),
+    DetectorCase(
+        detector_for(CssColorLiteralDetector),
+        SNIPPETS["css_color_literal"],
         "css",
-        CssColorLiteralConfig(),
-    )
-    assert run_detector(
-        CssGodStylesheetDetector(),
-        ".a {}\n.b {}\n.c {}\n",
+        default(CssColorLiteralConfig),
+    ),
+    DetectorCase(
+        detector_for(CssGodStylesheetDetector),
+        SNIPPETS["css_god_stylesheet"],
         "css",
-        CssGodStylesheetConfig().model_copy(update={"max_stylesheet_lines": 1}),
-    )
-    assert run_detector(
-        CssImportChainDetector(),
-        "@import 'base';\n",
+        default(CssGodStylesheetConfig).model_copy(update={"max_stylesheet_lines": 1}),
+    ),
+    DetectorCase(
+        detector_for(CssImportChainDetector),
+        SNIPPETS["css_import_chain"],
         "css",
-        CssImportChainConfig(),
-    )
-    assert run_detector(
-        CssZIndexScaleDetector(),
-        ".modal { z-index: 9999; }\n",
+        default(CssImportChainConfig),
+    ),
+    DetectorCase(
+        detector_for(CssZIndexScaleDetector),
+        SNIPPETS["css_z_index_scale"],
         "css",
-        CssZIndexScaleConfig().model_copy(update={"allowed_z_index_values": [0, 10]}),
-    )
-    assert run_detector(
-        CssVendorPrefixDetector(),
-        ".btn { -webkit-user-select: none; }\n",
+        default(CssZIndexScaleConfig).model_copy(
+            update={"allowed_z_index_values": [0, 10]}
+        ),
+    ),
+    DetectorCase(
+        detector_for(CssVendorPrefixDetector),
+        SNIPPETS["css_vendor_prefix"],
         "css",
-        CssVendorPrefixConfig(),
-    )
-    assert run_detector(
-        CssMediaQueryScaleDetector(),
-        "@media screen and\n(min-width: 990px) {\n  .x { display: block; }\n}\n",
+        default(CssVendorPrefixConfig),
+    ),
+    DetectorCase(
+        detector_for(CssMediaQueryScaleDetector),
+        SNIPPETS["css_media_query_scale"],
         "css",
-        CssMediaQueryScaleConfig(),
-    )
-
-
-def test_toml_detectors_cover_paths():
-    assert run_detector(
-        TomlNoInlineTablesDetector(),
-        'root = { key = "value" }',
+        default(CssMediaQueryScaleConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlNoInlineTablesDetector),
+        SNIPPETS["toml_no_inline_tables"],
         "toml",
-        TomlNoInlineTablesConfig(),
-    )
-    assert run_detector(
-        TomlDuplicateKeysDetector(),
-        'root = "value"\nroot = "value2"\n',
+        default(TomlNoInlineTablesConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlDuplicateKeysDetector),
+        SNIPPETS["toml_duplicate_keys"],
         "toml",
-        TomlDuplicateKeysConfig(),
-    )
-    assert run_detector(
-        TomlLowercaseKeysDetector(),
-        'Root = "value"\n',
+        default(TomlDuplicateKeysConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlLowercaseKeysDetector),
+        SNIPPETS["toml_lowercase_keys"],
         "toml",
-        TomlLowercaseKeysConfig(),
-    )
-    assert run_detector(
-        TomlTrailingCommasDetector(),
-        "items = [1, 2, ]\n",
+        default(TomlLowercaseKeysConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlTrailingCommasDetector),
+        SNIPPETS["toml_trailing_commas"],
         "toml",
-        TomlTrailingCommasConfig(),
-    )
-    assert run_detector(
-        TomlCommentClarityDetector(),
-        "value = 42\n",
+        default(TomlTrailingCommasConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlCommentClarityDetector),
+        SNIPPETS["toml_comment_clarity"],
         "toml",
-        TomlCommentClarityConfig().model_copy(update={"min_comment_lines": 1}),
-    )
-    assert run_detector(
-        TomlOrderDetector(),
-        "[first]\nvalue = 1\n\n\n\n\n\n\n\n\n\n[second]\nvalue = 2\n",
+        default(TomlCommentClarityConfig).model_copy(update={"min_comment_lines": 1}),
+    ),
+    DetectorCase(
+        detector_for(TomlOrderDetector),
+        SNIPPETS["toml_order"],
         "toml",
-        TomlOrderConfig(),
-    )
-    assert run_detector(
-        TomlIsoDatetimeDetector(),
-        'date = "01/02/2024"\n',
+        default(TomlOrderConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlIsoDatetimeDetector),
+        SNIPPETS["toml_iso_datetime"],
         "toml",
-        TomlIsoDatetimeConfig(),
-    )
-    assert run_detector(
-        TomlFloatIntegerDetector(),
-        "count = 4.0\n",
+        default(TomlIsoDatetimeConfig),
+    ),
+    DetectorCase(
+        detector_for(TomlFloatIntegerDetector),
+        SNIPPETS["toml_float_integer"],
         "toml",
-        TomlFloatIntegerConfig(),
-    )
-
-
-def test_json_detectors_cover_paths():
-    assert run_detector(
-        JsonStrictnessDetector(),
-        '{ "name": "x", }\n',
+        default(TomlFloatIntegerConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonStrictnessDetector),
+        SNIPPETS["json_strictness"],
         "json",
-        JsonStrictnessConfig(),
-    )
-    assert run_detector(
-        JsonSchemaConsistencyDetector(),
-        '{"a":{"b":{"c":{"d":{"e":{"f":1}}}}}}',
+        default(JsonStrictnessConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonSchemaConsistencyDetector),
+        SNIPPETS["json_schema_consistency"],
         "json",
-        JsonSchemaConsistencyConfig(),
-    )
-    assert run_detector(
-        JsonDuplicateKeyDetector(),
-        '{"a": 1, "a": 2}',
+        default(JsonSchemaConsistencyConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonDuplicateKeyDetector),
+        SNIPPETS["json_duplicate_key"],
         "json",
-        JsonDuplicateKeyConfig(),
-    )
-    assert run_detector(
-        JsonMagicStringDetector(),
-        '{"status":"active","state":"active","mode":"active"}',
+        default(JsonDuplicateKeyConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonMagicStringDetector),
+        SNIPPETS["json_magic_string"],
         "json",
         JsonMagicStringConfig(min_repetition=3),
-    )
-    assert run_detector(
-        JsonDateFormatDetector(),
-        '{"created_at": "03/15/2024"}',
+    ),
+    DetectorCase(
+        detector_for(JsonDateFormatDetector),
+        SNIPPETS["json_date_format"],
         "json",
-        JsonDateFormatConfig(),
-    )
-    assert run_detector(
-        JsonNullHandlingDetector(),
-        '{"name": "test", "config": null}',
+        default(JsonDateFormatConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonNullHandlingDetector),
+        SNIPPETS["json_null_handling"],
         "json",
         JsonNullHandlingConfig(max_top_level_nulls=0),
-    )
-    assert run_detector(
-        JsonKeyCasingDetector(),
-        '{"Key": 1, "value": 2}',
+    ),
+    DetectorCase(
+        detector_for(JsonKeyCasingDetector),
+        SNIPPETS["json_key_casing"],
         "json",
-        JsonKeyCasingConfig(),
-    )
-    assert run_detector(
-        JsonArrayOrderDetector(),
-        '{"items": [1,2,3,4,5]}',
+        default(JsonKeyCasingConfig),
+    ),
+    DetectorCase(
+        detector_for(JsonArrayOrderDetector),
+        SNIPPETS["json_array_order"],
         "json",
         JsonArrayOrderConfig(max_inline_array_size=4),
-    )
-    assert run_detector(
-        JsonNullSprawlDetector(),
-        '{"a": null, "b": null, "c": null, "d": null}',
+    ),
+    DetectorCase(
+        detector_for(JsonNullSprawlDetector),
+        SNIPPETS["json_null_sprawl"],
         "json",
-        JsonNullSprawlConfig(),
-    )
-
-
-def test_xml_detectors_cover_paths():
-    assert run_detector(
-        XmlSemanticMarkupDetector(),
-        "<font>hi</font>",
+        default(JsonNullSprawlConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlSemanticMarkupDetector),
+        SNIPPETS["xml_semantic_markup"],
         "xml",
-        XmlSemanticMarkupConfig(),
-    )
-    assert run_detector(
-        XmlAttributeUsageDetector(),
-        '<item description="This is a very long attribute value that should be element data"></item>',
+        default(XmlSemanticMarkupConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlAttributeUsageDetector),
+        SNIPPETS["xml_attribute_usage"],
         "xml",
-        XmlAttributeUsageConfig(),
-    )
-    assert run_detector(
-        XmlNamespaceDetector(),
-        "<x:root><x:item /></x:root>",
+        default(XmlAttributeUsageConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlNamespaceDetector),
+        SNIPPETS["xml_namespace"],
         "xml",
-        XmlNamespaceConfig(),
-    )
-    assert run_detector(
-        XmlValidityDetector(),
-        "<root><child /></root>",
+        default(XmlNamespaceConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlValidityDetector),
+        SNIPPETS["xml_validity"],
         "xml",
-        XmlValidityConfig(),
-    )
-    assert run_detector(
-        XmlHierarchyDetector(),
-        "<root><item></item><item></item><item></item></root>",
+        default(XmlValidityConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlHierarchyDetector),
+        SNIPPETS["xml_hierarchy"],
         "xml",
-        XmlHierarchyConfig(),
-    )
-    assert run_detector(
-        XmlClosingTagsDetector(),
-        "<item />",
+        default(XmlHierarchyConfig),
+    ),
+    DetectorCase(
+        detector_for(XmlClosingTagsDetector),
+        SNIPPETS["xml_closing_tags"],
         "xml",
-        XmlClosingTagsConfig(),
-    )
+        default(XmlClosingTagsConfig),
+    ),
+]
 
 
-def test_go_detector_names_cover_paths():
-    assert GoErrorHandlingDetector().name == "go_error_handling"
-    assert GoInterfaceSizeDetector().name == "go_interface_size"
-    assert GoContextUsageDetector().name == "go_context_usage"
-    assert GoDeferUsageDetector().name == "go_defer_usage"
-    assert GoNamingConventionDetector().name == "go_naming_convention"
+@pytest.mark.parametrize(
+    "case",
+    [
+        pytest.param(
+            case,
+            id=f"{case.detector.name}-{case.language}-{index}",
+            marks=pytest.mark.xdist_group(name=case.language),
+        )
+        for index, case in enumerate(DETECTOR_CASES)
+    ],
+)
+def test_detector_case(case: DetectorCase):
+    violations = run_detector(case.detector, case.code, case.language, case.config)
+    assert bool(violations) is case.expect_violation
+
+
+NAME_CASES: list[tuple[type, str]] = [
+    (DockerfileLatestTagDetector, "dockerfile-001"),
+    (DockerfileNonRootUserDetector, "dockerfile-002"),
+    (DockerfileAddInstructionDetector, "dockerfile-003"),
+    (DockerfileHealthcheckDetector, "dockerfile-004"),
+    (DockerfileMultiStageDetector, "dockerfile-005"),
+    (DockerfileSecretHygieneDetector, "dockerfile-006"),
+    (DockerfileLayerDisciplineDetector, "dockerfile-007"),
+    (DockerfileDockerignoreDetector, "dockerfile-008"),
+    (GoErrorHandlingDetector, "go_error_handling"),
+    (GoInterfaceSizeDetector, "go_interface_size"),
+    (GoContextUsageDetector, "go_context_usage"),
+    (GoDeferUsageDetector, "go_defer_usage"),
+    (GoNamingConventionDetector, "go_naming_convention"),
+    (JsCallbackNestingDetector, "js_callback_nesting"),
+    (JsNoVarDetector, "js_no_var"),
+    (JsStrictEqualityDetector, "js_strict_equality"),
+    (JsAsyncErrorHandlingDetector, "js_async_error_handling"),
+    (JsFunctionLengthDetector, "js_function_length"),
+]
+
+
+@pytest.mark.parametrize(
+    ("detector_cls", "expected_name"),
+    NAME_CASES,
+    ids=[name for _, name in NAME_CASES],
+)
+def test_detector_name(detector_cls, expected_name):
+    assert detector_for(detector_cls).name == expected_name
@@ -1,12 +1,40 @@
 from __future__ import annotations
 
+import pytest
+import yaml
+
 from mcp_zen_of_languages.analyzers.analyzer_factory import create_analyzer
 from mcp_zen_of_languages.languages.ci_yaml_utils import job_steps
 from mcp_zen_of_languages.languages.ci_yaml_utils import load_ci_yaml
+from mcp_zen_of_languages.languages.ci_yaml_utils import safe_load_yaml
+from mcp_zen_of_languages.languages.ci_yaml_utils import try_load_yaml
 from mcp_zen_of_languages.languages.ci_yaml_utils import workflow_jobs
 
 
-def test_github_actions_detector_finds_security_and_timeout_issues():
+SECURITY_AND_TIMEOUT_PRINCIPLES = frozenset(
+    {
+        "Pin third-party actions by full commit SHA",
+        "Avoid pull_request_target checkout of untrusted head SHA",
+        "Do not expose secrets in run blocks",
+        "Set timeout-minutes on jobs",
+    },
+)
+DEPRECATED_AND_ARTIFACT_PRINCIPLES = frozenset(
+    {
+        "Use GITHUB_OUTPUT instead of deprecated set-output",
+        "Set artifact retention explicitly",
+    },
+)
+
+
+@pytest.fixture(scope="module")
+def github_actions_analyzer():
+    return create_analyzer("github-actions")
+
+
+def test_github_actions_detector_finds_security_and_timeout_issues(
+    github_actions_analyzer,
+):
     code = """name: CI
 on: pull_request_target
 jobs:
@@ -18,17 +46,16 @@ jobs:
               ref: ${{ github.event.pull_request.head.sha }}
           - run: echo "${{ secrets.MY_SECRET }}"
     """
-    result = create_analyzer("github-actions").analyze(code)
+    result = github_actions_analyzer.analyze(code)
     rule_ids = {violation.rule_id for violation in result.violations}
     principles = {violation.principle for violation in result.violations}
     assert {"gha-001", "gha-002", "gha-003", "gha-008"} <= rule_ids
-    assert "Pin third-party actions by full commit SHA" in principles
-    assert "Avoid pull_request_target checkout of untrusted head SHA" in principles
-    assert "Do not expose secrets in run blocks" in principles
-    assert "Set timeout-minutes on jobs" in principles
+    assert principles >= SECURITY_AND_TIMEOUT_PRINCIPLES
 
 
-def test_github_actions_detector_finds_deprecated_and_artifact_issues():
+def test_github_actions_detector_finds_deprecated_and_artifact_issues(
+    github_actions_analyzer,
+):
     code = """name: Build
 on: push
 permissions: read-all
@@ -45,15 +72,36 @@ jobs:
         with:
           name: build
     """
-    result = create_analyzer("github-actions").analyze(code)
+    result = github_actions_analyzer.analyze(code)
     rule_ids = {violation.rule_id for violation in result.violations}
     principles = {violation.principle for violation in result.violations}
     assert {"gha-011", "gha-015"} <= rule_ids
-    assert "Use GITHUB_OUTPUT instead of deprecated set-output" in principles
-    assert "Set artifact retention explicitly" in principles
+    assert principles >= DEPRECATED_AND_ARTIFACT_PRINCIPLES
 
 
 def test_ci_yaml_utils_handle_invalid_or_unexpected_shapes():
     assert load_ci_yaml(": bad: yaml:") == {}
+    assert load_ci_yaml("- just\n- a list\n") == {}
     assert workflow_jobs({"jobs": []}) == {}
     assert job_steps({"steps": {}}) == []
+
+
+def test_load_ci_yaml_returns_independent_copies_of_cached_parse():
+    code = "jobs:\n  build:\n    steps: []\n"
+    first = load_ci_yaml(code)
+    first["jobs"]["build"]["steps"].append({"run": "echo mutated"})
+    assert load_ci_yaml(code) == {"jobs": {"build": {"steps": []}}}
+
+
+def test_try_load_yaml_keeps_document_shape_and_reports_failures():
+    assert try_load_yaml(": bad: yaml:") == (False, None)
+    ok, document = try_load_yaml("- just\n- a list\n")
+    assert ok
+    assert document == ["just", "a list"]
+    document.append("mutated")
+    assert try_load_yaml("- just\n- a list\n") == (True, ["just", "a list"])
+
+
+def test_safe_load_yaml_falls_back_without_libyaml(monkeypatch):
+    monkeypatch.setattr(yaml, "__with_libyaml__", False)
+    assert safe_load_yaml("name: CI\n") == {"name": "CI"}
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from collections import Counter
+
+import pytest
+
 from mcp_zen_of_languages.analyzers.analyzer_factory import create_analyzer
 from mcp_zen_of_languages.languages.gitlab_ci.detectors import (
     AllowFailureWithoutRulesDetector,
@@ -24,8 +28,8 @@ EXPECTED_EXPOSED_VARIABLES_COUNT = 2
 EXPECTED_DUPLICATED_BEFORE_SCRIPT_COUNT = 2
 
 
-def test_gitlab_ci_detector_classes_are_available():
-    detector_classes = {
+_GITLAB_DETECTOR_CLASSES = frozenset(
+    {
         AllowFailureWithoutRulesDetector,
         ArtifactExpiryDetector,
         DuplicatedBeforeScriptDetector,
@@ -36,13 +40,20 @@ def test_gitlab_ci_detector_classes_are_available():
         MissingNeedsDetector,
         OnlyExceptDetector,
         UnpinnedImageTagDetector,
-    }
-    assert len(detector_classes) == DETECTOR_CLASS_COUNT
+    },
+)
+
+
+def test_gitlab_ci_detector_classes_are_available():
+    assert len(_GITLAB_DETECTOR_CLASSES) == DETECTOR_CLASS_COUNT
+
+
+@pytest.fixture(scope="module")
+def gitlab_analyzer():
+    return create_analyzer("gitlab-ci")
 
 
-def test_gitlab_ci_detects_security_and_idiomatic_issues():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+SECURITY_AND_IDIOM_PIPELINE = """
 variables:
   CI_SECRET_TOKEN: "hardcoded"
 
@@ -54,18 +65,8 @@ build:
   script:
     - pip install -r requirements.txt
 """
-    result = analyzer.analyze(code)
-    principles = {violation.principle for violation in result.violations}
-    assert "Pin container image tags" in principles
-    assert "Avoid exposed variables in repository YAML" in principles
-    assert "Use allow_failure only with rules-based context" in principles
-    assert "Prefer rules over only/except" in principles
-    assert "Cache dependency installs" in principles
-
-
-def test_gitlab_ci_detects_artifacts_without_expiry():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+
+ARTIFACTS_WITHOUT_EXPIRY_PIPELINE = """
 build:
   script:
     - echo hello
@@ -73,27 +74,15 @@ build:
     paths:
       - dist/
 """
-    result = analyzer.analyze(code)
-    principles = {violation.principle for violation in result.violations}
-    assert "Expire artifacts" in principles
-
 
-def test_gitlab_ci_detects_parallel_job_without_needs():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+PARALLEL_WITHOUT_NEEDS_PIPELINE = """
 test:
   parallel: 3
   script:
     - echo test
 """
-    result = analyzer.analyze(code)
-    principles = {violation.principle for violation in result.violations}
-    assert "Model job DAG dependencies with needs" in principles
-
 
-def test_gitlab_ci_only_except_in_comments_are_ignored():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+COMMENTED_ONLY_EXCEPT_PIPELINE = """
 # only:
 #   - merge_requests
 # except:
@@ -102,14 +91,8 @@ build:
   script:
     - echo "comment mention only"
 """
-    result = analyzer.analyze(code)
-    principles = {violation.principle for violation in result.violations}
-    assert "Prefer rules over only/except" not in principles
 
-
-def test_gitlab_ci_exposed_variables_reports_multiple_matches():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+EXPOSED_VARIABLES_PIPELINE = """
 variables:
   API_TOKEN: "a"
   DB_PASSWORD: "b"
@@ -117,18 +100,8 @@ build:
   script:
     - echo ok
 """
-    result = analyzer.analyze(code)
-    exposed = [
-        violation
-        for violation in result.violations
-        if violation.principle == "Avoid exposed variables in repository YAML"
-    ]
-    assert len(exposed) == EXPECTED_EXPOSED_VARIABLES_COUNT
-
-
-def test_gitlab_ci_duplicated_before_script_reports_multiple_jobs():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+
+DUPLICATED_BEFORE_SCRIPT_PIPELINE = """
 job_one:
   before_script:
     - echo "prepare"
@@ -147,24 +120,90 @@ job_three:
    script:
      - echo three
 """
-    result = analyzer.analyze(code)
-    duplicates = [
-        violation
-        for violation in result.violations
-        if violation.principle == "Reduce duplicated before_script blocks"
-    ]
-    assert len(duplicates) == EXPECTED_DUPLICATED_BEFORE_SCRIPT_COUNT
-
-
-def test_gitlab_ci_missing_interruptible_ignored_for_non_mr_jobs():
-    analyzer = create_analyzer("gitlab-ci")
-    code = """
+
+NON_MR_PIPELINE = """
 nightly_tests:
   only:
     - schedules
   script:
     - echo "nightly tests"
 """
-    result = analyzer.analyze(code)
-    principles = {violation.principle for violation in result.violations}
-    assert "Use interruptible pipelines" not in principles
+
+
+@pytest.mark.parametrize(
+    ("code", "expected_principle", "expected_count"),
+    [
+        pytest.param(
+            SECURITY_AND_IDIOM_PIPELINE,
+            "Pin container image tags",
+            1,
+            id="unpinned-image",
+        ),
+        pytest.param(
+            SECURITY_AND_IDIOM_PIPELINE,
+            "Avoid exposed variables in repository YAML",
+            1,
+            id="exposed-variable",
+        ),
+        pytest.param(
+            SECURITY_AND_IDIOM_PIPELINE,
+            "Use allow_failure only with rules-based context",
+            1,
+            id="allow-failure-without-rules",
+        ),
+        pytest.param(
+            SECURITY_AND_IDIOM_PIPELINE,
+            "Prefer rules over only/except",
+            1,
+            id="only-except",
+        ),
+        pytest.param(
+            SECURITY_AND_IDIOM_PIPELINE,
+            "Cache dependency installs",
+            1,
+            id="missing-cache-key",
+        ),
+        pytest.param(
+            ARTIFACTS_WITHOUT_EXPIRY_PIPELINE,
+            "Expire artifacts",
+            1,
+            id="artifacts-without-expiry",
+        ),
+        pytest.param(
+            PARALLEL_WITHOUT_NEEDS_PIPELINE,
+            "Model job DAG dependencies with needs",
+            1,
+            id="parallel-without-needs",
+        ),
+        pytest.param(
+            COMMENTED_ONLY_EXCEPT_PIPELINE,
+            "Prefer rules over only/except",
+            0,
+            id="only-except-in-comments-ignored",
+        ),
+        pytest.param(
+            EXPOSED_VARIABLES_PIPELINE,
+            "Avoid exposed variables in repository YAML",
+            EXPECTED_EXPOSED_VARIABLES_COUNT,
+            id="exposed-variables-multiple-matches",
+        ),
+        pytest.param(
+            DUPLICATED_BEFORE_SCRIPT_PIPELINE,
+            "Reduce duplicated before_script blocks",
+            EXPECTED_DUPLICATED_BEFORE_SCRIPT_COUNT,
+            id="duplicated-before-script-multiple-jobs",
+        ),
+        pytest.param(
+            NON_MR_PIPELINE,
+            "Use interruptible pipelines",
+            0,
+            id="interruptible-ignored-for-non-mr-jobs",
+        ),
+    ],
+)
+def test_gitlab_ci_violations(
+    gitlab_analyzer, code, expected_principle, expected_count
+):
+    result = gitlab_analyzer.analyze(code)
+    counts = Counter(violation.principle for violation in result.violations)
+    assert counts[expected_principle] == expected_count
@@ -10,10 +10,11 @@ from mcp_zen_of_languages.languages.go.detectors import GoNamingConventionDetect
 from mcp_zen_of_languages.languages.go.rules import GO_ZEN
 
 
+_GO_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(GO_ZEN)}
+
+
 def config_for(detector_type: str):
-    return next(
-        cfg for cfg in REGISTRY.configs_from_rules(GO_ZEN) if cfg.type == detector_type
-    )
+    return _GO_CFG_INDEX[detector_type]
 
 
 def run_detector(detector, code, config):
@@ -1,6 +1,11 @@
 from __future__ import annotations
 
+import functools
+
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
+from mcp_zen_of_languages.analyzers.base import AstStatus
 from mcp_zen_of_languages.languages.configs import JsonArrayOrderConfig
 from mcp_zen_of_languages.languages.configs import JsonDateFormatConfig
 from mcp_zen_of_languages.languages.configs import JsonDuplicateKeyConfig
@@ -10,6 +15,7 @@ from mcp_zen_of_languages.languages.configs import JsonNullHandlingConfig
 from mcp_zen_of_languages.languages.configs import JsonNullSprawlConfig
 from mcp_zen_of_languages.languages.configs import JsonSchemaConsistencyConfig
 from mcp_zen_of_languages.languages.configs import JsonStrictnessConfig
+from mcp_zen_of_languages.languages.json.analyzer import JsonAnalyzer
 from mcp_zen_of_languages.languages.json.detectors import JsonArrayOrderDetector
 from mcp_zen_of_languages.languages.json.detectors import JsonDateFormatDetector
 from mcp_zen_of_languages.languages.json.detectors import JsonDuplicateKeyDetector
@@ -19,143 +25,217 @@ from mcp_zen_of_languages.languages.json.detectors import JsonNullHandlingDetect
 from mcp_zen_of_languages.languages.json.detectors import JsonNullSprawlDetector
 from mcp_zen_of_languages.languages.json.detectors import JsonSchemaConsistencyDetector
 from mcp_zen_of_languages.languages.json.detectors import JsonStrictnessDetector
+from mcp_zen_of_languages.languages.json_utils import parse_json
+from mcp_zen_of_languages.models import ParserResult
+
+
+@functools.cache
+def _context_for(code: str) -> AnalysisContext:
+    return AnalysisContext(code=code, language="json")
+
+
+@pytest.fixture(scope="module")
+def detect():
+    detectors = {}
+
+    def run(detector_cls, code: str, config):
+        if detector_cls not in detectors:
+            detectors[detector_cls] = detector_cls()
+        return detectors[detector_cls].detect(_context_for(code), config)
+
+    return run
+
+
+def test_parse_json_records_duplicates_once_per_document():
+    code = '{"a": 1, "b": {"c": 1, "c": 2}, "a": 3}'
+    parsed = parse_json(code)
+    assert parsed is not None
+    assert parsed.tree == {"a": 3, "b": {"c": 2}}
+    assert parsed.duplicate_keys == ("c", "a")
+    assert parse_json(code) is parsed
+    assert parse_json("{not json") is None
+
+
+def test_json_detectors_share_one_parse_per_context():
+    context = AnalysisContext(code='{"a": null, "b": [9, 1]}', language="json")
+    misses = parse_json.cache_info().misses
+    assert JsonNullSprawlDetector().detect(
+        context,
+        JsonNullSprawlConfig(max_null_values=0),
+    )
+    JsonArrayOrderDetector().detect(context, JsonArrayOrderConfig())
+    assert parse_json.cache_info().misses == misses + 1
+    assert context.ast_tree is None
+    assert context.ast_status is AstStatus.unsupported
+
+
+def test_json_parse_code_reuses_cached_parse():
+    code = '{"items": [1, 2]}'
+    assert JsonAnalyzer().parse_code(code).tree is parse_json(code).tree
+
+
+def test_json_detectors_reuse_analyzer_parse_tree():
+    context = AnalysisContext(
+        code="{}",
+        language="json",
+        ast_tree=ParserResult(type="json", tree={"a": None, "b": None}),
+    )
+    assert JsonNullSprawlDetector().detect(
+        context,
+        JsonNullSprawlConfig(max_null_values=1),
+    )
+
+
+def test_json_detectors_skip_parse_after_analyzer_failure():
+    context = AnalysisContext(
+        code='{"a": null}',
+        language="json",
+        ast_status=AstStatus.parse_failed,
+    )
+    assert not JsonNullSprawlDetector().detect(
+        context,
+        JsonNullSprawlConfig(max_null_values=0),
+    )
 
 
-def _detect(detector, code: str, config):
-    return detector.detect(AnalysisContext(code=code, language="json"), config)
+def test_json_detectors_handle_invalid_json_without_mutating_context():
+    context = AnalysisContext(code="{not json", language="json")
+    assert not JsonKeyCasingDetector().detect(context, JsonKeyCasingConfig())
+    assert not JsonNullSprawlDetector().detect(context, JsonNullSprawlConfig())
+    assert context.ast_status is AstStatus.unsupported
 
 
-def test_json_trailing_commas_strict_vs_json5():
+def test_json_trailing_commas_strict_vs_json5(detect):
     code = '{ "name": "demo", }'
-    assert _detect(JsonStrictnessDetector(), code, JsonStrictnessConfig())
-    assert not _detect(
-        JsonStrictnessDetector(),
+    assert detect(JsonStrictnessDetector, code, JsonStrictnessConfig())
+    assert not detect(
+        JsonStrictnessDetector,
         code,
         JsonStrictnessConfig(target_format="json5"),
     )
 
 
-def test_json_deep_nesting_violation():
+def test_json_deep_nesting_violation(detect):
     code = '{"a":{"b":{"c":{"d":{"e":{"f":1}}}}}}'
-    violations = _detect(
-        JsonSchemaConsistencyDetector(),
+    violations = detect(
+        JsonSchemaConsistencyDetector,
         code,
         JsonSchemaConsistencyConfig(max_depth=5),
     )
     assert violations
 
 
-def test_json_duplicate_keys_violation():
-    violations = _detect(
-        JsonDuplicateKeyDetector(),
+def test_json_duplicate_keys_violation(detect):
+    violations = detect(
+        JsonDuplicateKeyDetector,
         '{"a": 1, "a": 2}',
         JsonDuplicateKeyConfig(),
     )
     assert violations
 
 
-def test_json_duplicate_keys_no_violation():
-    violations = _detect(
-        JsonDuplicateKeyDetector(),
+def test_json_duplicate_keys_no_violation(detect):
+    violations = detect(
+        JsonDuplicateKeyDetector,
         '{"a": 1, "b": 2}',
         JsonDuplicateKeyConfig(),
     )
     assert not violations
 
 
-def test_json_magic_string_repetition_violation():
-    violations = _detect(
-        JsonMagicStringDetector(),
+def test_json_magic_string_repetition_violation(detect):
+    violations = detect(
+        JsonMagicStringDetector,
         '{"status":"active","state":"active","mode":"active"}',
         JsonMagicStringConfig(min_repetition=3),
     )
     assert violations
 
 
-def test_json_magic_string_no_violation():
-    violations = _detect(
-        JsonMagicStringDetector(),
+def test_json_magic_string_no_violation(detect):
+    violations = detect(
+        JsonMagicStringDetector,
         '{"status":"active","state":"pending"}',
         JsonMagicStringConfig(min_repetition=3),
     )
     assert not violations
 
 
-def test_json_inconsistent_key_casing_violation():
-    violations = _detect(
-        JsonKeyCasingDetector(),
+def test_json_inconsistent_key_casing_violation(detect):
+    violations = detect(
+        JsonKeyCasingDetector,
         '{"camelCase": 1, "snake_case": 2}',
         JsonKeyCasingConfig(),
     )
     assert violations
 
 
-def test_json_oversized_inline_array_violation():
-    violations = _detect(
-        JsonArrayOrderDetector(),
+def test_json_oversized_inline_array_violation(detect):
+    violations = detect(
+        JsonArrayOrderDetector,
         '{"values":[1,2,3,4,5]}',
         JsonArrayOrderConfig(max_inline_array_size=4),
     )
     assert violations
 
 
-def test_json_null_sprawl_violation():
-    violations = _detect(
-        JsonNullSprawlDetector(),
+def test_json_null_sprawl_violation(detect):
+    violations = detect(
+        JsonNullSprawlDetector,
         '{"a":null,"b":null,"c":null,"d":null}',
         JsonNullSprawlConfig(max_null_values=3),
     )
     assert violations
 
 
-def test_json_date_format_non_iso_violation():
-    violations = _detect(
-        JsonDateFormatDetector(),
+def test_json_date_format_non_iso_violation(detect):
+    violations = detect(
+        JsonDateFormatDetector,
         '{"created_at": "03/15/2024", "name": "test"}',
         JsonDateFormatConfig(),
     )
     assert violations
 
 
-def test_json_date_format_iso_no_violation():
-    violations = _detect(
-        JsonDateFormatDetector(),
+def test_json_date_format_iso_no_violation(detect):
+    violations = detect(
+        JsonDateFormatDetector,
         '{"created_at": "2024-03-15", "name": "test"}',
         JsonDateFormatConfig(),
     )
     assert not violations
 
 
-def test_json_date_format_iso_datetime_no_violation():
-    violations = _detect(
-        JsonDateFormatDetector(),
+def test_json_date_format_iso_datetime_no_violation(detect):
+    violations = detect(
+        JsonDateFormatDetector,
         '{"timestamp": "2024-03-15T10:30:00Z"}',
         JsonDateFormatConfig(),
     )
     assert not violations
 
 
-def test_json_null_handling_top_level_violation():
-    violations = _detect(
-        JsonNullHandlingDetector(),
+def test_json_null_handling_top_level_violation(detect):
+    violations = detect(
+        JsonNullHandlingDetector,
         '{"name": "test", "config": null}',
         JsonNullHandlingConfig(max_top_level_nulls=0),
     )
     assert violations
 
 
-def test_json_null_handling_within_limit():
-    violations = _detect(
-        JsonNullHandlingDetector(),
+def test_json_null_handling_within_limit(detect):
+    violations = detect(
+        JsonNullHandlingDetector,
         '{"name": "test", "config": null}',
         JsonNullHandlingConfig(max_top_level_nulls=1),
     )
     assert not violations
 
 
-def test_json_null_handling_non_object_no_violation():
-    violations = _detect(
-        JsonNullHandlingDetector(),
+def test_json_null_handling_non_object_no_violation(detect):
+    violations = detect(
+        JsonNullHandlingDetector,
         "[null, null, null]",
         JsonNullHandlingConfig(max_top_level_nulls=0),
     )
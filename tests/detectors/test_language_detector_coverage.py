@@ -1,8 +1,27 @@
 from __future__ import annotations
 
+import pytest
+
 from mcp_zen_of_languages.utils.language_detection import detect_language_from_content
 
 
 def test_language_detector_ruby_branch():
     result = detect_language_from_content("end\n")
     assert result.language == "unknown"
+
+
+@pytest.mark.parametrize(
+    ("code", "expected"),
+    [
+        pytest.param("<template><div /></template>\n", "unknown", id="vue-needs-both"),
+        pytest.param("FROM Django.db import models\n", "django", id="case-folded"),
+        pytest.param("DEF foo\n", "unknown", id="python-case-sensitive"),
+        pytest.param(
+            "const x = useState(0)\ndef helper(): pass\n",
+            "react",
+            id="framework-before-language",
+        ),
+    ],
+)
+def test_content_heuristics_resolve_in_priority_order(code, expected):
+    assert detect_language_from_content(code).language == expected
@@ -13,6 +13,9 @@ from mcp_zen_of_languages.languages.powershell.detectors import (
 )
 
 
+LONG_JS_FUNCTION = "function foo() {\n" + "  a++;\n" * 10 + "}\n"
+
+
 def test_js_async_error_handling_detector():
     context = AnalysisContext(code="async function foo() {}", language="javascript")
     violations = JsAsyncErrorHandlingDetector().detect(
@@ -32,8 +35,7 @@ def test_js_async_error_handling_detector_for_promises():
 
 
 def test_js_function_length_detector():
-    code = "function foo() {\n" + "  a++;\n" * 10 + "}\n"
-    context = AnalysisContext(code=code, language="javascript")
+    context = AnalysisContext(code=LONG_JS_FUNCTION, language="javascript")
     config = JsFunctionLengthConfig().model_copy(update={"max_function_length": 1})
     violations = JsFunctionLengthDetector().detect(context, config)
     assert violations
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.configs import LatexBibliographyHygieneConfig
 from mcp_zen_of_languages.languages.configs import LatexCaptionCompletenessConfig
@@ -29,74 +31,81 @@ from mcp_zen_of_languages.languages.latex.detectors import LatexUnusedPackagesDe
 from mcp_zen_of_languages.languages.latex.detectors import LatexWidthAbstractionDetector
 
 
-def _detect(detector, code: str, config, **kwargs):
-    return detector.detect(
-        AnalysisContext(code=code, language="latex", **kwargs), config
-    )
+@pytest.fixture(scope="module")
+def detect():
+    detectors = {}
+
+    def run(detector_cls, code: str, config, **kwargs):
+        if detector_cls not in detectors:
+            detectors[detector_cls] = detector_cls()
+        context = AnalysisContext(code=code, language="latex", **kwargs)
+        return detectors[detector_cls].detect(context, config)
 
+    return run
 
-def test_latex_macro_definition_detector_flags_def():
-    violations = _detect(
-        LatexMacroDefinitionDetector(),
+
+def test_latex_macro_definition_detector_flags_def(detect):
+    violations = detect(
+        LatexMacroDefinitionDetector,
         r"\def\foo{bar}",
         LatexMacroDefinitionConfig(),
     )
     assert violations
 
 
-def test_latex_label_ref_detector_flags_unresolved_ref():
-    violations = _detect(
-        LatexLabelRefDisciplineDetector(),
+def test_latex_label_ref_detector_flags_unresolved_ref(detect):
+    violations = detect(
+        LatexLabelRefDisciplineDetector,
         r"\ref{eq:missing}",
         LatexLabelRefDisciplineConfig(),
     )
     assert violations
 
 
-def test_latex_caption_detector_flags_missing_caption():
-    violations = _detect(
-        LatexCaptionCompletenessDetector(),
+def test_latex_caption_detector_flags_missing_caption(detect):
+    violations = detect(
+        LatexCaptionCompletenessDetector,
         "\\begin{figure}\n\\includegraphics{plot}\n\\end{figure}",
         LatexCaptionCompletenessConfig(),
     )
     assert violations
 
 
-def test_latex_bibliography_detector_flags_uncited_bibitem():
-    violations = _detect(
-        LatexBibliographyHygieneDetector(),
+def test_latex_bibliography_detector_flags_uncited_bibitem(detect):
+    violations = detect(
+        LatexBibliographyHygieneDetector,
         "\\begin{thebibliography}{9}\n\\bibitem{a} Ref\n\\end{thebibliography}",
         LatexBibliographyHygieneConfig(),
     )
     assert violations
 
 
-def test_latex_width_detector_flags_absolute_units():
-    violations = _detect(
-        LatexWidthAbstractionDetector(),
+def test_latex_width_detector_flags_absolute_units(detect):
+    violations = detect(
+        LatexWidthAbstractionDetector,
         r"\setlength{\parindent}{12pt}",
         LatexWidthAbstractionConfig(),
     )
     assert violations
 
 
-def test_latex_semantic_detector_flags_textit():
-    violations = _detect(
-        LatexSemanticMarkupDetector(),
+def test_latex_semantic_detector_flags_textit(detect):
+    violations = detect(
+        LatexSemanticMarkupDetector,
         r"\textit{important}",
         LatexSemanticMarkupConfig(),
     )
     assert violations
 
 
-def test_latex_include_loop_detector_flags_cycle():
+def test_latex_include_loop_detector_flags_cycle(detect):
     code = r"\input{chapter1}"
     other_files = {
         "chapter1.tex": r"\input{main}",
         "main.tex": code,
     }
-    violations = _detect(
-        LatexIncludeLoopDetector(),
+    violations = detect(
+        LatexIncludeLoopDetector,
         code,
         LatexIncludeLoopConfig(),
         path="main.tex",
@@ -105,18 +114,47 @@ def test_latex_include_loop_detector_flags_cycle():
     assert violations
 
 
-def test_latex_encoding_detector_flags_missing_declaration():
-    violations = _detect(
-        LatexEncodingDeclarationDetector(),
+@pytest.mark.parametrize(
+    ("other_files", "expect_violation"),
+    [
+        pytest.param(
+            {"a.tex": r"\input{b}", "b.tex": r"\input{c}", "c.tex": r"\input{a}"},
+            True,
+            id="indirect-cycle",
+        ),
+        pytest.param(
+            {"a.tex": r"\input{c}", "b.tex": r"\input{c}", "c.tex": "Leaf"},
+            False,
+            id="shared-leaf-is-not-a-cycle",
+        ),
+    ],
+)
+def test_latex_include_loop_detector_walks_the_include_graph(
+    detect, other_files, expect_violation
+):
+    code = r"\input{a}\input{b}"
+    violations = detect(
+        LatexIncludeLoopDetector,
+        code,
+        LatexIncludeLoopConfig(),
+        path="main.tex",
+        other_files={**other_files, "main.tex": code},
+    )
+    assert bool(violations) is expect_violation
+
+
+def test_latex_encoding_detector_flags_missing_declaration(detect):
+    violations = detect(
+        LatexEncodingDeclarationDetector,
         r"\documentclass{article}\begin{document}Hi\end{document}",
         LatexEncodingDeclarationConfig(),
     )
     assert violations
 
 
-def test_latex_unused_package_detector_flags_unused_package():
-    violations = _detect(
-        LatexUnusedPackagesDetector(),
+def test_latex_unused_package_detector_flags_unused_package(detect):
+    violations = detect(
+        LatexUnusedPackagesDetector,
         r"\usepackage{graphicx}\begin{document}Hello\end{document}",
         LatexUnusedPackagesConfig(),
     )
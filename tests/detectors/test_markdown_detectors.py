@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.configs import MarkdownAltTextConfig
 from mcp_zen_of_languages.languages.configs import MarkdownBareUrlConfig
@@ -31,89 +33,97 @@ from mcp_zen_of_languages.languages.markdown.detectors import (
 from mcp_zen_of_languages.languages.markdown.detectors import _parse_named_imports
 
 
-def _detect(detector, code: str, config, path: str | None = None):
-    context = AnalysisContext(code=code, language="markdown", path=path)
-    return detector.detect(context, config)
+@pytest.fixture(scope="module")
+def detect():
+    detectors = {}
+
+    def run(detector_cls, code: str, config, path: str | None = None):
+        if detector_cls not in detectors:
+            detectors[detector_cls] = detector_cls()
+        context = AnalysisContext(code=code, language="markdown", path=path)
+        return detectors[detector_cls].detect(context, config)
 
+    return run
 
-def test_markdown_heading_hierarchy_violation():
+
+def test_markdown_heading_hierarchy_violation(detect):
     code = "# Title\n\n### Skipped level\n"
-    violations = _detect(
-        MarkdownHeadingHierarchyDetector(),
+    violations = detect(
+        MarkdownHeadingHierarchyDetector,
         code,
         MarkdownHeadingHierarchyConfig(),
     )
     assert violations
 
 
-def test_markdown_heading_requires_top_level_h1():
-    violations = _detect(
-        MarkdownHeadingHierarchyDetector(),
+def test_markdown_heading_requires_top_level_h1(detect):
+    violations = detect(
+        MarkdownHeadingHierarchyDetector,
         "## Subtitle\n\nBody\n",
         MarkdownHeadingHierarchyConfig(),
     )
     assert violations
 
 
-def test_markdown_alt_text_violation():
-    violations = _detect(
-        MarkdownAltTextDetector(),
+def test_markdown_alt_text_violation(detect):
+    violations = detect(
+        MarkdownAltTextDetector,
         "![ ](image.png)",
         MarkdownAltTextConfig(),
     )
     assert violations
 
 
-def test_markdown_bare_url_violation():
-    violations = _detect(
-        MarkdownBareUrlDetector(),
+def test_markdown_bare_url_violation(detect):
+    violations = detect(
+        MarkdownBareUrlDetector,
         "See http://example.com for details.",
         MarkdownBareUrlConfig(),
     )
     assert violations
 
 
-def test_markdown_code_fence_language_violation():
-    violations = _detect(
-        MarkdownCodeFenceLanguageDetector(),
+def test_markdown_code_fence_language_violation(detect):
+    violations = detect(
+        MarkdownCodeFenceLanguageDetector,
         "```\nprint('hi')\n```",
         MarkdownCodeFenceLanguageConfig(),
     )
     assert violations
 
 
-def test_markdown_code_fence_with_language_no_violation():
-    violations = _detect(
-        MarkdownCodeFenceLanguageDetector(),
+def test_markdown_code_fence_with_language_no_violation(detect):
+    violations = detect(
+        MarkdownCodeFenceLanguageDetector,
         "```python\nprint('hi')\n```",
         MarkdownCodeFenceLanguageConfig(),
     )
     assert not violations
 
 
-def test_markdown_frontmatter_missing_required_keys():
-    violations = _detect(
-        MarkdownFrontMatterDetector(),
+def test_markdown_frontmatter_missing_required_keys(detect):
+    violations = detect(
+        MarkdownFrontMatterDetector,
         "---\ntitle: Doc\n---\n# Doc\n",
         MarkdownFrontMatterConfig(required_frontmatter_keys=["title", "description"]),
     )
     assert violations
 
 
-def test_markdown_frontmatter_complete_no_violation():
-    violations = _detect(
-        MarkdownFrontMatterDetector(),
+def test_markdown_frontmatter_complete_no_violation(detect):
+    violations = detect(
+        MarkdownFrontMatterDetector,
         "---\ntitle: Doc\ndescription: Desc\n---\n# Doc\n",
         MarkdownFrontMatterConfig(required_frontmatter_keys=["title", "description"]),
     )
     assert not violations
 
 
-def test_markdown_dead_relative_link_violation(tmp_path):
+def test_markdown_dead_relative_link_violation(detect, tmp_path):
     source_path = tmp_path / "docs" / "guide.md"
     source_path.parent.mkdir(parents=True)
-    violations = _detect(
-        MarkdownFrontMatterDetector(),
+    violations = detect(
+        MarkdownFrontMatterDetector,
         "[Missing](./missing.md)\n",
         MarkdownFrontMatterConfig(),
         path=str(source_path),
@@ -121,13 +131,13 @@ def test_markdown_dead_relative_link_violation(tmp_path):
     assert violations
 
 
-def test_markdown_dead_relative_link_allows_existing_target(tmp_path):
+def test_markdown_dead_relative_link_allows_existing_target(detect, tmp_path):
     docs_dir = tmp_path / "docs"
     docs_dir.mkdir()
     (docs_dir / "intro.md").write_text("# Intro\n", encoding="utf-8")
     doc_path = docs_dir / "guide.md"
-    violations = _detect(
-        MarkdownFrontMatterDetector(),
+    violations = detect(
+        MarkdownFrontMatterDetector,
         "[Intro](./intro.md)\n",
         MarkdownFrontMatterConfig(),
         path=str(doc_path),
@@ -135,14 +145,14 @@ def test_markdown_dead_relative_link_allows_existing_target(tmp_path):
     assert not violations
 
 
-def test_markdown_dead_relative_link_disallows_repo_escape(tmp_path):
+def test_markdown_dead_relative_link_disallows_repo_escape(detect, tmp_path):
     (tmp_path / "pyproject.toml").write_text(
         "[project]\nname = 'tmp'\n", encoding="utf-8"
     )
     (tmp_path / "docs").mkdir()
     doc_path = tmp_path / "docs" / "guide.md"
-    violations = _detect(
-        MarkdownFrontMatterDetector(),
+    violations = detect(
+        MarkdownFrontMatterDetector,
         "[Escape](../../etc/passwd)\n",
         MarkdownFrontMatterConfig(),
         path=str(doc_path),
@@ -150,39 +160,40 @@ def test_markdown_dead_relative_link_disallows_repo_escape(tmp_path):
     assert violations
 
 
-def test_mdx_unnamed_default_export_violation():
-    violations = _detect(
-        MarkdownMdxNamedDefaultExportDetector(),
-        "export default function () {\n  return <div />\n}\n",
-        MarkdownMdxNamedDefaultExportConfig(),
-        path="page.mdx",
-    )
-    assert violations
-
-
-def test_mdx_class_default_export_violation():
-    violations = _detect(
-        MarkdownMdxNamedDefaultExportDetector(),
-        "export default class {\n}\n",
-        MarkdownMdxNamedDefaultExportConfig(),
-        path="page.mdx",
-    )
-    assert violations
-
-
-def test_mdx_expression_default_export_violation():
-    violations = _detect(
-        MarkdownMdxNamedDefaultExportDetector(),
-        "export default ({ title: 'doc' })\n",
+@pytest.mark.parametrize(
+    ("code", "suggestion"),
+    [
+        pytest.param(
+            "export default function () {\n  return <div />\n}\n",
+            "Name the default function export",
+            id="function",
+        ),
+        pytest.param(
+            "export default class {\n}\n",
+            "Name the default class export",
+            id="class",
+        ),
+        pytest.param(
+            "export default ({ title: 'doc' })\n",
+            "anonymous default expression",
+            id="expression",
+        ),
+    ],
+)
+def test_mdx_anonymous_default_export_violation(detect, code, suggestion):
+    violations = detect(
+        MarkdownMdxNamedDefaultExportDetector,
+        code,
         MarkdownMdxNamedDefaultExportConfig(),
         path="page.mdx",
     )
-    assert violations
+    assert len(violations) == 1
+    assert suggestion in violations[0].suggestion
 
 
-def test_mdx_default_export_detector_skips_plain_markdown():
-    violations = _detect(
-        MarkdownMdxNamedDefaultExportDetector(),
+def test_mdx_default_export_detector_skips_plain_markdown(detect):
+    violations = detect(
+        MarkdownMdxNamedDefaultExportDetector,
         "# Plain markdown\n",
         MarkdownMdxNamedDefaultExportConfig(),
         path="README.md",
@@ -190,10 +201,10 @@ def test_mdx_default_export_detector_skips_plain_markdown():
     assert not violations
 
 
-def test_mdx_default_export_detector_ignores_fenced_export_in_markdown():
+def test_mdx_default_export_detector_ignores_fenced_export_in_markdown(detect):
     code = "```js\nexport default function () {}\n```\n"
-    violations = _detect(
-        MarkdownMdxNamedDefaultExportDetector(),
+    violations = detect(
+        MarkdownMdxNamedDefaultExportDetector,
         code,
         MarkdownMdxNamedDefaultExportConfig(),
         path="README.md",
@@ -201,10 +212,10 @@ def test_mdx_default_export_detector_ignores_fenced_export_in_markdown():
     assert not violations
 
 
-def test_mdx_import_hygiene_violation():
+def test_mdx_import_hygiene_violation(detect):
     code = 'import Card from "./Card"\n\n# Docs\n\nText only.\n'
-    violations = _detect(
-        MarkdownMdxImportHygieneDetector(),
+    violations = detect(
+        MarkdownMdxImportHygieneDetector,
         code,
         MarkdownMdxImportHygieneConfig(),
         path="page.mdx",
@@ -212,10 +223,24 @@ def test_mdx_import_hygiene_violation():
     assert violations
 
 
-def test_mdx_import_hygiene_ignores_fenced_import_snippet():
+def test_mdx_import_hygiene_matches_whole_identifiers(detect):
+    code = (
+        'import Card from "./Card"\nimport CardGrid from "./CardGrid"\n\n<CardGrid />\n'
+    )
+    violations = detect(
+        MarkdownMdxImportHygieneDetector,
+        code,
+        MarkdownMdxImportHygieneConfig(),
+        path="page.mdx",
+    )
+    assert len(violations) == 1
+    assert "'Card'" in violations[0].suggestion
+
+
+def test_mdx_import_hygiene_ignores_fenced_import_snippet(detect):
     code = "```jsx\nimport Card from './Card'\n```\n# Docs\n"
-    violations = _detect(
-        MarkdownMdxImportHygieneDetector(),
+    violations = detect(
+        MarkdownMdxImportHygieneDetector,
         code,
         MarkdownMdxImportHygieneConfig(),
         path="README.md",
@@ -223,10 +248,10 @@ def test_mdx_import_hygiene_ignores_fenced_import_snippet():
     assert not violations
 
 
-def test_mdx_import_hygiene_allows_used_and_side_effect_imports():
+def test_mdx_import_hygiene_allows_used_and_side_effect_imports(detect):
     code = 'import "./theme.css"\nimport Card, { Badge as Pill } from "./ui"\n\n<Card />\n<Pill />\n'
-    violations = _detect(
-        MarkdownMdxImportHygieneDetector(),
+    violations = detect(
+        MarkdownMdxImportHygieneDetector,
         code,
         MarkdownMdxImportHygieneConfig(),
         path="page.mdx",
@@ -234,18 +259,18 @@ def test_mdx_import_hygiene_allows_used_and_side_effect_imports():
     assert not violations
 
 
-def test_markdown_bare_url_detector_ignores_links_and_autolinks():
-    violations = _detect(
-        MarkdownBareUrlDetector(),
+def test_markdown_bare_url_detector_ignores_links_and_autolinks(detect):
+    violations = detect(
+        MarkdownBareUrlDetector,
         "[Docs](https://example.com) and <https://example.org>",
         MarkdownBareUrlConfig(),
     )
     assert not violations
 
 
-def test_markdown_bare_url_detector_ignores_inline_code_urls():
-    violations = _detect(
-        MarkdownBareUrlDetector(),
+def test_markdown_bare_url_detector_ignores_inline_code_urls(detect):
+    violations = detect(
+        MarkdownBareUrlDetector,
         "Use `http://example.com` in examples.",
         MarkdownBareUrlConfig(),
     )
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.bash.detectors import BashArgumentValidationDetector
 from mcp_zen_of_languages.languages.bash.detectors import BashArrayUsageDetector
@@ -115,204 +117,242 @@ from mcp_zen_of_languages.languages.typescript.detectors import TsUnknownOverAny
 from mcp_zen_of_languages.languages.typescript.detectors import TsUtilityTypesDetector
 
 
-def test_other_language_detectors_cover_paths():  # noqa: PLR0915
-    assert BashExitCodeChecksDetector().name == "bash-005"
-    assert BashFunctionUsageDetector().name == "bash-006"
-    assert BashLocalVariablesDetector().name == "bash-007"
-    assert BashArgumentValidationDetector().name == "bash-010"
-    assert BashMeaningfulNamesDetector().name == "bash-011"
-    assert BashSignalHandlingDetector().name == "bash-012"
-    assert BashArrayUsageDetector().name == "bash-013"
-    assert BashUsageInfoDetector().name == "bash-014"
-    bash_context = AnalysisContext(code="echo $foo", language="bash")
-    assert BashStrictModeDetector().detect(bash_context, BashStrictModeConfig())
-    assert BashQuoteVariablesDetector().detect(bash_context, BashQuoteVariablesConfig())
-    bash_brackets = AnalysisContext(
-        code="if [ -f file ]; then echo ok; fi",
-        language="bash",
-    )
-    assert BashDoubleBracketsDetector().detect(
-        bash_brackets,
-        BashDoubleBracketsConfig(),
-    )
-    bash_sub = AnalysisContext(code="output=`echo hi`", language="bash")
-    assert BashCommandSubstitutionDetector().detect(
-        bash_sub,
-        BashCommandSubstitutionConfig(),
-    )
-    bash_readonly = AnalysisContext(code="FOO=bar", language="bash")
-    assert BashReadonlyConstantsDetector().detect(
-        bash_readonly,
-        BashReadonlyConstantsConfig(),
-    )
-    bash_exit = AnalysisContext(code="rm file", language="bash")
-    assert BashExitCodeChecksDetector().detect(bash_exit, BashExitCodeConfig())
-    bash_long = AnalysisContext(code="echo 1\n" * 3, language="bash")
-    length_cfg = Bash006Config().model_copy(
-        update={"max_script_length_without_functions": 1},
-    )
-    assert BashFunctionUsageDetector().detect(bash_long, length_cfg)
-    bash_local = AnalysisContext(code="foo() {\n  value=1\n}\n", language="bash")
-    assert BashLocalVariablesDetector().detect(bash_local, BashLocalVariablesConfig())
-    bash_args = AnalysisContext(code="echo $1\n", language="bash")
-    assert BashArgumentValidationDetector().detect(
-        bash_args,
-        BashArgumentValidationConfig(),
-    )
-    bash_names = AnalysisContext(code="a=1\n", language="bash")
-    name_cfg = Bash011Config().model_copy(update={"min_variable_name_length": 3})
-    assert BashMeaningfulNamesDetector().detect(bash_names, name_cfg)
-    bash_signal = AnalysisContext(code="tmp=$(mktemp)\n", language="bash")
-    assert BashSignalHandlingDetector().detect(bash_signal, BashSignalHandlingConfig())
-    bash_array = AnalysisContext(
-        code="for item in $items; do echo $item; done\n",
-        language="bash",
-    )
-    assert BashArrayUsageDetector().detect(bash_array, BashArrayUsageConfig())
-    bash_usage = AnalysisContext(code="echo 'hi'\n", language="bash")
-    assert BashUsageInfoDetector().detect(bash_usage, BashUsageInfoConfig())
+NAME_CASES: list[tuple[type, str]] = [
+    (BashExitCodeChecksDetector, "bash-005"),
+    (BashFunctionUsageDetector, "bash-006"),
+    (BashLocalVariablesDetector, "bash-007"),
+    (BashArgumentValidationDetector, "bash-010"),
+    (BashMeaningfulNamesDetector, "bash-011"),
+    (BashSignalHandlingDetector, "bash-012"),
+    (BashArrayUsageDetector, "bash-013"),
+    (BashUsageInfoDetector, "bash-014"),
+]
 
-    cpp_context = AnalysisContext(code="int* x = new int;\n", language="cpp")
-    assert CppSmartPointerDetector().detect(cpp_context, CppSmartPointerConfig())
-    cpp_null = AnalysisContext(code="if (ptr == NULL) {}\n", language="cpp")
-    assert CppNullptrDetector().detect(cpp_null, CppNullptrConfig())
 
-    csharp_context = AnalysisContext(code="task.Result;\n", language="csharp")
-    assert CSharpAsyncAwaitDetector().detect(csharp_context, CSharpAsyncAwaitConfig())
-    csharp_str = AnalysisContext(code="String.Format('x', y);\n", language="csharp")
-    assert CSharpStringInterpolationDetector().detect(
-        csharp_str,
-        CSharpStringInterpolationConfig(),
-    )
+@pytest.mark.parametrize(
+    ("detector_cls", "expected_name"),
+    NAME_CASES,
+    ids=[name for _, name in NAME_CASES],
+)
+def test_other_language_detector_names(detector_cls, expected_name):
+    assert DETECTORS[detector_cls].name == expected_name
 
-    go_context = AnalysisContext(code="panic('x')\n", language="go")
-    assert GoErrorHandlingDetector().detect(go_context, GoErrorHandlingConfig())
-    go_iface = AnalysisContext(
-        code="type Foo interface {\n A()\n B()\n C()\n}\n",
-        language="go",
-    )
-    iface_cfg = GoInterfaceSizeConfig().model_copy(update={"max_interface_methods": 1})
-    assert GoInterfaceSizeDetector().detect(go_iface, iface_cfg)
-    go_ctx = AnalysisContext(code="package main\n", language="go")
-    assert GoContextUsageDetector().detect(go_ctx, GoContextUsageConfig())
-    go_loop = AnalysisContext(
-        code="for i := 0; i < 1; i++ { defer foo() }",
-        language="go",
-    )
-    assert GoDeferUsageDetector().detect(go_loop, GoDeferUsageConfig())
-    go_name = AnalysisContext(
-        code="var this_is_a_super_long_variable_name int\n",
-        language="go",
-    )
-    assert GoNamingConventionDetector().detect(go_name, GoNamingConventionConfig())
 
-    js_context = AnalysisContext(
-        code="function foo() { var x = 1; }",
-        language="javascript",
-    )
-    assert JsNoVarDetector().detect(js_context, JsNoVarConfig())
-    assert JsStrictEqualityDetector().detect(
-        AnalysisContext(code="if (a == b) {}", language="javascript"),
+CASES: list[tuple[type, object, str, str]] = [
+    (BashStrictModeDetector, BashStrictModeConfig(), "echo $foo", "bash"),
+    (BashQuoteVariablesDetector, BashQuoteVariablesConfig(), "echo $foo", "bash"),
+    (
+        BashDoubleBracketsDetector,
+        BashDoubleBracketsConfig(),
+        "if [ -f file ]; then echo ok; fi",
+        "bash",
+    ),
+    (
+        BashCommandSubstitutionDetector,
+        BashCommandSubstitutionConfig(),
+        "output=`echo hi`",
+        "bash",
+    ),
+    (BashReadonlyConstantsDetector, BashReadonlyConstantsConfig(), "FOO=bar", "bash"),
+    (BashExitCodeChecksDetector, BashExitCodeConfig(), "rm file", "bash"),
+    (
+        BashFunctionUsageDetector,
+        Bash006Config(max_script_length_without_functions=1),
+        "echo 1\n" * 3,
+        "bash",
+    ),
+    (
+        BashLocalVariablesDetector,
+        BashLocalVariablesConfig(),
+        "foo() {\n  value=1\n}\n",
+        "bash",
+    ),
+    (
+        BashArgumentValidationDetector,
+        BashArgumentValidationConfig(),
+        "echo $1\n",
+        "bash",
+    ),
+    (
+        BashMeaningfulNamesDetector,
+        Bash011Config(min_variable_name_length=3),
+        "a=1\n",
+        "bash",
+    ),
+    (
+        BashSignalHandlingDetector,
+        BashSignalHandlingConfig(),
+        "tmp=$(mktemp)\n",
+        "bash",
+    ),
+    (
+        BashArrayUsageDetector,
+        BashArrayUsageConfig(),
+        "for item in $items; do echo $item; done\n",
+        "bash",
+    ),
+    (BashUsageInfoDetector, BashUsageInfoConfig(), "echo 'hi'\n", "bash"),
+    (CppSmartPointerDetector, CppSmartPointerConfig(), "int* x = new int;\n", "cpp"),
+    (CppNullptrDetector, CppNullptrConfig(), "if (ptr == NULL) {}\n", "cpp"),
+    (CSharpAsyncAwaitDetector, CSharpAsyncAwaitConfig(), "task.Result;\n", "csharp"),
+    (
+        CSharpStringInterpolationDetector,
+        CSharpStringInterpolationConfig(),
+        "String.Format('x', y);\n",
+        "csharp",
+    ),
+    (GoErrorHandlingDetector, GoErrorHandlingConfig(), "panic('x')\n", "go"),
+    (
+        GoInterfaceSizeDetector,
+        GoInterfaceSizeConfig(max_interface_methods=1),
+        "type Foo interface {\n A()\n B()\n C()\n}\n",
+        "go",
+    ),
+    (GoContextUsageDetector, GoContextUsageConfig(), "package main\n", "go"),
+    (
+        GoDeferUsageDetector,
+        GoDeferUsageConfig(),
+        "for i := 0; i < 1; i++ { defer foo() }",
+        "go",
+    ),
+    (
+        GoNamingConventionDetector,
+        GoNamingConventionConfig(),
+        "var this_is_a_super_long_variable_name int\n",
+        "go",
+    ),
+    (
+        JsNoVarDetector,
+        JsNoVarConfig(),
+        "function foo() { var x = 1; }",
+        "javascript",
+    ),
+    (
+        JsStrictEqualityDetector,
         JsStrictEqualityConfig(),
-    )
-    callback_cfg = JsCallbackNestingConfig().model_copy(
-        update={"max_callback_nesting": 0},
-    )
-    assert JsCallbackNestingDetector().detect(
-        AnalysisContext(
-            code="function foo() { function bar() {} }",
-            language="javascript",
-        ),
-        callback_cfg,
-    )
-    assert JsAsyncErrorHandlingDetector().detect(
-        AnalysisContext(
-            code="async function foo() { return 1 }",
-            language="javascript",
-        ),
+        "if (a == b) {}",
+        "javascript",
+    ),
+    (
+        JsCallbackNestingDetector,
+        JsCallbackNestingConfig(max_callback_nesting=0),
+        "function foo() { function bar() {} }",
+        "javascript",
+    ),
+    (
+        JsAsyncErrorHandlingDetector,
         JsAsyncErrorHandlingConfig(),
-    )
-    js_long = AnalysisContext(
-        code="function foo() {\n" + "x\n" * 10 + "}\n",
-        language="javascript",
-    )
-    js_cfg = JsFunctionLengthConfig().model_copy(update={"max_function_length": 1})
-    assert JsFunctionLengthDetector().detect(js_long, js_cfg)
-
-    ps_context = AnalysisContext(code="function bad-Name {}\n", language="powershell")
-    assert PowerShellApprovedVerbDetector().detect(
-        ps_context,
+        "async function foo() { return 1 }",
+        "javascript",
+    ),
+    (
+        JsFunctionLengthDetector,
+        JsFunctionLengthConfig(max_function_length=1),
+        "function foo() {\n" + "x\n" * 10 + "}\n",
+        "javascript",
+    ),
+    (
+        PowerShellApprovedVerbDetector,
         PowerShellApprovedVerbConfig(),
-    )
-    assert PowerShellErrorHandlingDetector().detect(
-        ps_context,
+        "function bad-Name {}\n",
+        "powershell",
+    ),
+    (
+        PowerShellErrorHandlingDetector,
         PowerShellErrorHandlingConfig(),
-    )
-    assert PowerShellPascalCaseDetector().detect(
-        ps_context,
+        "function bad-Name {}\n",
+        "powershell",
+    ),
+    (
+        PowerShellPascalCaseDetector,
         PowerShellPascalCaseConfig(),
-    )
-
-    ruby_context = AnalysisContext(
-        code="def BadName\n  foo.bar.baz.qux.quux\nend\n",
-        language="ruby",
-    )
-    assert RubyNamingConventionDetector().detect(
-        ruby_context,
+        "function bad-Name {}\n",
+        "powershell",
+    ),
+    (
+        RubyNamingConventionDetector,
         RubyNamingConventionConfig(),
-    )
-    chain_cfg = RubyMethodChainConfig().model_copy(
-        update={"max_method_chain_length": 1},
-    )
-    assert RubyMethodChainDetector().detect(ruby_context, chain_cfg)
-
-    rust_context = AnalysisContext(code="let x = foo().unwrap();\n", language="rust")
-    assert RustUnwrapUsageDetector().detect(rust_context, RustUnwrapUsageConfig())
-    assert RustUnsafeBlocksDetector().detect(
-        AnalysisContext(code="unsafe { }", language="rust"),
-        RustUnsafeBlocksConfig(),
-    )
-    assert RustCloneOverheadDetector().detect(
-        AnalysisContext(code="x.clone();", language="rust"),
-        RustCloneOverheadConfig(),
-    )
-    assert RustErrorHandlingDetector().detect(
-        AnalysisContext(code="fn foo() -> Result<i32, i32> { Ok(1) }", language="rust"),
+        "def BadName\n  foo.bar.baz.qux.quux\nend\n",
+        "ruby",
+    ),
+    (
+        RubyMethodChainDetector,
+        RubyMethodChainConfig(max_method_chain_length=1),
+        "def BadName\n  foo.bar.baz.qux.quux\nend\n",
+        "ruby",
+    ),
+    (
+        RustUnwrapUsageDetector,
+        RustUnwrapUsageConfig(),
+        "let x = foo().unwrap();\n",
+        "rust",
+    ),
+    (RustUnsafeBlocksDetector, RustUnsafeBlocksConfig(), "unsafe { }", "rust"),
+    (RustCloneOverheadDetector, RustCloneOverheadConfig(), "x.clone();", "rust"),
+    (
+        RustErrorHandlingDetector,
         RustErrorHandlingConfig(),
-    )
-    assert RustTypeSafetyDetector().detect(
-        AnalysisContext(code="struct User { id: i32 }\n", language="rust"),
+        "fn foo() -> Result<i32, i32> { Ok(1) }",
+        "rust",
+    ),
+    (
+        RustTypeSafetyDetector,
         RustTypeSafetyConfig(),
-    )
-
-    ts_context = AnalysisContext(code="let x: any;", language="typescript")
-    assert TsAnyUsageDetector().detect(ts_context, TsAnyUsageConfig())
-    assert TsStrictModeDetector().detect(ts_context, TsStrictModeConfig())
-    ts_interface = AnalysisContext(
-        code="type Foo = { a: string };",
-        language="typescript",
-    )
-    assert TsInterfacePreferenceDetector().detect(
-        ts_interface,
+        "struct User { id: i32 }\n",
+        "rust",
+    ),
+    (TsAnyUsageDetector, TsAnyUsageConfig(), "let x: any;", "typescript"),
+    (TsStrictModeDetector, TsStrictModeConfig(), "let x: any;", "typescript"),
+    (
+        TsInterfacePreferenceDetector,
         TsInterfacePreferenceConfig(),
-    )
-    ts_return = AnalysisContext(
-        code="export function foo() { return 1 }",
-        language="typescript",
-    )
-    assert TsReturnTypeDetector().detect(ts_return, TsReturnTypeConfig())
-    assert TsReadonlyDetector().detect(ts_context, TsReadonlyConfig())
-    ts_guard_context = AnalysisContext(code="foo as Bar", language="typescript")
-    assert TsTypeGuardDetector().detect(ts_guard_context, TsTypeGuardConfig())
-    ts_util = AnalysisContext(code="type Foo = { a: string };", language="typescript")
-    util_cfg = TsUtilityTypesConfig().model_copy(
-        update={"min_utility_type_usage": 1, "min_object_type_aliases": 0},
-    )
-    assert TsUtilityTypesDetector().detect(ts_util, util_cfg)
-    ts_nonnull = AnalysisContext(code="const x = foo!;", language="typescript")
-    assert TsNonNullAssertionDetector().detect(ts_nonnull, TsNonNullAssertionConfig())
-    ts_enum = AnalysisContext(code="const Foo = { A: 1 }", language="typescript")
-    assert TsEnumConstDetector().detect(ts_enum, TsEnumConstConfig())
-    ts_unknown = AnalysisContext(code="let x: any;", language="typescript")
-    unknown_cfg = TsUnknownOverAnyConfig().model_copy(update={"max_any_for_unknown": 0})
-    assert TsUnknownOverAnyDetector().detect(ts_unknown, unknown_cfg)
+        "type Foo = { a: string };",
+        "typescript",
+    ),
+    (
+        TsReturnTypeDetector,
+        TsReturnTypeConfig(),
+        "export function foo() { return 1 }",
+        "typescript",
+    ),
+    (TsReadonlyDetector, TsReadonlyConfig(), "let x: any;", "typescript"),
+    (TsTypeGuardDetector, TsTypeGuardConfig(), "foo as Bar", "typescript"),
+    (
+        TsUtilityTypesDetector,
+        TsUtilityTypesConfig(min_utility_type_usage=1, min_object_type_aliases=0),
+        "type Foo = { a: string };",
+        "typescript",
+    ),
+    (
+        TsNonNullAssertionDetector,
+        TsNonNullAssertionConfig(),
+        "const x = foo!;",
+        "typescript",
+    ),
+    (TsEnumConstDetector, TsEnumConstConfig(), "const Foo = { A: 1 }", "typescript"),
+    (
+        TsUnknownOverAnyDetector,
+        TsUnknownOverAnyConfig(max_any_for_unknown=0),
+        "let x: any;",
+        "typescript",
+    ),
+]
+
+
+DETECTORS = {cls: cls() for cls, *_ in CASES}
+
+
+@pytest.mark.parametrize(
+    ("detector_cls", "config", "code", "language"),
+    [
+        pytest.param(
+            *case,
+            id=case[0].__name__,
+            marks=pytest.mark.xdist_group(name=case[3]),
+        )
+        for case in CASES
+    ],
+)
+def test_other_language_detector_triggers(detector_cls, config, code, language):
+    context = AnalysisContext(code=code, language=language)
+    assert DETECTORS[detector_cls].detect(context, config)
@@ -37,7 +37,37 @@ from mcp_zen_of_languages.models import DependencyAnalysis
 from mcp_zen_of_languages.models import DependencyCycle
 
 
-def test_python_detector_coverage_paths():
+DETECTORS = {
+    cls: cls()
+    for cls in (
+        BareExceptDetector,
+        CircularDependencyDetector,
+        ClassSizeDetector,
+        ConsistencyDetector,
+        ContextManagerDetector,
+        CyclomaticComplexityDetector,
+        DocstringDetector,
+        ExplicitnessDetector,
+        GodClassDetector,
+        LineLengthDetector,
+        LongFunctionDetector,
+        MagicMethodDetector,
+        NamespaceUsageDetector,
+        NestingDepthDetector,
+        SparseCodeDetector,
+    )
+}
+
+_CLASS_CFG = ClassSizeConfig(max_class_length=3)
+_LONG_CFG = LongFunctionConfig(max_function_length=1)
+_MAGIC_CFG = MagicMethodConfig(max_magic_methods=0)
+_NEST_CFG = NestingDepthConfig(max_nesting_depth=0)
+_CC_CFG = CyclomaticComplexityConfig(max_cyclomatic_complexity=5)
+_NS_CFG = NamespaceConfig(max_top_level_symbols=1, max_exports=0)
+_GOD_CFG = GodClassConfig(max_methods=1)
+
+
+def test_python_detector_coverage_paths(python_context):
     code = """
 class BigClass:
     def a(self):
@@ -56,37 +86,26 @@ def foo():
 
 x = 1; y = 2
 """
-    context = AnalysisContext(code=code, language="python")
-    assert LineLengthDetector().detect(context, LineLengthConfig()) == []
-    assert SparseCodeDetector().detect(context, SparseCodeConfig())
+    context = python_context(code)
+    assert DETECTORS[LineLengthDetector].detect(context, LineLengthConfig()) == []
+    assert DETECTORS[SparseCodeDetector].detect(context, SparseCodeConfig())
 
     bare = "try:\n    pass\nexcept:\n    pass\n"
-    bare_context = AnalysisContext(code=bare, language="python")
-    assert BareExceptDetector().detect(bare_context, BareExceptConfig())
+    bare_context = python_context(bare)
+    assert DETECTORS[BareExceptDetector].detect(bare_context, BareExceptConfig())
 
-    doc_context = AnalysisContext(code="def foo():\n    pass\n", language="python")
-    assert DocstringDetector().detect(doc_context, DocstringConfig())
+    doc_context = python_context("def foo():\n    pass\n")
+    assert DETECTORS[DocstringDetector].detect(doc_context, DocstringConfig())
 
-    class_context = AnalysisContext(code=code, language="python")
-    class_cfg = ClassSizeConfig().model_copy(update={"max_class_length": 3})
-    assert ClassSizeDetector().detect(class_context, class_cfg)
+    assert DETECTORS[ClassSizeDetector].detect(context, _CLASS_CFG)
 
-    long_cfg = LongFunctionConfig().model_copy(update={"max_function_length": 1})
-    assert LongFunctionDetector().detect(doc_context, long_cfg)
+    assert DETECTORS[LongFunctionDetector].detect(doc_context, _LONG_CFG)
 
-    magic_cfg = MagicMethodConfig().model_copy(update={"max_magic_methods": 0})
-    magic_context = AnalysisContext(
-        code="def __str__(self):\n    return 'x'\n",
-        language="python",
-    )
-    assert MagicMethodDetector().detect(magic_context, magic_cfg)
+    magic_context = python_context("def __str__(self):\n    return 'x'\n")
+    assert DETECTORS[MagicMethodDetector].detect(magic_context, _MAGIC_CFG)
 
-    nest_cfg = NestingDepthConfig().model_copy(update={"max_nesting_depth": 0})
-    nested_context = AnalysisContext(
-        code="if True:\n    if True:\n        pass\n",
-        language="python",
-    )
-    assert NestingDepthDetector().detect(nested_context, nest_cfg)
+    nested_context = python_context("if True:\n    if True:\n        pass\n")
+    assert DETECTORS[NestingDepthDetector].detect(nested_context, _NEST_CFG)
 
     cc_summary = CyclomaticSummary(
         blocks=[CyclomaticBlock(name="foo", complexity=12, lineno=1)],
@@ -94,31 +113,24 @@ x = 1; y = 2
     )
     cc_context = AnalysisContext(code="def foo():\n    return 1\n", language="python")
     cc_context.cyclomatic_summary = cc_summary
-    cc_cfg = CyclomaticComplexityConfig().model_copy(
-        update={"max_cyclomatic_complexity": 5},
-    )
-    assert CyclomaticComplexityDetector().detect(cc_context, cc_cfg)
+    assert DETECTORS[CyclomaticComplexityDetector].detect(cc_context, _CC_CFG)
 
-    consistency_context = AnalysisContext(
-        code="def foo():\n    pass\n\ndef FooBar():\n    pass\n",
-        language="python",
+    consistency_context = python_context(
+        "def foo():\n    pass\n\ndef FooBar():\n    pass\n"
     )
-    assert ConsistencyDetector().detect(consistency_context, ConsistencyConfig())
-
-    explicit_context = AnalysisContext(
-        code="def foo(x, y):\n    return x\n",
-        language="python",
+    assert DETECTORS[ConsistencyDetector].detect(
+        consistency_context, ConsistencyConfig()
     )
-    assert ExplicitnessDetector().detect(explicit_context, ExplicitnessConfig())
 
-    namespace_context = AnalysisContext(
-        code="def a():\n    pass\n\ndef b():\n    pass\n\n__all__ = ['a', 'b']\n",
-        language="python",
+    explicit_context = python_context("def foo(x, y):\n    return x\n")
+    assert DETECTORS[ExplicitnessDetector].detect(
+        explicit_context, ExplicitnessConfig()
     )
-    ns_cfg = NamespaceConfig().model_copy(
-        update={"max_top_level_symbols": 1, "max_exports": 0},
+
+    namespace_context = python_context(
+        "def a():\n    pass\n\ndef b():\n    pass\n\n__all__ = ['a', 'b']\n"
     )
-    assert NamespaceUsageDetector().detect(namespace_context, ns_cfg)
+    assert DETECTORS[NamespaceUsageDetector].detect(namespace_context, _NS_CFG)
 
     dep_context = AnalysisContext(code="", language="python")
     dep_context.dependency_analysis = DependencyAnalysis(
@@ -126,12 +138,13 @@ x = 1; y = 2
         edges=[("a", "b"), ("b", "a")],
         cycles=[DependencyCycle(cycle=["a", "b", "a"])],
     )
-    assert CircularDependencyDetector().detect(dep_context, CircularDependencyConfig())
+    assert DETECTORS[CircularDependencyDetector].detect(
+        dep_context, CircularDependencyConfig()
+    )
 
-    ctx_context = AnalysisContext(code="open('a')\n", language="python")
-    assert ContextManagerDetector().detect(ctx_context, ContextManagerConfig())
+    ctx_context = python_context("open('a')\n")
+    assert DETECTORS[ContextManagerDetector].detect(ctx_context, ContextManagerConfig())
 
     god_code = "class Huge:\n    def a(self):\n        pass\n    def b(self):\n        pass\n    def c(self):\n        pass\n    def d(self):\n        pass\n"
-    god_context = AnalysisContext(code=god_code, language="python")
-    god_cfg = GodClassConfig().model_copy(update={"max_methods": 1})
-    assert GodClassDetector().detect(god_context, god_cfg)
+    god_context = python_context(god_code)
+    assert DETECTORS[GodClassDetector].detect(god_context, _GOD_CFG)
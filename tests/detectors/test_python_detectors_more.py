@@ -1,16 +1,102 @@
 from __future__ import annotations
 
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.configs import ClassSizeConfig
+from mcp_zen_of_languages.languages.configs import ConsistencyConfig
 from mcp_zen_of_languages.languages.configs import DocstringConfig
+from mcp_zen_of_languages.languages.configs import ExplicitnessConfig
 from mcp_zen_of_languages.languages.configs import LineLengthConfig
+from mcp_zen_of_languages.languages.configs import LongFunctionConfig
 from mcp_zen_of_languages.languages.configs import MagicMethodConfig
 from mcp_zen_of_languages.languages.configs import NameStyleConfig
+from mcp_zen_of_languages.languages.configs import NamespaceConfig
+from mcp_zen_of_languages.languages.configs import NestingDepthConfig
 from mcp_zen_of_languages.languages.python.detectors import ClassSizeDetector
+from mcp_zen_of_languages.languages.python.detectors import ConsistencyDetector
 from mcp_zen_of_languages.languages.python.detectors import DocstringDetector
+from mcp_zen_of_languages.languages.python.detectors import ExplicitnessDetector
 from mcp_zen_of_languages.languages.python.detectors import LineLengthDetector
+from mcp_zen_of_languages.languages.python.detectors import LongFunctionDetector
 from mcp_zen_of_languages.languages.python.detectors import MagicMethodDetector
 from mcp_zen_of_languages.languages.python.detectors import NameStyleDetector
+from mcp_zen_of_languages.languages.python.detectors import NamespaceUsageDetector
+from mcp_zen_of_languages.languages.python.detectors import NestingDepthDetector
+from mcp_zen_of_languages.utils.parsers import parse_python_with_builtin_ast
+
+
+FLAG_CASES: list[tuple[str, type, str, object]] = [
+    (
+        "docstring-missing",
+        DocstringDetector,
+        "def foo():\n    return 1\n",
+        DocstringConfig(),
+    ),
+    (
+        "line-length-long",
+        LineLengthDetector,
+        "a = '" + "x" * 120 + "'\n",
+        LineLengthConfig(),
+    ),
+    (
+        "magic-method-overuse",
+        MagicMethodDetector,
+        "def __str__(self):\n    pass\n" * 5,
+        MagicMethodConfig(max_magic_methods=1),
+    ),
+    (
+        "name-style-heuristic",
+        NameStyleDetector,
+        "def BadName():\n    pass\n",
+        NameStyleConfig(),
+    ),
+    (
+        "consistency-styles",
+        ConsistencyDetector,
+        "def foo():\n    pass\n\ndef Bar():\n    pass\n",
+        ConsistencyConfig(max_naming_styles=1),
+    ),
+    (
+        "explicitness-hints",
+        ExplicitnessDetector,
+        "def foo(x):\n    return x\n",
+        ExplicitnessConfig(),
+    ),
+    (
+        "namespace-exports",
+        NamespaceUsageDetector,
+        "a=1\n__all__ = ['a', 'b', 'c', 'd', 'e']\n",
+        NamespaceConfig(max_top_level_symbols=0, max_exports=1),
+    ),
+    (
+        "nesting-depth",
+        NestingDepthDetector,
+        "if True:\n    if True:\n        pass\n",
+        NestingDepthConfig(max_nesting_depth=0),
+    ),
+    (
+        "nesting-depth-nested-loops",
+        NestingDepthDetector,
+        "for i in range(3):\n    for j in range(3):\n        pass\n",
+        NestingDepthConfig(max_nesting_depth=5),
+    ),
+    (
+        "long-function",
+        LongFunctionDetector,
+        "def foo():\n" + "    x=1\n" * 10,
+        LongFunctionConfig(max_function_length=1),
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("detector_cls", "code", "config"),
+    [case[1:] for case in FLAG_CASES],
+    ids=[case[0] for case in FLAG_CASES],
+)
+def test_python_detector_flags(python_context, detector_cls, code, config):
+    assert detector_cls().detect(python_context(code), config)
 
 
 def test_class_size_detector_handles_parse_error():
@@ -19,30 +105,24 @@ def test_class_size_detector_handles_parse_error():
     assert violations == []
 
 
-def test_docstring_detector_flags_missing():
-    code = "def foo():\n    return 1\n"
+def test_unparsed_context_is_parsed_once_across_detectors():
+    code = (
+        "class Big:\n    def a(self):\n        pass\n    def b(self):\n        pass\n"
+    )
     context = AnalysisContext(code=code, language="python")
-    violations = DocstringDetector().detect(context, DocstringConfig())
-    assert violations
+    misses = parse_python_with_builtin_ast.cache_info().misses
 
+    assert ClassSizeDetector().detect(context, ClassSizeConfig(max_class_length=1))
+    assert DocstringDetector().detect(context, DocstringConfig())
+    assert NameStyleDetector().detect(context, NameStyleConfig()) == []
 
-def test_line_length_detector_flags_long():
-    code = "a = '" + "x" * 120 + "'\n"
-    context = AnalysisContext(code=code, language="python")
-    violations = LineLengthDetector().detect(context, LineLengthConfig())
-    assert violations
-
+    assert parse_python_with_builtin_ast.cache_info().misses == misses + 1
 
-def test_magic_method_detector_flags_overuse():
-    code = "def __str__(self):\n    pass\n" * 5
-    context = AnalysisContext(code=code, language="python")
-    config = MagicMethodConfig().model_copy(update={"max_magic_methods": 1})
-    violations = MagicMethodDetector().detect(context, config)
-    assert violations
 
-
-def test_name_style_detector_heuristic():
-    code = "def BadName():\n    pass\n"
-    context = AnalysisContext(code=code, language="python")
-    violations = NameStyleDetector().detect(context, NameStyleConfig())
-    assert violations
+def test_nesting_depth_detector_measures_deepest_loop_branch(python_context):
+    code = (
+        "for i in x:\n    pass\n"
+        "while y:\n    if z:\n        for j in x:\n            for k in x:\n"
+        "                pass\n"
+    )
+    assert NestingDepthDetector()._max_loop_depth(python_context(code)) == 3
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 from typing import Literal
 
+import pytest
+
 from pydantic import create_model
 
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.languages.configs import DetectorConfig
 from mcp_zen_of_languages.languages.rule_pattern import RulePatternDetector
+from mcp_zen_of_languages.languages.rules import _compile_rule_pattern
 
 
 def _build_config(name: str, **fields):
@@ -18,8 +21,40 @@ def _build_config(name: str, **fields):
     )
 
 
-def test_rule_pattern_detector_matches_patterns():
-    rule_config = _build_config("pattern_rule")
+RULE_CONFIG_FIELDS: dict[str, dict[str, tuple[object, object]]] = {
+    "pattern_rule": {},
+    "script_rule": {"max_script_length_without_functions": (int | None, 2)},
+    "var_rule": {"min_variable_name_length": (int | None, 3)},
+    "inherit_rule": {"max_inheritance_depth": (int | None, 1)},
+    "ident_rule": {"min_identifier_length": (int | None, 3)},
+    "public_rule": {"public_naming": (str | None, "PascalCase")},
+    "private_rule": {"private_naming": (str | None, "camelCase or _camelCase")},
+    "required_rule": {},
+    "no_violation_rule": {
+        "max_script_length_without_functions": (int | None, 10),
+        "min_variable_name_length": (int | None, 3),
+        "max_inheritance_depth": (int | None, 5),
+        "min_identifier_length": (int | None, 1),
+        "public_naming": (str | None, "UnknownStyle"),
+        "private_naming": (str | None, "UnknownStyle"),
+    },
+    "regex_rule": {},
+    "required_regex_rule": {},
+    "compiled_regex_rule": {},
+    "literal_rule": {},
+}
+
+
+@pytest.fixture(scope="module")
+def rule_configs():
+    return {
+        name: _build_config(name, **fields)
+        for name, fields in RULE_CONFIG_FIELDS.items()
+    }
+
+
+def test_rule_pattern_detector_matches_patterns(rule_configs):
+    rule_config = rule_configs["pattern_rule"]
     config = rule_config(
         detectable_patterns=["TODO"],
         recommended_alternative="Fix the TODO.",
@@ -30,27 +65,24 @@ def test_rule_pattern_detector_matches_patterns():
     assert violations[0].suggestion == "Fix the TODO."
 
 
-def test_rule_pattern_detector_script_length():
-    rule_config = _build_config(
-        "script_rule",
-        max_script_length_without_functions=(int | None, 2),
-    )
+def test_rule_pattern_detector_script_length(rule_configs):
+    rule_config = rule_configs["script_rule"]
     config = rule_config()
     context = AnalysisContext(code="line1\nline2\nline3", language="bash")
     violations = RulePatternDetector().detect(context, config)
     assert violations
 
 
-def test_rule_pattern_detector_variable_name_length():
-    rule_config = _build_config("var_rule", min_variable_name_length=(int | None, 3))
+def test_rule_pattern_detector_variable_name_length(rule_configs):
+    rule_config = rule_configs["var_rule"]
     config = rule_config()
     context = AnalysisContext(code="ab=1", language="bash")
     violations = RulePatternDetector().detect(context, config)
     assert violations
 
 
-def test_rule_pattern_detector_inheritance_depth():
-    rule_config = _build_config("inherit_rule", max_inheritance_depth=(int | None, 1))
+def test_rule_pattern_detector_inheritance_depth(rule_configs):
+    rule_config = rule_configs["inherit_rule"]
     config = rule_config()
     context = AnalysisContext(
         code="class A extends B {}\nclass B extends C {}\n",
@@ -60,27 +92,24 @@ def test_rule_pattern_detector_inheritance_depth():
     assert violations
 
 
-def test_rule_pattern_detector_identifier_length():
-    rule_config = _build_config("ident_rule", min_identifier_length=(int | None, 3))
+def test_rule_pattern_detector_identifier_length(rule_configs):
+    rule_config = rule_configs["ident_rule"]
     config = rule_config()
     context = AnalysisContext(code="const x = 1", language="javascript")
     violations = RulePatternDetector().detect(context, config)
     assert violations
 
 
-def test_rule_pattern_detector_public_naming():
-    rule_config = _build_config("public_rule", public_naming=(str | None, "PascalCase"))
+def test_rule_pattern_detector_public_naming(rule_configs):
+    rule_config = rule_configs["public_rule"]
     config = rule_config()
     context = AnalysisContext(code="public class foo {}", language="csharp")
     violations = RulePatternDetector().detect(context, config)
     assert violations
 
 
-def test_rule_pattern_detector_private_naming():
-    rule_config = _build_config(
-        "private_rule",
-        private_naming=(str | None, "camelCase or _camelCase"),
-    )
+def test_rule_pattern_detector_private_naming(rule_configs):
+    rule_config = rule_configs["private_rule"]
     config = rule_config()
     context = AnalysisContext(
         code="public class Foo { private int BadName; }",
@@ -90,8 +119,8 @@ def test_rule_pattern_detector_private_naming():
     assert violations
 
 
-def test_rule_pattern_detector_name_and_required_pattern_branches():
-    rule_config = _build_config("required_rule")
+def test_rule_pattern_detector_name_and_required_pattern_branches(rule_configs):
+    rule_config = rule_configs["required_rule"]
     config = rule_config(
         detectable_patterns=["", "!", "!MUST_HAVE"],
         recommended_alternative="Add required marker.",
@@ -106,16 +135,8 @@ def test_rule_pattern_detector_name_and_required_pattern_branches():
     assert violations[0].principle == "required_rule"
 
 
-def test_rule_pattern_detector_no_violation_return_paths():
-    rule_config = _build_config(
-        "no_violation_rule",
-        max_script_length_without_functions=(int | None, 10),
-        min_variable_name_length=(int | None, 3),
-        max_inheritance_depth=(int | None, 5),
-        min_identifier_length=(int | None, 1),
-        public_naming=(str | None, "UnknownStyle"),
-        private_naming=(str | None, "UnknownStyle"),
-    )
+def test_rule_pattern_detector_no_violation_return_paths(rule_configs):
+    rule_config = rule_configs["no_violation_rule"]
     config = rule_config()
     context = AnalysisContext(
         code=(
@@ -132,8 +153,8 @@ def test_rule_pattern_detector_no_violation_return_paths():
     assert violations == []
 
 
-def test_rule_pattern_detector_matches_regex_patterns():
-    rule_config = _build_config("regex_rule")
+def test_rule_pattern_detector_matches_regex_patterns(rule_configs):
+    rule_config = rule_configs["regex_rule"]
     config = rule_config(
         detectable_patterns=[r"re:key=\{(?:index|itemIndex)\}"],
         recommended_alternative="Use a stable key instead of an array index.",
@@ -150,8 +171,8 @@ def test_rule_pattern_detector_matches_regex_patterns():
     assert violations[0].location.column > 0
 
 
-def test_rule_pattern_detector_required_regex_patterns():
-    rule_config = _build_config("required_regex_rule")
+def test_rule_pattern_detector_required_regex_patterns(rule_configs):
+    rule_config = rule_configs["required_regex_rule"]
     config = rule_config(
         detectable_patterns=[r"!re:export const metadata"],
         recommended_alternative="Define metadata for the route.",
@@ -164,3 +185,33 @@ def test_rule_pattern_detector_required_regex_patterns():
 
     assert len(violations) == 1
     assert violations[0].principle == "required_regex_rule"
+
+
+def test_rule_pattern_detector_reuses_compiled_regex_patterns(rule_configs):
+    rule_config = rule_configs["compiled_regex_rule"]
+    config = rule_config(detectable_patterns=[r"re:\bTODO\(\w+\)"])
+    detector = RulePatternDetector()
+
+    first = detector.detect(AnalysisContext(code="# TODO(ana)", language="py"), config)
+    hits = _compile_rule_pattern.cache_info().hits
+    second = detector.detect(
+        AnalysisContext(code="\n# TODO(bo)", language="py"), config
+    )
+
+    assert first[0].location.line == 1
+    assert second[0].location.line == 2
+    assert _compile_rule_pattern.cache_info().hits == hits + 1
+
+
+def test_rule_pattern_detector_locates_each_literal_pattern(rule_configs):
+    rule_config = rule_configs["literal_rule"]
+    config = rule_config(detectable_patterns=["eval(", "TODO", "FIXME"])
+    context = AnalysisContext(
+        code="x = 1\ny = eval(x)  # TODO\n# TODO again\n",
+        language="python",
+    )
+
+    violations = RulePatternDetector().detect(context, config)
+
+    locations = [(v.location.line, v.location.column) for v in violations]
+    assert locations == [(2, 5), (2, 16)]
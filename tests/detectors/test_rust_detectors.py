@@ -1,3 +1,5 @@
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.analyzers.registry import REGISTRY
 from mcp_zen_of_languages.languages.rust.detectors import RustCloneOverheadDetector
@@ -16,12 +18,11 @@ from mcp_zen_of_languages.languages.rust.detectors import RustUnwrapUsageDetecto
 from mcp_zen_of_languages.languages.rust.rules import RUST_ZEN
 
 
+_RUST_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(RUST_ZEN)}
+
+
 def config_for(detector_type: str):
-    return next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(RUST_ZEN)
-        if cfg.type == detector_type
-    )
+    return _RUST_CFG_INDEX[detector_type]
 
 
 def run_detector(detector, code, config):
@@ -29,24 +30,77 @@ def run_detector(detector, code, config):
     return detector.detect(ctx, config)
 
 
-def test_rust_unwrap_usage_detector():
-    code = "fn main() { let _ = Some(1).unwrap(); }"
-    violations = run_detector(
-        RustUnwrapUsageDetector(),
-        code,
-        config_for("rust_unwrap_usage"),
-    )
-    assert violations
-
-
-def test_rust_unsafe_blocks_detector():
-    code = "unsafe fn do_it() {}"
-    violations = run_detector(
-        RustUnsafeBlocksDetector(),
-        code,
-        config_for("rust_unsafe_blocks"),
-    )
-    assert violations
+FLAG_CASES: list[tuple[str, type, str, str]] = [
+    (
+        "unwrap-usage",
+        RustUnwrapUsageDetector,
+        "fn main() { let _ = Some(1).unwrap(); }",
+        "rust_unwrap_usage",
+    ),
+    (
+        "unsafe-blocks",
+        RustUnsafeBlocksDetector,
+        "unsafe fn do_it() {}",
+        "rust_unsafe_blocks",
+    ),
+    (
+        "error-handling",
+        RustErrorHandlingDetector,
+        "fn main() { let result: Result<i32, i32> = Ok(1); }",
+        "rust_error_handling",
+    ),
+    ("type-safety", RustTypeSafetyDetector, "struct User { id: i32 }\n", "rust-002"),
+    (
+        "iterator-preference",
+        RustIteratorPreferenceDetector,
+        'for item in items { println!("{}", item); }\n',
+        "rust-003",
+    ),
+    (
+        "must-use",
+        RustMustUseDetector,
+        "fn foo() -> Result<i32, i32> { Ok(1) }\n",
+        "rust-005",
+    ),
+    (
+        "debug-derive",
+        RustDebugDeriveDetector,
+        "pub struct User { id: i32 }\n",
+        "rust-006",
+    ),
+    ("newtype-pattern", RustNewtypePatternDetector, "type UserId = i32;\n", "rust-007"),
+    ("std-traits", RustStdTraitsDetector, "struct Widget { id: i32 }\n", "rust-009"),
+    (
+        "enum-over-bool",
+        RustEnumOverBoolDetector,
+        "struct Flags { active: bool }\n",
+        "rust-010",
+    ),
+    (
+        "lifetime-usage",
+        RustLifetimeUsageDetector,
+        "fn foo<'a>(name: &'a str) {}\n",
+        "rust-011",
+    ),
+    (
+        "interior-mutability",
+        RustInteriorMutabilityDetector,
+        (
+            "use std::cell::RefCell; use std::rc::Rc; "
+            "struct Foo { inner: Rc<RefCell<i32>> }\n"
+        ),
+        "rust-012",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("detector_cls", "code", "cfg_type"),
+    [case[1:] for case in FLAG_CASES],
+    ids=[case[0] for case in FLAG_CASES],
+)
+def test_rust_detector_flags(detector_cls, code, cfg_type):
+    assert run_detector(detector_cls(), code, config_for(cfg_type))
 
 
 def test_rust_unsafe_blocks_detector_allows_safety_comment():
@@ -66,16 +120,6 @@ def test_rust_clone_overhead_detector():
     assert violations
 
 
-def test_rust_error_handling_detector():
-    code = "fn main() { let result: Result<i32, i32> = Ok(1); }"
-    violations = run_detector(
-        RustErrorHandlingDetector(),
-        code,
-        config_for("rust_error_handling"),
-    )
-    assert violations
-
-
 def test_rust_error_handling_detector_panics():
     code = 'fn main() { panic!("boom"); }'
     cfg = config_for("rust_error_handling").model_copy(
@@ -85,75 +129,6 @@ def test_rust_error_handling_detector_panics():
     assert violations
 
 
-def test_rust_type_safety_detector():
-    code = "struct User { id: i32 }\n"
-    violations = run_detector(RustTypeSafetyDetector(), code, config_for("rust-002"))
-    assert violations
-
-
-def test_rust_iterator_preference_detector():
-    code = 'for item in items { println!("{}", item); }\n'
-    violations = run_detector(
-        RustIteratorPreferenceDetector(),
-        code,
-        config_for("rust-003"),
-    )
-    assert violations
-
-
-def test_rust_must_use_detector():
-    code = "fn foo() -> Result<i32, i32> { Ok(1) }\n"
-    violations = run_detector(RustMustUseDetector(), code, config_for("rust-005"))
-    assert violations
-
-
-def test_rust_debug_derive_detector():
-    code = "pub struct User { id: i32 }\n"
-    violations = run_detector(RustDebugDeriveDetector(), code, config_for("rust-006"))
-    assert violations
-
-
-def test_rust_newtype_pattern_detector():
-    code = "type UserId = i32;\n"
-    violations = run_detector(
-        RustNewtypePatternDetector(),
-        code,
-        config_for("rust-007"),
-    )
-    assert violations
-
-
-def test_rust_std_traits_detector():
-    code = "struct Widget { id: i32 }\n"
-    violations = run_detector(RustStdTraitsDetector(), code, config_for("rust-009"))
-    assert violations
-
-
-def test_rust_enum_over_bool_detector():
-    code = "struct Flags { active: bool }\n"
-    violations = run_detector(RustEnumOverBoolDetector(), code, config_for("rust-010"))
-    assert violations
-
-
-def test_rust_lifetime_usage_detector():
-    code = "fn foo<'a>(name: &'a str) {}\n"
-    violations = run_detector(RustLifetimeUsageDetector(), code, config_for("rust-011"))
-    assert violations
-
-
-def test_rust_interior_mutability_detector():
-    code = (
-        "use std::cell::RefCell; use std::rc::Rc; "
-        "struct Foo { inner: Rc<RefCell<i32>> }\n"
-    )
-    violations = run_detector(
-        RustInteriorMutabilityDetector(),
-        code,
-        config_for("rust-012"),
-    )
-    assert violations
-
-
 def test_rust_detector_names_cover_paths():
     assert RustTypeSafetyDetector().name == "rust-002"
     assert RustIteratorPreferenceDetector().name == "rust-003"
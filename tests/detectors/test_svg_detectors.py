@@ -19,6 +19,9 @@ from mcp_zen_of_languages.languages.svg.detectors import SvgUnusedDefsDetector
 from mcp_zen_of_languages.languages.svg.detectors import SvgXmlnsDetector
 
 
+FOUR_GROUP_SVG = '<svg xmlns="http://www.w3.org/2000/svg">' + "<g></g>" * 4 + "</svg>"
+
+
 def test_svg_missing_title_detector_flags_svg_without_title() -> None:
     code = '<svg xmlns="http://www.w3.org/2000/svg"></svg>'
     context = AnalysisContext(code=code, language="svg")
@@ -34,8 +37,7 @@ def test_svg_xmlns_detector_flags_missing_namespace() -> None:
 
 
 def test_svg_node_count_detector_uses_configurable_threshold() -> None:
-    code = '<svg xmlns="http://www.w3.org/2000/svg">' + ("<g></g>" * 4) + "</svg>"
-    context = AnalysisContext(code=code, language="svg")
+    context = AnalysisContext(code=FOUR_GROUP_SVG, language="svg")
     config = SvgNodeCountConfig(max_node_count=3)
     violations = SvgNodeCountDetector().detect(context, config)
     assert violations
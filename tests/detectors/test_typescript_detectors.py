@@ -1,3 +1,5 @@
+import pytest
+
 from mcp_zen_of_languages.analyzers.base import AnalysisContext
 from mcp_zen_of_languages.analyzers.registry import REGISTRY
 from mcp_zen_of_languages.languages.typescript.detectors import TsAnyUsageDetector
@@ -20,12 +22,11 @@ from mcp_zen_of_languages.languages.typescript.rules import TYPESCRIPT_ZEN
 from mcp_zen_of_languages.rules.tools.detections import detect_ts_catch_all_types
 
 
+_TS_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(TYPESCRIPT_ZEN)}
+
+
 def config_for(detector_type: str):
-    return next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(TYPESCRIPT_ZEN)
-        if cfg.type == detector_type
-    )
+    return _TS_CFG_INDEX[detector_type]
 
 
 def run_detector(detector, code, config):
@@ -33,35 +34,69 @@ def run_detector(detector, code, config):
     return detector.detect(ctx, config)
 
 
-def test_ts_any_usage_detector():
-    code = "const value: any = 1;"
-    violations = run_detector(TsAnyUsageDetector(), code, config_for("ts_any_usage"))
-    assert any("any" in v.message for v in violations)
-
-
-def test_ts_strict_mode_detector():
-    violations = run_detector(TsStrictModeDetector(), "", config_for("ts_strict_mode"))
-    assert any("strict" in v.message for v in violations)
-
-
-def test_ts_interface_preference_detector():
-    code = "type Foo = { bar: string };"
-    violations = run_detector(
-        TsInterfacePreferenceDetector(),
-        code,
-        config_for("ts_interface_preference"),
-    )
-    assert any("Type aliases" in v.message for v in violations)
-
-
-def test_ts_return_type_detector():
-    code = "export function foo(x: number) { return x; }"
-    violations = run_detector(
-        TsReturnTypeDetector(),
-        code,
-        config_for("ts_return_types"),
-    )
-    assert any("return type" in v.message for v in violations)
+MESSAGE_CASES: list[tuple[str, type, str, str, str]] = [
+    ("any-usage", TsAnyUsageDetector, "const value: any = 1;", "ts_any_usage", "any"),
+    ("strict-mode", TsStrictModeDetector, "", "ts_strict_mode", "strict"),
+    (
+        "interface-preference",
+        TsInterfacePreferenceDetector,
+        "type Foo = { bar: string };",
+        "ts_interface_preference",
+        "Type aliases",
+    ),
+    (
+        "return-type",
+        TsReturnTypeDetector,
+        "export function foo(x: number) { return x; }",
+        "ts_return_types",
+        "return type",
+    ),
+    (
+        "type-guard",
+        TsTypeGuardDetector,
+        "const x = value as Foo;",
+        "ts_type_guards",
+        "assertions",
+    ),
+    (
+        "non-null-assertion",
+        TsNonNullAssertionDetector,
+        "const x = foo!;",
+        "ts_non_null_assertions",
+        "Non-null assertions",
+    ),
+    (
+        "non-null-assertion-chained",
+        TsNonNullAssertionDetector,
+        "const x = foo!.bar!;",
+        "ts_non_null_assertions",
+        "Non-null assertions",
+    ),
+    (
+        "enum-const",
+        TsEnumConstDetector,
+        "const Colors = { Red: 'red' };",
+        "ts_enum_const",
+        "Plain objects",
+    ),
+    (
+        "unknown-over-any",
+        TsUnknownOverAnyDetector,
+        "let data: any;",
+        "ts_unknown_over_any",
+        "any",
+    ),
+]
+
+
+@pytest.mark.parametrize(
+    ("detector_cls", "code", "cfg_type", "fragment"),
+    [case[1:] for case in MESSAGE_CASES],
+    ids=[case[0] for case in MESSAGE_CASES],
+)
+def test_ts_detector_messages(detector_cls, code, cfg_type, fragment):
+    violations = run_detector(detector_cls(), code, config_for(cfg_type))
+    assert any(fragment in v.message for v in violations)
 
 
 def test_ts_readonly_detector():
@@ -71,12 +106,6 @@ def test_ts_readonly_detector():
     assert any("readonly" in v.message for v in violations)
 
 
-def test_ts_type_guard_detector():
-    code = "const x = value as Foo;"
-    violations = run_detector(TsTypeGuardDetector(), code, config_for("ts_type_guards"))
-    assert any("assertions" in v.message for v in violations)
-
-
 def test_ts_utility_types_detector():
     code = "type Foo = { bar: string };"
     cfg = config_for("ts_utility_types").model_copy(
@@ -86,42 +115,6 @@ def test_ts_utility_types_detector():
     assert any("Manual type transformations" in v.message for v in violations)
 
 
-def test_ts_non_null_assertion_detector():
-    code = "const x = foo!;"
-    violations = run_detector(
-        TsNonNullAssertionDetector(),
-        code,
-        config_for("ts_non_null_assertions"),
-    )
-    assert any("Non-null assertions" in v.message for v in violations)
-
-
-def test_ts_non_null_assertion_detector_chained():
-    code = "const x = foo!.bar!;"
-    violations = run_detector(
-        TsNonNullAssertionDetector(),
-        code,
-        config_for("ts_non_null_assertions"),
-    )
-    assert any("Non-null assertions" in v.message for v in violations)
-
-
-def test_ts_enum_const_detector():
-    code = "const Colors = { Red: 'red' };"
-    violations = run_detector(TsEnumConstDetector(), code, config_for("ts_enum_const"))
-    assert any("Plain objects" in v.message for v in violations)
-
-
-def test_ts_unknown_over_any_detector():
-    code = "let data: any;"
-    violations = run_detector(
-        TsUnknownOverAnyDetector(),
-        code,
-        config_for("ts_unknown_over_any"),
-    )
-    assert any("any" in v.message for v in violations)
-
-
 # --- TsAsyncAwaitDetector tests ---
 
 
@@ -160,35 +153,24 @@ def test_ts_async_await_detector_flags_above_threshold():
 # --- detect_ts_catch_all_types tests ---
 
 
-def test_detect_ts_catch_all_types_object_lowercase():
-    finding = detect_ts_catch_all_types("const x: object = {};")
-    assert finding.count == 1
-
-
-def test_detect_ts_catch_all_types_object_uppercase():
-    finding = detect_ts_catch_all_types("const x: Object = {};")
-    assert finding.count == 1
-
-
-def test_detect_ts_catch_all_types_empty_braces():
-    finding = detect_ts_catch_all_types("const x: {} = {};")
-    assert finding.count == 1
-
-
-def test_detect_ts_catch_all_types_empty_braces_with_spaces():
-    finding = detect_ts_catch_all_types("const x: { } = {};")
-    assert finding.count == 1
-
-
-def test_detect_ts_catch_all_types_empty_braces_before_semicolon():
-    """Regression test: `: {};` must be detected (word boundary after `}` was broken)."""
-    finding = detect_ts_catch_all_types("function foo(x: {}): void {}")
-    assert finding.count == 1
-
-
-def test_detect_ts_catch_all_types_no_match_typed():
-    finding = detect_ts_catch_all_types("const x: string = 'hello';")
-    assert finding.count == 0
+@pytest.mark.parametrize(
+    ("code", "expected_count"),
+    [
+        pytest.param("const x: object = {};", 1, id="object-lowercase"),
+        pytest.param("const x: Object = {};", 1, id="object-uppercase"),
+        pytest.param("const x: {} = {};", 1, id="empty-braces"),
+        pytest.param("const x: { } = {};", 1, id="empty-braces-with-spaces"),
+        # Regression: `: {};` must be detected (word boundary after `}` was broken).
+        pytest.param(
+            "function foo(x: {}): void {}",
+            1,
+            id="empty-braces-before-semicolon",
+        ),
+        pytest.param("const x: string = 'hello';", 0, id="no-match-typed"),
+    ],
+)
+def test_detect_ts_catch_all_types(code, expected_count):
+    assert detect_ts_catch_all_types(code).count == expected_count
 
 
 # --- TsCatchAllTypeDetector integration tests ---
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import functools
 import os
 import re
 
@@ -10,6 +11,7 @@ import pytest
 
 from jinja2 import Environment
 from jinja2 import StrictUndefined
+from jinja2 import Template
 from jinja2 import select_autoescape
 from rich.console import Console
 
@@ -36,31 +38,50 @@ TEMPLATE_ENV = Environment(
     keep_trailing_newline=True,
 )
 FIXTURE_PATH = "tests/fixtures/medium_violations.py"
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+TRAILING_WHITESPACE_RE = re.compile(r"[^\S\n]+(?=\n|\Z)")
+
+
+def _make_console(buffer: StringIO) -> Console:
+    return Console(
+        file=buffer,
+        width=88,
+        force_terminal=True,
+        no_color=True,
+        theme=ZEN_THEME,
+    )
 
 
 def _assert_max_width(output: str, width: int = 88) -> None:
-    ansi_re = re.compile(r"\x1b\[[0-9;]*m")
-    for line in output.splitlines():
-        assert len(ansi_re.sub("", line)) <= width
+    cleaned = ANSI_RE.sub("", output)
+    assert max(map(len, cleaned.splitlines()), default=0) <= width
 
 
 def _strip_ansi(output: str) -> str:
-    cleaned = re.sub(r"\x1b\[[0-9;]*m", "", output)
-    normalized = "\n".join(line.rstrip() for line in cleaned.splitlines())
-    if cleaned.endswith("\n"):
-        normalized += "\n"
-    return normalized
+    return TRAILING_WHITESPACE_RE.sub("", ANSI_RE.sub("", output))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_template(path: Path, mtime_ns: int) -> Template:
+    return TEMPLATE_ENV.from_string(path.read_text(encoding="utf-8"))
 
 
 def _render_template(path: Path, context: dict[str, str]) -> str:
-    template = TEMPLATE_ENV.from_string(path.read_text(encoding="utf-8"))
+    template = _load_template(path, path.stat().st_mtime_ns)
     return template.render(**context)
 
 
+@functools.lru_cache(maxsize=8)
+def _placeholder_pattern(version: str, fixture_path: str) -> re.Pattern[str]:
+    return re.compile(f"(v{re.escape(version)})|{re.escape(fixture_path)}")
+
+
 def _to_template(output: str, context: dict[str, str]) -> str:
-    templated = _strip_ansi(output)
-    templated = templated.replace(f"v{context['version']}", "v{{ version }}")
-    return templated.replace(context["fixture_path"], "{{ fixture_path }}")
+    pattern = _placeholder_pattern(context["version"], context["fixture_path"])
+    return pattern.sub(
+        lambda match: "v{{ version }}" if match[1] else "{{ fixture_path }}",
+        _strip_ansi(output),
+    )
 
 
 def _assert_or_update_golden(path: Path, output: str, context: dict[str, str]) -> None:
@@ -75,17 +96,18 @@ def _assert_or_update_golden(path: Path, output: str, context: dict[str, str]) -
     )
 
 
+@pytest.fixture(scope="module")
+def fixture_report():
+    return functools.cache(
+        lambda path: generate_report(path, include_prompts=True),
+    )
+
+
 @pytest.mark.parametrize("fixture", FIXTURE_FILES)
-def test_report_visual_consistency(fixture: str):
-    report = generate_report(fixture, include_prompts=True)
+def test_report_visual_consistency(fixture: str, fixture_report):
+    report = fixture_report(fixture)
     buffer = StringIO()
-    output_console = Console(
-        file=buffer,
-        width=88,
-        force_terminal=True,
-        no_color=True,
-        theme=ZEN_THEME,
-    )
+    output_console = _make_console(buffer)
     render_report_terminal(report, output_console=output_console)
     output = buffer.getvalue()
     assert "Zen Report" in output
@@ -95,13 +117,7 @@ def test_report_visual_consistency(fixture: str):
 
 def test_welcome_golden(monkeypatch):
     buffer = StringIO()
-    output_console = Console(
-        file=buffer,
-        width=88,
-        force_terminal=True,
-        no_color=True,
-        theme=ZEN_THEME,
-    )
+    output_console = _make_console(buffer)
     monkeypatch.setattr(cli, "console", output_console)
     monkeypatch.setattr(cli, "get_banner_art", lambda: "ZEN")
     cli._build_welcome_panel()
@@ -115,16 +131,10 @@ def test_welcome_golden(monkeypatch):
     )
 
 
-def test_report_golden():
-    report = generate_report(FIXTURE_PATH, include_prompts=True)
+def test_report_golden(fixture_report):
+    report = fixture_report(FIXTURE_PATH)
     buffer = StringIO()
-    output_console = Console(
-        file=buffer,
-        width=88,
-        force_terminal=True,
-        no_color=True,
-        theme=ZEN_THEME,
-    )
+    output_console = _make_console(buffer)
     render_report_terminal(report, output_console=output_console)
     output = buffer.getvalue()
     _assert_max_width(output)
@@ -141,13 +151,7 @@ def test_prompts_golden():
     results = cli._analyze_targets([(target, "python")], None)
     bundle = build_prompt_bundle(results)
     buffer = StringIO()
-    output_console = Console(
-        file=buffer,
-        width=88,
-        force_terminal=True,
-        no_color=True,
-        theme=ZEN_THEME,
-    )
+    output_console = _make_console(buffer)
     render_prompt_panel(bundle, results, output_console=output_console)
     output = buffer.getvalue()
     _assert_max_width(output)
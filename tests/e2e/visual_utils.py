@@ -1,12 +1,21 @@
 from __future__ import annotations
 
+from collections import Counter
+
+
+BOX_CORNER_PAIRS = (
+    ("╭", "╰", "Unbalanced rounded left corners"),
+    ("╮", "╯", "Unbalanced rounded right corners"),
+    ("┏", "┗", "Unbalanced heavy left corners"),
+    ("┓", "┛", "Unbalanced heavy right corners"),
+    ("╔", "╚", "Unbalanced double left corners"),
+    ("╗", "╝", "Unbalanced double right corners"),
+)
+
 
 def assert_balanced_boxes(output: str) -> None:
     """Assert balanced Rich box-drawing corner characters."""
 
-    assert output.count("╭") == output.count("╰"), "Unbalanced rounded left corners"
-    assert output.count("╮") == output.count("╯"), "Unbalanced rounded right corners"
-    assert output.count("┏") == output.count("┗"), "Unbalanced heavy left corners"
-    assert output.count("┓") == output.count("┛"), "Unbalanced heavy right corners"
-    assert output.count("╔") == output.count("╚"), "Unbalanced double left corners"
-    assert output.count("╗") == output.count("╝"), "Unbalanced double right corners"
+    counts = Counter(output)
+    for opening, closing, message in BOX_CORNER_PAIRS:
+        assert counts[opening] == counts[closing], message
@@ -1,13 +1,16 @@
 from __future__ import annotations
 
+import functools
 import tomllib
 
 from pathlib import Path
 
 
+@functools.cache
 def _project_scripts() -> dict[str, str]:
     pyproject_path = Path(__file__).resolve().parents[2] / "pyproject.toml"
-    pyproject_data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+    with pyproject_path.open("rb") as handle:
+        pyproject_data = tomllib.load(handle)
     return pyproject_data["project"]["scripts"]
 
 
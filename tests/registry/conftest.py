@@ -0,0 +1,23 @@
+from __future__ import annotations
+
+import pytest
+
+from mcp_zen_of_languages.analyzers.pipeline import PipelineConfig
+from mcp_zen_of_languages.analyzers.registry import REGISTRY
+from mcp_zen_of_languages.languages.python.rules import PYTHON_ZEN
+
+
+@pytest.fixture(scope="session")
+def python_pipeline_config() -> PipelineConfig:
+    """Return the rule-derived Python pipeline, projected once per session.
+
+    ``merge_pipeline_overrides`` builds a new pipeline rather than editing
+    its base, so tests may share this instance as long as they only read it.
+    """
+    return PipelineConfig.from_rules("python")
+
+
+@pytest.fixture(scope="session")
+def python_rule_configs():
+    """Return the Python detector configs projected from ``PYTHON_ZEN`` once."""
+    return REGISTRY.configs_from_rules(PYTHON_ZEN)
@@ -6,6 +6,9 @@ from mcp_zen_of_languages.languages.python.detectors import NameStyleDetector
 from mcp_zen_of_languages.languages.python.rules import PYTHON_ZEN
 
 
+_PYTHON_CFG_INDEX = {cfg.type: cfg for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)}
+
+
 # Minimal fixture-like helper
 class SimpleContext:
     def __init__(self, code: str):
@@ -39,11 +42,7 @@ class Big:
     strict_cfg = ClassSizeConfig(max_class_length=10)
     violations_rules = detector.detect(ctx, strict_cfg)
     assert len(violations_rules) >= 1
-    rule_cfg = next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)
-        if cfg.type == "class_size"
-    )
+    rule_cfg = _PYTHON_CFG_INDEX["class_size"]
     rule_violations = detector.detect(
         ctx,
         rule_cfg.model_copy(update={"max_class_length": 10}),
@@ -59,11 +58,7 @@ def BadName():
 fooBar = 1
 """
     detector = NameStyleDetector()
-    cfg = next(
-        cfg
-        for cfg in REGISTRY.configs_from_rules(PYTHON_ZEN)
-        if cfg.type == "name_style"
-    )
+    cfg = _PYTHON_CFG_INDEX["name_style"]
     ctx = AnalysisContext(code=code, path=None, language="python")
     violations = detector.detect(ctx, cfg)
     assert any("Poor naming conventions" in v.message for v in violations)
@@ -37,11 +37,16 @@ class DummyDetector(ViolationDetector[DummyConfig]):
         return []
 
 
+DUMMY_BINDING_KWARGS = {
+    "detector_id": "dummy",
+    "detector_class": DummyDetector,
+    "config_model": DummyConfig,
+}
+
+
 def test_mapping_models_defaults():
     binding = NonRuleDetectorBinding(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
     )
     lang_map = LanguageDetectorMap(language="python", bindings=[binding])
     full_map = FullDetectorMap(languages={"python": lang_map})
@@ -55,9 +60,7 @@ def test_mapping_models_defaults():
 
 def test_rule_binding_to_metadata():
     binding = RuleDetectorBinding(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
         rules=[
             RuleBinding(
                 rule_id="python-001",
@@ -114,9 +117,7 @@ def test_registry_bootstrap_from_mappings():
 
 def test_detector_metadata_rule_map_sets_rule_ids():
     metadata = DetectorMetadata(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
         language="python",
         rule_map={"python-001": ["*"]},
     )
@@ -233,9 +234,7 @@ def test_rule_binding_defaults_multi_family_ids_to_unverified_state() -> None:
 
 def test_rule_binding_builds_testing_and_projection_models() -> None:
     binding = RuleDetectorBinding(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
         rules=[
             RuleBinding(
                 rule_id="python-001",
@@ -303,27 +302,37 @@ def test_rule_binding_defaults_multi_dogma_to_unverified_state() -> None:
     assert rule.verified_dogma_ids == []
 
 
-def test_bootstrap_from_mappings_propagates_unrelated_import_error(monkeypatch):
-    registry = DetectorRegistry()
+def _raise_unrelated_import_error(name):
+    error = ModuleNotFoundError("missing_dep")
+    error.name = "missing_dep"
+    raise error
 
-    def fake_import(name):
-        error = ModuleNotFoundError("missing_dep")
-        error.name = "missing_dep"
-        raise error
 
-    monkeypatch.setattr(importlib, "import_module", fake_import)
-    with pytest.raises(ModuleNotFoundError):
-        registry.bootstrap_from_mappings()
+def _import_without_detector_map(name):
+    return types.SimpleNamespace()
 
 
-def test_bootstrap_from_mappings_requires_detector_map(monkeypatch):
+@pytest.mark.parametrize(
+    ("fake_import", "error_type", "match"),
+    [
+        pytest.param(
+            _raise_unrelated_import_error,
+            ModuleNotFoundError,
+            None,
+            id="unrelated-import-error",
+        ),
+        pytest.param(
+            _import_without_detector_map,
+            ValueError,
+            "Missing DETECTOR_MAP",
+            id="missing-detector-map",
+        ),
+    ],
+)
+def test_bootstrap_from_mappings_raises(monkeypatch, fake_import, error_type, match):
     registry = DetectorRegistry()
-
-    def fake_import(name):
-        return types.SimpleNamespace()
-
     monkeypatch.setattr(importlib, "import_module", fake_import)
-    with pytest.raises(ValueError, match="Missing DETECTOR_MAP"):
+    with pytest.raises(error_type, match=match):
         registry.bootstrap_from_mappings()
 
 
@@ -362,9 +371,7 @@ def test_bootstrap_from_mappings_builds_bundle_once_and_preserves_it(
             raise AssertionError(msg)
 
     binding = CountingBinding(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
     )
     detector_map = LanguageDetectorMap(language="python", bindings=[binding])
 
@@ -412,9 +419,7 @@ def test_bootstrap_from_mappings_discovers_testing_family_overlays(
         language="python",
         bindings=[
             RuleDetectorBinding(
-                detector_id="dummy",
-                detector_class=DummyDetector,
-                config_model=DummyConfig,
+                **DUMMY_BINDING_KWARGS,
                 rules=[RuleBinding(rule_id="python-001")],
             ),
         ],
@@ -423,9 +428,7 @@ def test_bootstrap_from_mappings_discovers_testing_family_overlays(
         language="python",
         bindings=[
             RuleDetectorBinding(
-                detector_id="dummy",
-                detector_class=DummyDetector,
-                config_model=DummyConfig,
+                **DUMMY_BINDING_KWARGS,
                 rules=[RuleBinding(rule_id="python-001")],
             ),
         ],
@@ -464,9 +467,7 @@ def test_bootstrap_from_mappings_discovers_testing_family_overlays(
 def test_registry_preserves_authored_dogma_bundle() -> None:
     registry = DetectorRegistry()
     binding = RuleDetectorBinding(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
         rules=[
             RuleBinding(
                 rule_id="python-001",
@@ -490,9 +491,7 @@ def test_registry_preserves_authored_dogma_bundle() -> None:
 def test_registry_dogma_lookup_prefers_preserved_bundle_model() -> None:
     registry = DetectorRegistry()
     metadata = DetectorMetadata(
-        detector_id="dummy",
-        detector_class=DummyDetector,
-        config_model=DummyConfig,
+        **DUMMY_BINDING_KWARGS,
         language="python",
         rule_ids=["python-001"],
         rule_map={"python-001": ["*"]},
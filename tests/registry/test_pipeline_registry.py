@@ -18,15 +18,15 @@ def test_project_rules_to_configs():
     assert configs
 
 
-def test_merge_pipeline_overrides():
-    base = PipelineConfig.from_rules("python")
+def test_merge_pipeline_overrides(python_pipeline_config):
+    base = python_pipeline_config
     overrides = PipelineConfig(language="python", detectors=base.detectors[:1])
     merged = merge_pipeline_overrides(base, overrides)
     assert len(merged.detectors) >= 1
 
 
-def test_merge_pipeline_overrides_language_mismatch():
-    base = PipelineConfig.from_rules("python")
+def test_merge_pipeline_overrides_language_mismatch(python_pipeline_config):
+    base = python_pipeline_config
     overrides = PipelineConfig(language="rust", detectors=base.detectors[:1])
     with pytest.raises(ValueError, match="language"):
         merge_pipeline_overrides(base, overrides)
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
-import importlib
+import pytest
 
+from mcp_zen_of_languages.analyzers import registry_bootstrap  # noqa: F401
 from mcp_zen_of_languages.analyzers.registry import REGISTRY
 from mcp_zen_of_languages.languages.bash.rules import BASH_ZEN
 from mcp_zen_of_languages.languages.cpp.rules import CPP_ZEN
@@ -14,21 +15,28 @@ from mcp_zen_of_languages.languages.rust.rules import RUST_ZEN
 from mcp_zen_of_languages.languages.typescript.rules import TYPESCRIPT_ZEN
 
 
-def test_all_rules_have_detectors():
-    importlib.import_module("mcp_zen_of_languages.analyzers.registry_bootstrap")
+RULES_BY_LANGUAGE = {
+    "bash": BASH_ZEN,
+    "cpp": CPP_ZEN,
+    "csharp": CSHARP_ZEN,
+    "go": GO_ZEN,
+    "javascript": JAVASCRIPT_ZEN,
+    "powershell": POWERSHELL_ZEN,
+    "ruby": RUBY_ZEN,
+    "rust": RUST_ZEN,
+    "typescript": TYPESCRIPT_ZEN,
+}
 
-    rules_by_language = {
-        "bash": BASH_ZEN,
-        "cpp": CPP_ZEN,
-        "csharp": CSHARP_ZEN,
-        "go": GO_ZEN,
-        "javascript": JAVASCRIPT_ZEN,
-        "powershell": POWERSHELL_ZEN,
-        "ruby": RUBY_ZEN,
-        "rust": RUST_ZEN,
-        "typescript": TYPESCRIPT_ZEN,
-    }
-    for language, ruleset in rules_by_language.items():
-        for principle in ruleset.principles:
-            metas = REGISTRY.detectors_for_rule(principle.id, language)
-            assert metas, f"Missing detector for {language} {principle.id}"
+
+@pytest.mark.parametrize(
+    ("language", "ruleset"),
+    list(RULES_BY_LANGUAGE.items()),
+    ids=list(RULES_BY_LANGUAGE),
+)
+def test_all_rules_have_detectors(language, ruleset):
+    missing = [
+        principle.id
+        for principle in ruleset.principles
+        if not REGISTRY.detectors_for_rule(principle.id, language)
+    ]
+    assert not missing, f"Missing {language} detectors for {missing}"
@@ -1,7 +1,5 @@
 from __future__ import annotations
 
-from io import StringIO
-
 import pytest
 
 from rich.console import Console
@@ -10,15 +8,12 @@ from mcp_zen_of_languages.rendering.themes import ZEN_THEME
 
 
 @pytest.fixture
-def capture_console() -> tuple[Console, StringIO]:
-    """Provide a deterministic Rich console capture fixture."""
+def capture_console() -> Console:
+    """Provide a deterministic Rich console; read output via ``console.capture()``."""
 
-    buffer = StringIO()
-    console = Console(
-        file=buffer,
+    return Console(
         theme=ZEN_THEME,
         width=88,
         force_terminal=True,
         no_color=True,
     )
-    return console, buffer
@@ -4,6 +4,9 @@ import importlib
 import sys
 
 from io import StringIO
+from types import SimpleNamespace
+
+import pytest
 
 from rich.console import Console
 from rich.panel import Panel
@@ -33,22 +36,35 @@ from mcp_zen_of_languages.rendering.themes import severity_badge
 from mcp_zen_of_languages.rendering.themes import severity_style
 
 
-def test_severity_style_and_badge():
-    assert severity_style(9) == "severity.critical"
-    assert severity_style(7) == "severity.high"
-    assert severity_style(4) == "severity.medium"
-    assert severity_style(1) == "severity.low"
+console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
+
+
+@pytest.mark.parametrize(
+    ("severity", "style"),
+    [
+        (9, "severity.critical"),
+        (7, "severity.high"),
+        (4, "severity.medium"),
+        (1, "severity.low"),
+    ],
+)
+def test_severity_style(severity, style):
+    assert severity_style(severity) == style
+
+
+def test_severity_badge_critical():
     badge = severity_badge(9)
     assert "CRIT" in badge
     assert any(symbol in badge for symbol in ("🔴", "●"))
 
 
 def test_build_violation_table_title():
-    location = type("Loc", (), {"line": 1, "column": 2})
-    violation = type(
-        "Violation",
-        (),
-        {"severity": 7, "principle": "P", "message": "Msg", "location": location},
+    location = SimpleNamespace(line=1, column=2)
+    violation = SimpleNamespace(
+        severity=7,
+        principle="P",
+        message="Msg",
+        location=location,
     )
     table = build_violation_table([violation], "sample.py")
     assert isinstance(table, Table)
@@ -57,17 +73,13 @@ def test_build_violation_table_title():
 
 
 def test_build_project_summary_panel():
-    summary = type(
-        "Summary",
-        (),
-        {
-            "total_files": 2,
-            "total_violations": 5,
-            "critical": 1,
-            "high": 2,
-            "medium": 1,
-            "low": 1,
-        },
+    summary = SimpleNamespace(
+        total_files=2,
+        total_violations=5,
+        critical=1,
+        high=2,
+        medium=1,
+        low=1,
     )
     panel = build_project_summary_panel(summary)
     assert isinstance(panel, Panel)
@@ -76,7 +88,7 @@ def test_build_project_summary_panel():
 
 
 def test_build_worst_offenders_panel():
-    offender = type("Offender", (), {"path": "sample.py", "violation_count": 3})
+    offender = SimpleNamespace(path="sample.py", violation_count=3)
     panel = build_worst_offenders_panel([offender])
     assert isinstance(panel, Panel)
     assert panel.box == BOX_CONTENT
@@ -113,25 +125,21 @@ class _DummyStream:
         return self._isatty
 
 
-def test_supports_color_respects_no_color(monkeypatch):
-    monkeypatch.setenv("NO_COLOR", "1")
-    monkeypatch.setenv("TERM", "xterm")
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
-    assert console_module._supports_color(_DummyStream(isatty=True)) is False
-
-
-def test_supports_color_respects_dumb_terminal(monkeypatch):
-    monkeypatch.delenv("NO_COLOR", raising=False)
-    monkeypatch.setenv("TERM", "dumb")
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
-    assert console_module._supports_color(_DummyStream(isatty=True)) is False
-
-
-def test_supports_color_enabled(monkeypatch):
-    monkeypatch.delenv("NO_COLOR", raising=False)
-    monkeypatch.setenv("TERM", "xterm")
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
-    assert console_module._supports_color(_DummyStream(isatty=True)) is True
+@pytest.mark.parametrize(
+    ("no_color", "term", "expected"),
+    [
+        pytest.param("1", "xterm", False, id="no-color"),
+        pytest.param(None, "dumb", False, id="dumb-terminal"),
+        pytest.param(None, "xterm", True, id="enabled"),
+    ],
+)
+def test_supports_color(monkeypatch, no_color, term, expected):
+    if no_color is None:
+        monkeypatch.delenv("NO_COLOR", raising=False)
+    else:
+        monkeypatch.setenv("NO_COLOR", no_color)
+    monkeypatch.setenv("TERM", term)
+    assert console_module._supports_color(_DummyStream(isatty=True)) is expected
 
 
 def test_severity_badge_fallback(monkeypatch):
@@ -143,6 +151,8 @@ def test_severity_badge_fallback(monkeypatch):
     assert "◆" in themes.severity_badge(4)
     assert "○" in themes.severity_badge(1)
     assert "[OK]" in themes.pass_fail_glyph(passed=True)
+    monkeypatch.setattr(themes, "_use_emoji", lambda: True)
+    assert "🔴" in themes.severity_badge(9)
 
 
 def test_analysis_progress_yields_progress(monkeypatch):
@@ -169,7 +179,6 @@ def test_print_banner_outputs(monkeypatch, capsys):
 def test_print_banner_snapshot(monkeypatch):
     set_quiet(value=False)
     monkeypatch.setattr(sys.stdout, "isatty", lambda: True)
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
     monkeypatch.setattr(console_module, "_render_banner_art", lambda: "ZEN")
     buffer = StringIO()
     capture_console = Console(
@@ -186,8 +195,15 @@ def test_print_banner_snapshot(monkeypatch):
     assert "╔" in output
 
 
+@pytest.fixture
+def uncached_banner_art():
+    console_module._render_banner_art.cache_clear()
+    yield
+    console_module._render_banner_art.cache_clear()
+
+
+@pytest.mark.usefixtures("uncached_banner_art")
 def test_get_banner_art_uses_pyfiglet(monkeypatch):
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
 
     class _FakePyfiglet:
         @staticmethod
@@ -199,8 +215,8 @@ def test_get_banner_art_uses_pyfiglet(monkeypatch):
     assert "ZEN" in art
 
 
+@pytest.mark.usefixtures("uncached_banner_art")
 def test_get_banner_art_falls_back_when_pyfiglet_errors(monkeypatch):
-    console_module = importlib.import_module("mcp_zen_of_languages.rendering.console")
     monkeypatch.setattr(
         console_module,
         "import_module",
@@ -210,6 +226,21 @@ def test_get_banner_art_falls_back_when_pyfiglet_errors(monkeypatch):
     assert "_____" in art
 
 
+@pytest.mark.usefixtures("uncached_banner_art")
+def test_get_banner_art_renders_once(monkeypatch):
+    calls = []
+
+    class _FakePyfiglet:
+        @staticmethod
+        def figlet_format(*_args, **_kwargs):
+            calls.append(1)
+            return "ZEN\n"
+
+    monkeypatch.setattr(console_module, "import_module", lambda _name: _FakePyfiglet)
+    assert get_banner_art() == get_banner_art()
+    assert len(calls) == 1
+
+
 def test_box_style_hierarchy_is_distinct():
     assert BOX_BANNER != BOX_SUMMARY
     assert BOX_SUMMARY != BOX_CONTENT
@@ -1,30 +1,27 @@
 from __future__ import annotations
 
-from mcp_zen_of_languages.models import AnalysisResult
-from mcp_zen_of_languages.models import CyclomaticSummary
-from mcp_zen_of_languages.models import Metrics
-from mcp_zen_of_languages.models import Violation
 from mcp_zen_of_languages.rendering.report import render_report_terminal
 from mcp_zen_of_languages.reporting.models import ReportOutput
 
 
-def _build_result(path: str, violations: list[Violation]) -> AnalysisResult:
-    cyclomatic = CyclomaticSummary(blocks=[], average=0.0)
-    metrics = Metrics(cyclomatic=cyclomatic, maintainability_index=0.0, lines_of_code=1)
-    return AnalysisResult(
-        language="python",
-        path=path,
-        metrics=metrics,
-        violations=violations,
-        overall_score=90.0,
-    )
+def _result_dict(path: str, violations: list[dict]) -> dict:
+    return {
+        "language": "python",
+        "path": path,
+        "metrics": {
+            "cyclomatic": {"blocks": [], "average": 0.0},
+            "maintainability_index": 0.0,
+            "lines_of_code": 1,
+        },
+        "violations": violations,
+        "overall_score": 90.0,
+    }
 
 
 def test_render_report_terminal_with_gaps_and_prompts(capsys):
-    violations = [Violation(principle="p", severity=7, message="m")]
     analysis = [
-        _build_result("a.py", violations).model_dump(),
-        _build_result("b.py", []).model_dump(),
+        _result_dict("a.py", [{"principle": "p", "severity": 7, "message": "m"}]),
+        _result_dict("b.py", []),
     ]
     report = ReportOutput(
         markdown="md",
@@ -2,8 +2,6 @@ from __future__ import annotations
 
 import re
 
-from io import StringIO
-
 import pytest
 
 from rich.console import Console
@@ -21,7 +19,11 @@ from mcp_zen_of_languages.reporting.terminal import render_prompt_panel
 from mcp_zen_of_languages.reporting.theme_clustering import BigPictureAnalysis
 
 
-def _sample_result() -> AnalysisResult:
+ANSI_RE = re.compile(r"\x1b\[[0-9;]*m")
+
+
+@pytest.fixture(scope="module")
+def sample_result() -> AnalysisResult:
     metrics = Metrics(
         cyclomatic=CyclomaticSummary(blocks=[], average=0.0),
         maintainability_index=0.0,
@@ -36,23 +38,9 @@ def _sample_result() -> AnalysisResult:
     )
 
 
-def _assert_max_width(output: str, expected: int) -> None:
-    ansi_re = re.compile(r"\x1b\[[0-9;]*m")
-    for line in output.splitlines():
-        assert len(ansi_re.sub("", line)) <= expected
-
-
-@pytest.mark.parametrize("terminal_width", [40, 60, 80, 120, 200])
-def test_prompt_panel_respects_capped_width(terminal_width: int):
-    buffer = StringIO()
-    capture_console = Console(
-        file=buffer,
-        theme=ZEN_THEME,
-        width=terminal_width,
-        force_terminal=True,
-        no_color=True,
-    )
-    bundle = PromptBundle(
+@pytest.fixture(scope="module")
+def sample_bundle() -> PromptBundle:
+    return PromptBundle(
         file_prompts=[],
         generic_prompts=[
             GenericPrompt(title="Quick", prompt="Focus on severity first."),
@@ -65,21 +53,10 @@ def test_prompt_panel_respects_capped_width(terminal_width: int):
         ),
     )
 
-    render_prompt_panel(bundle, [_sample_result()], output_console=capture_console)
-    _assert_max_width(buffer.getvalue(), min(terminal_width, 88))
-
 
-@pytest.mark.parametrize("terminal_width", [40, 60, 88, 120, 200])
-def test_report_terminal_respects_capped_width(terminal_width: int):
-    buffer = StringIO()
-    capture_console = Console(
-        file=buffer,
-        theme=ZEN_THEME,
-        width=terminal_width,
-        force_terminal=True,
-        no_color=True,
-    )
-    report = ReportOutput(
+@pytest.fixture(scope="module")
+def sample_report(sample_result: AnalysisResult) -> ReportOutput:
+    return ReportOutput(
         markdown="md",
         data={
             "target": "repo",
@@ -89,11 +66,49 @@ def test_report_terminal_respects_capped_width(terminal_width: int):
                 "total_violations": 1,
                 "severity_counts": {"critical": 0, "high": 1, "medium": 0, "low": 0},
             },
-            "analysis": [_sample_result().model_dump()],
+            "analysis": [sample_result.model_dump()],
             "gaps": {"detector_gaps": [], "feature_gaps": []},
             "prompts": {"file_prompts": [], "generic_prompts": []},
         },
     )
 
-    render_report_terminal(report, output_console=capture_console)
-    _assert_max_width(buffer.getvalue(), min(terminal_width, 88))
+
+def _make_console(width: int) -> Console:
+    return Console(
+        theme=ZEN_THEME,
+        width=width,
+        force_terminal=True,
+        no_color=True,
+    )
+
+
+def _assert_max_width(output: str, expected: int) -> None:
+    cleaned = ANSI_RE.sub("", output)
+    assert max(map(len, cleaned.splitlines()), default=0) <= expected
+
+
+@pytest.mark.parametrize("terminal_width", [40, 60, 80, 120, 200])
+def test_prompt_panel_respects_capped_width(
+    terminal_width: int,
+    sample_result: AnalysisResult,
+    sample_bundle: PromptBundle,
+):
+    capture_console = _make_console(terminal_width)
+    with capture_console.capture() as capture:
+        render_prompt_panel(
+            sample_bundle,
+            [sample_result],
+            output_console=capture_console,
+        )
+    _assert_max_width(capture.get(), min(terminal_width, 88))
+
+
+@pytest.mark.parametrize("terminal_width", [40, 60, 88, 120, 200])
+def test_report_terminal_respects_capped_width(
+    terminal_width: int,
+    sample_report: ReportOutput,
+):
+    capture_console = _make_console(terminal_width)
+    with capture_console.capture() as capture:
+        render_report_terminal(sample_report, output_console=capture_console)
+    _assert_max_width(capture.get(), min(terminal_width, 88))
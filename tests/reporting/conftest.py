@@ -0,0 +1,50 @@
+from __future__ import annotations
+
+import pytest
+
+from mcp_zen_of_languages.models import AnalysisResult
+from mcp_zen_of_languages.models import CyclomaticSummary
+from mcp_zen_of_languages.models import Metrics
+from mcp_zen_of_languages.models import Violation
+
+
+_BASE_RESULT = AnalysisResult(
+    language="python",
+    path="sample.py",
+    metrics=Metrics(
+        cyclomatic=CyclomaticSummary(blocks=[], average=0.0),
+        maintainability_index=0.0,
+        lines_of_code=1,
+    ),
+    violations=[],
+    overall_score=90.0,
+)
+
+
+def _make_result(path: str, language: str, severity: int) -> AnalysisResult:
+    violation = Violation(
+        principle="Test",
+        severity=severity,
+        message="Example violation",
+    )
+    return _BASE_RESULT.model_copy(
+        update={"path": path, "language": language, "violations": [violation]},
+    )
+
+
+@pytest.fixture(scope="session")
+def make_result():
+    """Return a factory for single-violation results copied from one prototype.
+
+    Each call yields a fresh ``AnalysisResult``; the shared ``Metrics``
+    instance must be treated as read-only.
+    """
+    return _make_result
+
+
+@pytest.fixture(scope="session")
+def sample_py_file(tmp_path_factory):
+    """Write a minimal Python module once for tests that only read it."""
+    sample = tmp_path_factory.mktemp("reporting") / "sample.py"
+    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
+    return sample
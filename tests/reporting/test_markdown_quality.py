@@ -12,6 +12,9 @@ from mcp_zen_of_languages.reporting.report import generate_report
 from mcp_zen_of_languages.utils.markdown_quality import validate_markdown
 
 
+CODE_FENCE_RE = re.compile(r"^```(\S*)\s*$", re.MULTILINE)
+
+
 def _sample_result() -> AnalysisResult:
     metrics = Metrics(
         cyclomatic=CyclomaticSummary(blocks=[], average=0.0),
@@ -60,5 +63,5 @@ def test_prompt_export_matches_analysis():
     markdown = cli._format_prompt_markdown(bundle)
     for violation in result.violations:
         assert violation.message in markdown
-    for match in re.finditer(r"^```(\S*)\s*$", markdown, flags=re.MULTILINE):
+    for match in CODE_FENCE_RE.finditer(markdown):
         assert match.group(1)
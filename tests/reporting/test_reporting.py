@@ -41,26 +41,6 @@ class DummyDetector(ViolationDetector[DummyConfig]):
         return []
 
 
-def _build_result(path: str, language: str, severity: int) -> AnalysisResult:
-    violation = Violation(
-        principle="Test",
-        severity=severity,
-        message="Example violation",
-    )
-    metrics = Metrics(
-        cyclomatic=CyclomaticSummary(blocks=[], average=0.0),
-        maintainability_index=0.0,
-        lines_of_code=1,
-    )
-    return AnalysisResult(
-        language=language,
-        path=path,
-        metrics=metrics,
-        violations=[violation],
-        overall_score=90.0,
-    )
-
-
 def _projection_registry() -> DetectorRegistry:
     registry = DetectorRegistry()
     metadata = DetectorMetadata(
@@ -122,10 +102,10 @@ def _build_projection_result(path: str) -> AnalysisResult:
     )
 
 
-def test_build_prompt_bundle_includes_file_and_generic():
+def test_build_prompt_bundle_includes_file_and_generic(make_result):
     results = [
-        _build_result("sample.py", "python", 7),
-        _build_result("sample.ts", "typescript", 5),
+        make_result("sample.py", "python", 7),
+        make_result("sample.ts", "typescript", 5),
     ]
     prompts = build_prompt_bundle(results)
     assert prompts.file_prompts
@@ -133,8 +113,8 @@ def test_build_prompt_bundle_includes_file_and_generic():
     assert any(p.language == "python" for p in prompts.file_prompts)
 
 
-def test_build_prompt_bundle_includes_bash_generic():
-    results = [_build_result("sample.sh", "bash", 4)]
+def test_build_prompt_bundle_includes_bash_generic(make_result):
+    results = [make_result("sample.sh", "bash", 4)]
     prompts = build_prompt_bundle(results)
     assert any(p.title == "Harden shell safety" for p in prompts.generic_prompts)
 
@@ -155,19 +135,15 @@ def test_gap_analysis_no_missing_detectors():
     assert gaps.detector_gaps == []
 
 
-def test_generate_report_includes_sections(tmp_path):
-    sample = tmp_path / "sample.py"
-    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
-    report = generate_report(str(sample), include_prompts=True)
+def test_generate_report_includes_sections(sample_py_file):
+    report = generate_report(str(sample_py_file), include_prompts=True)
     assert report.markdown.startswith("# Zen of Languages Report")
     assert "Gap Analysis" in report.markdown
     assert report.data["prompts"]
 
 
-def test_generate_report_zen_perspective_omits_dogma_sections(tmp_path):
-    sample = tmp_path / "sample.py"
-    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
-    report = generate_report(str(sample), perspective=PerspectiveMode.ZEN)
+def test_generate_report_zen_perspective_omits_dogma_sections(sample_py_file):
+    report = generate_report(str(sample_py_file), perspective=PerspectiveMode.ZEN)
     assert "Universal Dogmas" not in report.markdown
     assert report.data["dogmas"] == []
     assert report.data["dogma_domains"] == []
@@ -248,23 +224,23 @@ def test_generate_report_testing_perspective_recomputes_filtered_summary(
 
 
 def test_generate_report_projection_perspective_filters_to_requested_family(
-    tmp_path,
+    sample_py_file,
     monkeypatch: pytest.MonkeyPatch,
 ):
     from mcp_zen_of_languages.analyzers import registry as registry_module
     from mcp_zen_of_languages.reporting import report as report_module
 
-    sample = tmp_path / "sample.py"
-    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
     monkeypatch.setattr(registry_module, "REGISTRY", _projection_registry())
     monkeypatch.setattr(
         report_module,
         "_analyze_targets",
-        lambda targets, config_path=None: [_build_projection_result(str(sample))],
+        lambda targets, config_path=None: [
+            _build_projection_result(str(sample_py_file))
+        ],
     )
 
     report = generate_report(
-        str(sample),
+        str(sample_py_file),
         perspective=PerspectiveMode.PROJECTION,
         project_as="go",
     )
@@ -280,23 +256,23 @@ def test_generate_report_projection_perspective_filters_to_requested_family(
 
 
 def test_generate_report_projection_perspective_recomputes_filtered_summary(
-    tmp_path,
+    sample_py_file,
     monkeypatch: pytest.MonkeyPatch,
 ):
     from mcp_zen_of_languages.analyzers import registry as registry_module
     from mcp_zen_of_languages.reporting import report as report_module
 
-    sample = tmp_path / "sample.py"
-    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
     monkeypatch.setattr(registry_module, "REGISTRY", _projection_registry())
     monkeypatch.setattr(
         report_module,
         "_analyze_targets",
-        lambda targets, config_path=None: [_build_projection_result(str(sample))],
+        lambda targets, config_path=None: [
+            _build_projection_result(str(sample_py_file))
+        ],
     )
 
     report = generate_report(
-        str(sample),
+        str(sample_py_file),
         perspective=PerspectiveMode.PROJECTION,
         project_as="go",
     )
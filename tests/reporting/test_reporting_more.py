@@ -25,8 +25,8 @@ def test_format_gap_markdown_includes_feature_gaps():
     assert any("Feature" in line for line in lines)
 
 
-def test_generate_report_with_gaps_only(tmp_path):
-    sample = tmp_path / "sample.py"
-    sample.write_text("def foo():\n    pass\n", encoding="utf-8")
-    report = generate_report(str(sample), include_analysis=False, include_gaps=True)
+def test_generate_report_with_gaps_only(sample_py_file):
+    report = generate_report(
+        str(sample_py_file), include_analysis=False, include_gaps=True
+    )
     assert "Gap Analysis" in report.markdown
@@ -12,7 +12,7 @@ from mcp_zen_of_languages.reporting.report import _format_prompts_markdown
 def test_format_gap_markdown_no_gaps():
     gaps = GapAnalysis(detector_gaps=[], feature_gaps=[])
     lines = _format_gap_markdown(gaps)
-    assert "No gaps reported." in " ".join(lines)
+    assert any("No gaps reported." in line for line in lines)
 
 
 def test_format_prompts_markdown_empty_prompts():
@@ -10,6 +10,12 @@ def test_detect_deep_nesting_basic():
     assert depth >= 1
 
 
+def test_detect_deep_nesting_uses_four_space_stops():
+    code = "a\n\tb\n          c\n"
+    assert detections.detect_deep_nesting(code, max_depth=2) == (False, 2)
+    assert detections.detect_deep_nesting("", max_depth=0) == (False, 0)
+
+
 def test_detect_magic_methods_overuse():
     code = "def __str__(self):\n    pass\n"
     methods = detections.detect_magic_methods_overuse(code)
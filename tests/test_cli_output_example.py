@@ -8,6 +8,8 @@ import sys
 
 from pathlib import Path
 
+import pytest
+
 
 def _load_cli_output_example_module():
     script_path = (
@@ -29,6 +31,8 @@ def _load_cli_output_example_module():
 
 cli_output_example = _load_cli_output_example_module()
 
+pytestmark = pytest.mark.slow
+
 
 def test_cli_output_example_generation_includes_perspective_surface() -> None:
     """The generated include should showcase the testing perspective workflow."""
@@ -17,6 +17,13 @@ def test_parse_python_failure():
     assert tree is None
 
 
+def test_parse_python_with_builtin_ast_memoises_by_source():
+    code = "def cached_parse_probe():\n    return 1\n"
+    first = parsers.parse_python_with_builtin_ast(code)
+    assert first is not None
+    assert parsers.parse_python_with_builtin_ast(code) is first
+
+
 def test_parse_python_prefers_treesitter(monkeypatch):
     monkeypatch.setattr(parsers, "parse_python_with_treesitter", lambda _: object())
     tree = parse_python("def foo():\n    pass\n")